@@ -708,6 +708,23 @@ memory_level : :obj:`int`, default={}
 docdict["memory_level"] = memory_level.format(0)
 docdict["memory_level1"] = memory_level.format(1)
 
+# n_group_components
+docdict["n_group_components"] = """
+n_group_components : :obj:`int` or None, default=None
+    If None, the reduced data of all the subjects are concatenated in memory
+    before the group decomposition.
+    Otherwise, the subjects are reduced by batches of ``n_jobs`` and folded
+    into an incremental singular value decomposition that only keeps
+    ``n_group_components`` group components, so that the memory used does
+    not grow with the number of subjects.
+    The normalization of the Canonical Correlation Analysis, used by CanICA
+    with ``do_cca=True`` and by the CanICA initialization of DictLearning,
+    is then applied to each subject before it is folded.
+    Must be greater than or equal to ``n_components``.
+
+    .. versionadded:: 0.12.1
+"""
+
 # n_jobs
 n_jobs = """
 n_jobs : :obj:`int`, default={}
@@ -7,6 +7,8 @@ from nilearn.connectome.connectivity_matrices import (
     ConnectivityMeasure,
     cov_to_corr,
     prec_to_partial,
+    sliding_window_connectivity,
+    sparse_correlation_matrix,
     sym_matrix_to_vec,
     vec_to_sym_matrix,
 )
@@ -15,6 +17,7 @@ from nilearn.connectome.group_sparse_cov import (
     GroupSparseCovarianceCV,
     group_sparse_covariance,
 )
+from nilearn.connectome.seed_correlation import seed_correlation_maps
 
 __all__ = [
     "ConnectivityMeasure",
@@ -23,6 +26,9 @@ __all__ = [
     "cov_to_corr",
     "group_sparse_covariance",
     "prec_to_partial",
+    "seed_correlation_maps",
+    "sliding_window_connectivity",
+    "sparse_correlation_matrix",
     "sym_matrix_to_vec",
     "vec_to_sym_matrix",
 ]
@@ -1,12 +1,14 @@
 """Connectivity matrices."""
 
+import functools
 import warnings
 from math import floor, sqrt
 
 import numpy as np
-from scipy import linalg
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin, clone
-from sklearn.covariance import LedoitWolf
+from sklearn.covariance import EmpiricalCovariance, LedoitWolf
 from sklearn.utils import check_array
 from sklearn.utils.estimator_checks import check_is_fitted
 
@@ -50,43 +52,57 @@ def _form_symmetric(function, eigenvalues, eigenvectors):
     """Return the symmetric matrix with the given eigenvectors and \
     eigenvalues transformed by function.
 
+    Acts on the last dimensions of the arrays if the eigenvectors are not
+    2-dimensional.
+
     Parameters
     ----------
     function : function numpy.ndarray -> numpy.ndarray
         The transform to apply to the eigenvalues.
 
-    eigenvalues : numpy.ndarray, shape (n_features, )
+    eigenvalues : numpy.ndarray, shape (..., n_features)
         Input argument of the function.
 
-    eigenvectors : numpy.ndarray, shape (n_features, n_features)
+    eigenvectors : numpy.ndarray, shape (..., n_features, n_features)
         Unitary matrix.
 
     Returns
     -------
-    output : numpy.ndarray, shape (n_features, n_features)
+    output : numpy.ndarray, shape (..., n_features, n_features)
         The symmetric matrix obtained after transforming the eigenvalues, while
         keeping the same eigenvectors.
 
     """
-    return np.dot(eigenvectors * function(eigenvalues), eigenvectors.T)
+    return np.matmul(
+        eigenvectors * function(eigenvalues)[..., np.newaxis, :],
+        np.swapaxes(eigenvectors, -1, -2),
+    )
 
 
-def _map_eigenvalues(function, symmetric):
+def _map_eigenvalues(function, symmetric, n_jobs=1):
     """Matrix function, for real symmetric matrices.
 
     The function is applied to the eigenvalues of symmetric.
 
+    Acts on the last two dimensions of the array if not 2-dimensional: a
+    stack of matrices is decomposed with a single batched call to
+    :func:`numpy.linalg.eigh`.
+
     Parameters
     ----------
     function : function numpy.ndarray -> numpy.ndarray
         The transform to apply to the eigenvalues.
 
-    symmetric : numpy.ndarray, shape (n_features, n_features)
-        The input symmetric matrix.
+    symmetric : numpy.ndarray, shape (..., n_features, n_features)
+        The input symmetric matrix or stack of matrices.
+
+    n_jobs : :obj:`int`, default=1
+        Number of threads among which a stack of matrices is split.
+        Only used if symmetric is 3-dimensional.
 
     Returns
     -------
-    output : numpy.ndarray, shape (n_features, n_features)
+    output : numpy.ndarray, shape (..., n_features, n_features)
         The new symmetric matrix obtained after transforming the eigenvalues,
         while keeping the same eigenvectors.
 
@@ -95,12 +111,28 @@ def _map_eigenvalues(function, symmetric):
     If input matrix is not real symmetric, no error is reported but result will
     be wrong.
 
+    The precision of the input array is preserved, so that a float32 stack
+    is decomposed in single precision.
+
     """
-    eigenvalues, eigenvectors = linalg.eigh(symmetric)
+    n_jobs = effective_n_jobs(n_jobs)
+    if symmetric.ndim == 3 and n_jobs > 1 and symmetric.shape[0] > 1:
+        # LAPACK releases the GIL: threads avoid copying the matrices
+        batches = np.array_split(
+            symmetric, min(n_jobs, symmetric.shape[0]), axis=0
+        )
+        return np.concatenate(
+            Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(_map_eigenvalues)(function, batch) for batch in batches
+            )
+        )
+    eigenvalues, eigenvectors = np.linalg.eigh(symmetric)
     return _form_symmetric(function, eigenvalues, eigenvectors)
 
 
-def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
+def _geometric_mean(
+    matrices, init=None, max_iter=10, tol=1e-7, n_jobs=1, dtype=None
+):
     """Compute the geometric mean of symmetric positive definite matrices.
 
     The geometric mean of n positive definite matrices
@@ -140,6 +172,14 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
         this value, the gradient descent is stopped. If None, no  check is
         performed.
 
+    n_jobs : :obj:`int`, default=1
+        Number of threads used for the eigendecompositions of the whitened
+        matrices.
+
+    dtype : dtype like or None, default=None
+        Data type in which the gradient descent is run. If None, the data
+        type of matrices is used.
+
     Returns
     -------
     gmean : numpy.ndarray, shape (n_features, n_features)
@@ -155,7 +195,7 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
         _check_spd(matrix)
 
     # Initialization
-    matrices = np.array(matrices)
+    matrices = np.asarray(matrices, dtype=dtype)
     if init is None:
         gmean = np.mean(matrices, axis=0)
     else:
@@ -163,7 +203,7 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
         if init.shape[0] != n_features:
             raise ValueError("Initialization has incorrect shape.")
         _check_spd(init)
-        gmean = init
+        gmean = np.asarray(init, dtype=matrices.dtype)
 
     norm_old = np.inf
     step = 1.0
@@ -171,13 +211,11 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
     # Gradient descent
     for _ in range(max_iter):
         # Computation of the gradient
-        vals_gmean, vecs_gmean = linalg.eigh(gmean)
+        vals_gmean, vecs_gmean = np.linalg.eigh(gmean)
         gmean_inv_sqrt = _form_symmetric(np.sqrt, 1.0 / vals_gmean, vecs_gmean)
-        whitened_matrices = [
-            gmean_inv_sqrt.dot(matrix).dot(gmean_inv_sqrt)
-            for matrix in matrices
-        ]
-        logs = [_map_eigenvalues(np.log, w_mat) for w_mat in whitened_matrices]
+        # All the matrices are whitened and decomposed as a single stack
+        whitened_matrices = gmean_inv_sqrt @ matrices @ gmean_inv_sqrt
+        logs = _map_eigenvalues(np.log, whitened_matrices, n_jobs=n_jobs)
         # Covariant derivative is - gmean.dot(logms_mean)
         logs_mean = np.mean(logs, axis=0)
         if np.any(np.isnan(logs_mean)):
@@ -187,7 +225,7 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
         norm = np.linalg.norm(logs_mean)
 
         # Update of the minimizer
-        vals_log, vecs_log = linalg.eigh(logs_mean)
+        vals_log, vecs_log = np.linalg.eigh(logs_mean)
         gmean_sqrt = _form_symmetric(np.sqrt, vals_gmean, vecs_gmean)
         # Move along the geodesic
         gmean = gmean_sqrt.dot(
@@ -212,6 +250,89 @@ def _geometric_mean(matrices, init=None, max_iter=10, tol=1e-7):
     return gmean
 
 
+# Index plans of larger matrices are not cached, as they would hold
+# up to 8 * n_features ** 2 bytes each
+_MAX_CACHED_PLAN_SIZE = 2**20
+
+
+def _get_plan(plan_func, n_features, discard_diagonal):
+    """Return the plan of plan_func, cached if it is small enough."""
+    if n_features**2 > _MAX_CACHED_PLAN_SIZE:
+        return plan_func.__wrapped__(n_features, discard_diagonal)
+    return plan_func(n_features, discard_diagonal)
+
+
+@functools.lru_cache(maxsize=8)
+def _lower_triangle_plan(n_features, discard_diagonal):
+    """Return the indices used to flatten symmetric matrices.
+
+    The plan only depends on the shape of the matrices and is cached, so that
+    the triangular masks are not recomputed on each call.
+
+    Parameters
+    ----------
+    n_features : :obj:`int`
+        Number of rows and columns of the matrices.
+
+    discard_diagonal : :obj:`bool`
+        If True, the diagonal is not part of the lower triangle.
+
+    Returns
+    -------
+    lower : numpy.ndarray of int
+        Indices of the lower triangle in the flattened matrices, in the order
+        of the vectorized coefficients.
+
+    diagonal : numpy.ndarray of int
+        Positions of the diagonal coefficients in the vectors.
+
+    """
+    rows, cols = np.tril_indices(n_features, k=-1 if discard_diagonal else 0)
+    plan = (rows * n_features + cols, np.flatnonzero(rows == cols))
+    # the plan is shared between calls
+    for indices in plan:
+        indices.flags.writeable = False
+    return plan
+
+
+@functools.lru_cache(maxsize=8)
+def _symmetric_gather_plan(n_features, discard_diagonal):
+    """Return the position in the vectors of each coefficient of the \
+    flattened matrices.
+
+    If discard_diagonal is True, the diagonal coefficients point to the
+    first position and must be overwritten. The plan is cached in the same
+    way as the lower triangle plan.
+    """
+    rows, cols = np.tril_indices(n_features, k=-1 if discard_diagonal else 0)
+    positions = np.arange(rows.size)
+    gather = np.zeros(n_features**2, dtype=np.intp)
+    gather[rows * n_features + cols] = positions
+    gather[cols * n_features + rows] = positions
+    # the plan is shared between calls
+    gather.flags.writeable = False
+    return gather
+
+
+def _take_rows(source, indices, out):
+    """Gather columns of a 2D array into out, by blocks of rows.
+
+    Working on blocks keeps both arrays in cache, which is much faster than
+    fancy indexing of the whole stack. Each block is converted to the dtype
+    of out, as np.take cannot cast the values it gathers.
+    """
+    block_size = max(1, 2**16 // max(1, out.shape[1]))
+    for start in range(0, source.shape[0], block_size):
+        stop = start + block_size
+        np.take(
+            source[start:stop].astype(out.dtype, copy=False),
+            indices,
+            axis=1,
+            out=out[start:stop],
+        )
+    return out
+
+
 def sym_matrix_to_vec(symmetric, discard_diagonal=False):
     """Return the flattened lower triangular part of an array.
 
@@ -239,14 +360,19 @@ def sym_matrix_to_vec(symmetric, discard_diagonal=False):
         and (..., (n_features - 1) * n_features / 2) otherwise.
 
     """
-    if discard_diagonal:
-        # No scaling, we directly return the values
-        tril_mask = np.tril(np.ones(symmetric.shape[-2:]), k=-1).astype(bool)
-        return symmetric[..., tril_mask]
-    scaling = np.ones(symmetric.shape[-2:])
-    np.fill_diagonal(scaling, sqrt(2.0))
-    tril_mask = np.tril(np.ones(symmetric.shape[-2:])).astype(bool)
-    return symmetric[..., tril_mask] / scaling[tril_mask]
+    first_shape, n_features = symmetric.shape[:-2], symmetric.shape[-1]
+    lower, diagonal = _get_plan(
+        _lower_triangle_plan, n_features, discard_diagonal
+    )
+    dtype = symmetric.dtype
+    if not discard_diagonal and not np.issubdtype(dtype, np.inexact):
+        dtype = np.float64
+    n_matrices = int(np.prod(first_shape))
+    vec = np.empty((n_matrices, lower.size), dtype=dtype)
+    _take_rows(symmetric.reshape(n_matrices, n_features**2), lower, vec)
+    if not discard_diagonal:
+        vec[:, diagonal] /= sqrt(2.0)
+    return vec.reshape(*first_shape, lower.size)
 
 
 def vec_to_sym_matrix(vec, diagonal=None):
@@ -309,70 +435,384 @@ def vec_to_sym_matrix(vec, diagonal=None):
             f"with vector of shape {vec.shape}"
         )
 
-    sym = np.zeros((*first_shape, n_columns, n_columns))
-
-    # Fill lower triangular part
-    skip_diagonal = diagonal is not None
-    mask = np.tril(np.ones((n_columns, n_columns)), k=-skip_diagonal).astype(
-        bool
-    )
-    sym[..., mask] = vec
-
-    # Fill upper triangular part
-    sym.swapaxes(-1, -2)[..., mask] = vec
+    gather = _get_plan(_symmetric_gather_plan, n_columns, diagonal is not None)
+    dtype = np.result_type(vec, np.float32)
+    if diagonal is not None:
+        dtype = np.result_type(dtype, diagonal)
+    n_matrices = int(np.prod(first_shape))
+    sym = np.empty((n_matrices, n_columns**2), dtype=dtype)
+
+    # Fill lower and upper triangular parts
+    if n > 0:
+        _take_rows(
+            vec.reshape(n_matrices, n).astype(dtype, copy=False), gather, sym
+        )
 
     # (Fill and) rescale diagonal terms
-    mask.fill(False)
-    np.fill_diagonal(mask, True)
+    sym_diagonal = sym[:, :: n_columns + 1]
     if diagonal is not None:
-        sym[..., mask] = diagonal
+        sym_diagonal[...] = diagonal.reshape(n_matrices, n_columns)
 
-    sym[..., mask] *= sqrt(2)
+    sym_diagonal *= sqrt(2)
 
-    return sym
+    return sym.reshape(*first_shape, n_columns, n_columns)
+
+
+def _fill_diagonal(matrices, value):
+    """Fill in-place the diagonal of the last two dimensions of matrices."""
+    diagonal = np.arange(matrices.shape[-1])
+    matrices[..., diagonal, diagonal] = value
 
 
 def cov_to_corr(covariance):
     """Return correlation matrix for a given covariance matrix.
 
+    Acts on the last two dimensions of the array if not 2-dimensional.
+
     Parameters
     ----------
-    covariance : 2D numpy.ndarray
+    covariance : numpy.ndarray, shape (..., n_features, n_features)
         The input covariance matrix.
 
     Returns
     -------
-    correlation : 2D numpy.ndarray
+    correlation : numpy.ndarray, shape (..., n_features, n_features)
         The output correlation matrix.
 
     """
-    diagonal = np.atleast_2d(1.0 / np.sqrt(np.diag(covariance)))
-    correlation = covariance * diagonal * diagonal.T
+    diagonal = 1.0 / np.sqrt(np.diagonal(covariance, axis1=-2, axis2=-1))
+    correlation = (
+        covariance
+        * diagonal[..., np.newaxis, :]
+        * diagonal[..., :, np.newaxis]
+    )
 
     # Force exact 1. on diagonal
-    np.fill_diagonal(correlation, 1.0)
+    _fill_diagonal(correlation, 1.0)
     return correlation
 
 
 def prec_to_partial(precision):
     """Return partial correlation matrix for a given precision matrix.
 
+    Acts on the last two dimensions of the array if not 2-dimensional.
+
     Parameters
     ----------
-    precision : 2D numpy.ndarray
+    precision : numpy.ndarray, shape (..., n_features, n_features)
         The input precision matrix.
 
     Returns
     -------
-    partial_correlation : 2D numpy.ndarray
-        The 2D output partial correlation matrix.
+    partial_correlation : numpy.ndarray, shape (..., n_features, n_features)
+        The output partial correlation matrix.
 
     """
     partial_correlation = -cov_to_corr(precision)
-    np.fill_diagonal(partial_correlation, 1.0)
+    _fill_diagonal(partial_correlation, 1.0)
     return partial_correlation
 
 
+# Maximal number of subjects whose time series are stacked together to
+# compute their covariances at once
+_COVARIANCE_BATCH_SIZE = 50
+
+
+def _batched_covariances(X, shrink=False):
+    """Compute the empirical or Ledoit-Wolf covariance of each subject.
+
+    This gives the same matrices as fitting
+    :class:`sklearn.covariance.EmpiricalCovariance` or
+    :class:`sklearn.covariance.LedoitWolf` on each subject, but the
+    subjects with the same number of samples are stacked and processed with
+    batched matrix products.
+
+    Parameters
+    ----------
+    X : :obj:`list` of numpy.ndarray, shape (n_samples, n_features)
+        Time series of each subject.
+
+    shrink : :obj:`bool`, default=False
+        If True, the Ledoit-Wolf shrinkage of each covariance is computed
+        and applied.
+
+    Returns
+    -------
+    covariances : numpy.ndarray, shape (n_subjects, n_features, n_features)
+        The covariance matrix of each subject.
+
+    """
+    n_features = X[0].shape[1]
+    covariances = np.empty((len(X), n_features, n_features))
+    lengths = np.array([x.shape[0] for x in X])
+    for n_samples in np.unique(lengths):
+        same_length = np.flatnonzero(lengths == n_samples)
+        for start in range(0, len(same_length), _COVARIANCE_BATCH_SIZE):
+            subjects = same_length[start : start + _COVARIANCE_BATCH_SIZE]
+            batch = np.stack([X[k] for k in subjects]).astype(np.float64)
+            batch -= batch.mean(axis=1, keepdims=True)
+            emp_covs = np.matmul(batch.transpose(0, 2, 1), batch)
+            emp_covs /= n_samples
+            if shrink and n_features > 1:
+                # Same formula as sklearn.covariance.ledoit_wolf_shrinkage,
+                # where the sum of the coefficients of X2.T @ X2 is the sum
+                # of the squared norms of the samples
+                trace = np.trace(emp_covs, axis1=1, axis2=2)
+                mu = trace / n_features
+                beta_ = np.sum(np.einsum("kti,kti->kt", batch, batch) ** 2, 1)
+                delta_ = np.sum(emp_covs**2, axis=(1, 2))
+                beta = (beta_ / n_samples - delta_) / (n_features * n_samples)
+                delta = delta_ - 2.0 * mu * trace + n_features * mu**2
+                delta /= n_features
+                beta = np.minimum(beta, delta)
+                shrinkage = np.divide(
+                    beta, delta, out=np.zeros_like(beta), where=beta != 0
+                )
+                emp_covs *= (1.0 - shrinkage)[:, np.newaxis, np.newaxis]
+                diagonal = np.arange(n_features)
+                emp_covs[:, diagonal, diagonal] += (shrinkage * mu)[
+                    :, np.newaxis
+                ]
+            covariances[subjects] = emp_covs
+    return covariances
+
+
+def sliding_window_connectivity(
+    signals,
+    window_length,
+    step=1,
+    kind="correlation",
+    vectorize=False,
+    discard_diagonal=False,
+):
+    """Compute dynamic connectivity matrices over sliding windows.
+
+    The covariance of each window is obtained from the one of the previous
+    window by adding the outer products of the samples entering the window
+    and subtracting those of the samples leaving it. Each window hence costs
+    O(step * n_features ** 2) operations instead of
+    O(window_length * n_features ** 2) for a covariance recomputed from
+    scratch.
+
+    .. versionadded:: 0.12.1
+
+    Parameters
+    ----------
+    signals : numpy.ndarray, shape (n_samples, n_features)
+        The time series of a single subject.
+
+    window_length : :obj:`int`
+        Number of samples in each window. Must be at least 2 and at most
+        n_samples.
+
+    step : :obj:`int`, default=1
+        Number of samples between the starts of two consecutive windows.
+
+    kind : {"covariance", "correlation"}, default="correlation"
+        The matrix kind. Covariances are normalized by the window length.
+
+    vectorize : :obj:`bool`, default=False
+        If True, connectivity matrices are reshaped into 1D arrays and only
+        their flattened lower triangular parts are returned.
+        See :func:`nilearn.connectome.sym_matrix_to_vec`.
+
+    discard_diagonal : :obj:`bool`, default=False
+        If True, vectorized connectivity coefficients do not include the
+        matrices diagonal elements. Used only when vectorize is set to True.
+
+    Returns
+    -------
+    connectivities : numpy.ndarray, shape (n_windows, n_features, \
+        n_features) or (n_windows, n_features * (n_features + 1) / 2) if \
+        vectorize is set to True.
+        The connectivity matrix of each window, with
+        n_windows = (n_samples - window_length) // step + 1.
+
+    See Also
+    --------
+    nilearn.connectome.ConnectivityMeasure
+
+    """
+    signals = check_array(signals, ensure_min_samples=2)
+    n_samples, n_features = signals.shape
+    if not isinstance(window_length, (int, np.integer)) or not (
+        2 <= window_length <= n_samples
+    ):
+        raise ValueError(
+            "'window_length' must be an integer between 2 and the number "
+            f"of samples ({n_samples}). Got {window_length!r}."
+        )
+    if not isinstance(step, (int, np.integer)) or step < 1:
+        raise ValueError(f"'step' must be a positive integer. Got {step!r}.")
+    allowed_kinds = ("covariance", "correlation")
+    if kind not in allowed_kinds:
+        raise ValueError(
+            f"Allowed connectivity kinds are {allowed_kinds}. Got kind {kind}."
+        )
+
+    # Centering the whole series limits the cancellation errors
+    # of the running sums
+    signals = signals - signals.mean(axis=0)
+    n_windows = (n_samples - window_length) // step + 1
+    if vectorize:
+        n_coefs = n_features * (n_features + 1) // 2
+        if discard_diagonal:
+            n_coefs -= n_features
+        connectivities = np.empty((n_windows, n_coefs))
+    else:
+        connectivities = np.empty((n_windows, n_features, n_features))
+
+    for k in range(n_windows):
+        start = k * step
+        if k == 0 or step >= window_length:
+            # no overlap with the previous window
+            window = signals[start : start + window_length]
+            sum_ = window.sum(axis=0)
+            sum_squares = window.T @ window
+        else:
+            leaving = signals[start - step : start]
+            entering = signals[
+                start + window_length - step : start + window_length
+            ]
+            sum_ += entering.sum(axis=0) - leaving.sum(axis=0)
+            sum_squares += entering.T @ entering - leaving.T @ leaving
+
+        mean = sum_ / window_length
+        covariance = sum_squares / window_length - np.outer(mean, mean)
+        # Fight numerical instabilities: make symmetric
+        covariance += covariance.T
+        covariance *= 0.5
+        if kind == "correlation":
+            covariance = cov_to_corr(covariance)
+        if vectorize:
+            connectivities[k] = sym_matrix_to_vec(
+                covariance, discard_diagonal=discard_diagonal
+            )
+        else:
+            connectivities[k] = covariance
+
+    return connectivities
+
+
+def _unit_norm_columns(signals):
+    """Return the signals centered and scaled to unit norm along time.
+
+    The correlation between two columns is then their dot product.
+    Constant columns are only centered, so that their correlations are 0.
+    """
+    signals = signals - signals.mean(axis=0)
+    norms = np.linalg.norm(signals, axis=0)
+    norms[norms == 0] = 1.0
+    signals /= norms
+    return signals
+
+
+def _sparse_correlation_block(signals, start, stop, top_k, threshold):
+    """Return the kept edges of the rows start to stop of the correlation \
+    matrix.
+    """
+    block = signals[:, start:stop].T @ signals
+    rows = np.arange(stop - start)
+    # no self-connections
+    block[rows, rows + start] = -np.inf
+    if threshold is not None:
+        block[block < threshold] = -np.inf
+    if top_k is not None and top_k < block.shape[1]:
+        cols = np.argpartition(block, -top_k, axis=1)[:, -top_k:]
+        rows = np.repeat(rows, top_k)
+        cols = cols.ravel()
+        values = block[rows, cols]
+    else:
+        rows, cols = np.nonzero(np.isfinite(block))
+        values = block[rows, cols]
+    kept = np.isfinite(values)
+    return rows[kept] + start, cols[kept], values[kept]
+
+
+@fill_doc
+def sparse_correlation_matrix(
+    signals, top_k=None, threshold=None, block_size=1000, n_jobs=1
+):
+    """Compute a sparse correlation matrix between many features.
+
+    The correlation matrix is computed by blocks of rows, of which only the
+    strongest edges of each row (node) are kept. The dense matrix of shape
+    (n_features, n_features) is never stored, so that vertex or voxel level
+    connectomes fit in memory.
+
+    .. versionadded:: 0.12.1
+
+    Parameters
+    ----------
+    signals : numpy.ndarray, shape (n_samples, n_features)
+        The time series of a single subject, for instance as returned by
+        :meth:`nilearn.maskers.SurfaceMasker.transform`.
+        Float32 input is kept in single precision.
+
+    top_k : :obj:`int` or None, default=None
+        If not None, only the top_k largest correlations of each row are
+        kept.
+
+    threshold : :obj:`float` or None, default=None
+        If not None, only the correlations greater or equal to threshold
+        are kept.
+        At least one of top_k and threshold must be given.
+        If both are given, the top_k largest correlations above the
+        threshold are kept.
+
+    block_size : :obj:`int`, default=1000
+        Number of rows of the correlation matrix computed at once.
+        The memory footprint is about ``block_size * n_features`` floats
+        per job.
+
+    %(n_jobs)s
+        Blocks are computed in threads.
+
+    Returns
+    -------
+    connectome : :class:`scipy.sparse.csr_matrix`, \
+        shape (n_features, n_features)
+        The kept correlations. The diagonal is always discarded. As edges
+        are selected row by row, the matrix is not symmetric in general: use
+        ``connectome.maximum(connectome.T)`` to symmetrize it.
+
+    See Also
+    --------
+    nilearn.connectome.ConnectivityMeasure
+
+    """
+    if top_k is None and threshold is None:
+        raise ValueError("At least one of 'top_k' or 'threshold' must be set.")
+    if top_k is not None and (
+        not isinstance(top_k, (int, np.integer)) or top_k < 1
+    ):
+        raise ValueError(f"'top_k' must be a positive integer. Got {top_k!r}.")
+    if not isinstance(block_size, (int, np.integer)) or block_size < 1:
+        raise ValueError(
+            f"'block_size' must be a positive integer. Got {block_size!r}."
+        )
+    signals = check_array(
+        signals, dtype=[np.float64, np.float32], ensure_min_samples=2
+    )
+    n_features = signals.shape[1]
+    signals = _unit_norm_columns(signals)
+
+    edges = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_sparse_correlation_block)(
+            signals,
+            start,
+            min(start + block_size, n_features),
+            top_k,
+            threshold,
+        )
+        for start in range(0, n_features, block_size)
+    )
+    rows, cols, values = (np.concatenate(parts) for parts in zip(*edges))
+    return sparse.csr_matrix(
+        (values, (rows, cols)), shape=(n_features, n_features)
+    )
+
+
 @fill_doc
 class ConnectivityMeasure(TransformerMixin, BaseEstimator):
     """A class that computes different kinds of \
@@ -410,6 +850,18 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
             deprecated. This parameter will be deprecated in version 0.13 and
             removed in version 0.15.
 
+    %(n_jobs)s
+        Only used for kind="tangent": the eigendecompositions of the
+        subjects' matrices are split across that many threads.
+
+    dtype : dtype like or None, default=None
+        Data type of the returned connectivity matrices.
+        For kind="tangent", the geometric mean, the whitening and the matrix
+        logarithms are also computed in that precision: passing
+        ``np.float32`` roughly halves the memory footprint and speeds up
+        the computations on large cohorts, at the cost of accuracy.
+        If None, double precision is used.
+
     Attributes
     ----------
     cov_estimator_ : estimator object, default=None
@@ -427,6 +879,10 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
     whitening_ : numpy.ndarray
         The inverted square-rooted geometric mean of the covariance matrices.
 
+    n_subjects_seen_ : :obj:`int`
+        The number of subjects the mean was estimated on.
+        Incremented by each call to :meth:`partial_fit`.
+
     References
     ----------
     .. footbibliography::
@@ -440,12 +896,16 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
         vectorize=False,
         discard_diagonal=False,
         standardize=True,
+        n_jobs=1,
+        dtype=None,
     ):
         self.cov_estimator = cov_estimator
         self.kind = kind
         self.vectorize = vectorize
         self.discard_diagonal = discard_diagonal
         self.standardize = standardize
+        self.n_jobs = n_jobs
+        self.dtype = dtype
 
     def _more_tags(self):
         """Return estimator tags.
@@ -530,8 +990,139 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
         self._fit_transform(X, do_fit=True)
         return self
 
+    @fill_doc
+    def partial_fit(self, X, y=None):
+        """Update the mean connectivity with a new batch of subjects.
+
+        This allows to fit the estimator on cohorts that do not fit in
+        memory, by feeding the subjects' time series one batch at a time.
+        Subsequent calls to :meth:`transform` use the mean over all the
+        subjects seen so far.
+
+        .. note::
+
+            For kind="tangent", the geometric mean is updated by moving the
+            current estimate towards the geometric mean of each new batch,
+            with a step given by the share of the batch in all the subjects
+            seen so far. This is exact for commuting matrices but otherwise
+            only approximates the geometric mean that :meth:`fit` would
+            compute on all the subjects at once.
+
+        Parameters
+        ----------
+        X : iterable of :class:`numpy.ndarray` \
+            each of shape (n_samples, n_features)
+            Each :class:`numpy.ndarray` represents a subject's time series.
+            The number of samples may differ from one subject to another.
+
+        %(y_dummy)s
+
+        Returns
+        -------
+        self : ConnectivityMatrix instance
+            The object itself. Useful for chaining operations.
+
+        """
+        del y
+        self._fit_transform(X, do_fit=True, partial=True)
+        return self
+
+    def _compute_covariances(self, X):
+        """Return the stacked covariance matrices of the subjects.
+
+        The covariances of the default estimators are computed for all the
+        subjects at once, other estimators are fitted on each subject.
+        Either way, the estimator is left fitted on the last subject.
+        """
+        estimator = self.cov_estimator_
+        if (
+            type(estimator) in (EmpiricalCovariance, LedoitWolf)
+            and not estimator.assume_centered
+        ):
+            covariances = _batched_covariances(
+                X, shrink=isinstance(estimator, LedoitWolf)
+            )
+            estimator.fit(X[-1])
+            return covariances
+        return np.array([estimator.fit(x).covariance_ for x in X])
+
+    def _check_n_features(self, X):
+        """Check that a new batch has as many features as the first one."""
+        n_features = next(iter(s.shape[1] for s in X))
+        if n_features != self.n_features_in_:
+            raise ValueError(
+                f"X has {n_features} features, "
+                f"but {self.__class__.__name__} is expecting "
+                f"{self.n_features_in_} features as input."
+            )
+
+    def _compute_mean(self, matrices, init=None):
+        """Return the mean of the given matrices for the chosen kind."""
+        if self.kind == "tangent":
+            dtype = np.dtype(self.dtype or np.float64)
+            # do not ask for more than the working precision can give
+            tol = max(1e-7, 10 * np.finfo(dtype).eps)
+            return _geometric_mean(
+                matrices,
+                init=init,
+                max_iter=30,
+                tol=tol,
+                n_jobs=self.n_jobs,
+                dtype=dtype,
+            )
+        mean = np.mean(matrices, axis=0)
+        # Fight numerical instabilities: make symmetric
+        mean = mean + mean.T
+        mean *= 0.5
+        return mean
+
+    def _fit_mean(self, matrices, partial=False):
+        """Set or update the mean and whitening matrices."""
+        if partial and self.n_subjects_seen_ > 0:
+            self._update_mean(matrices)
+        else:
+            self.mean_ = self._compute_mean(matrices)
+            self.n_subjects_seen_ = len(matrices)
+        if self.kind == "tangent":
+            self.whitening_ = _map_eigenvalues(
+                lambda x: 1.0 / np.sqrt(x), self.mean_
+            )
+
+    def _update_mean(self, matrices):
+        """Update the running mean with a new batch of subjects.
+
+        The mean of the batch is weighted by its share of all the subjects
+        seen so far. For kind="tangent", the running geometric mean is moved
+        towards the geometric mean of the batch along the geodesic joining
+        them, which reduces to the arithmetic update for commuting matrices.
+        """
+        n_batch = len(matrices)
+        self.n_subjects_seen_ += n_batch
+        weight = n_batch / self.n_subjects_seen_
+        if self.kind != "tangent":
+            batch_mean = self._compute_mean(matrices)
+            self.mean_ = self.mean_ + weight * (batch_mean - self.mean_)
+            return
+
+        batch_mean = self._compute_mean(matrices, init=self.mean_)
+        vals, vecs = np.linalg.eigh(self.mean_)
+        mean_sqrt = _form_symmetric(np.sqrt, vals, vecs)
+        mean_inv_sqrt = _form_symmetric(np.sqrt, 1.0 / vals, vecs)
+        self.mean_ = (
+            mean_sqrt
+            @ _map_eigenvalues(
+                lambda x: x**weight, mean_inv_sqrt @ batch_mean @ mean_inv_sqrt
+            )
+            @ mean_sqrt
+        )
+
     def _fit_transform(
-        self, X, do_transform=False, do_fit=False, confounds=None
+        self,
+        X,
+        do_transform=False,
+        do_fit=False,
+        confounds=None,
+        partial=False,
     ):
         """Avoid duplication of computation."""
         if self.cov_estimator is None:
@@ -549,33 +1140,34 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
             X = [X]
         self._check_input(X, confounds=confounds)
 
-        if do_fit:
+        if partial and getattr(self, "n_subjects_seen_", 0) > 0:
+            self._check_n_features(X)
+        elif do_fit:
             self.n_features_in_ = next(iter(s.shape[1] for s in X))
             self.cov_estimator_ = clone(self.cov_estimator)
+            self.n_subjects_seen_ = 0
 
         # Compute all the matrices, stored in "connectivities"
         if self.kind == "correlation":
-            covariances_std = [
-                self.cov_estimator_.fit(
+            covariances_std = self._compute_covariances(
+                [
                     signal.standardize_signal(
                         x,
                         detrend=False,
                         standardize=self.standardize,
                     )
-                ).covariance_
-                for x in X
-            ]
-            connectivities = [cov_to_corr(cov) for cov in covariances_std]
+                    for x in X
+                ]
+            )
+            connectivities = cov_to_corr(covariances_std)
         else:
-            covariances = [self.cov_estimator_.fit(x).covariance_ for x in X]
+            covariances = self._compute_covariances(X)
             if self.kind in ("covariance", "tangent"):
                 connectivities = covariances
             elif self.kind == "precision":
-                connectivities = [linalg.inv(cov) for cov in covariances]
+                connectivities = np.linalg.inv(covariances)
             elif self.kind == "partial correlation":
-                connectivities = [
-                    prec_to_partial(linalg.inv(cov)) for cov in covariances
-                ]
+                connectivities = prec_to_partial(np.linalg.inv(covariances))
             else:
                 allowed_kinds = (
                     "correlation",
@@ -591,18 +1183,10 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
 
         # Store the mean
         if do_fit:
-            if self.kind == "tangent":
-                self.mean_ = _geometric_mean(
-                    covariances, max_iter=30, tol=1e-7
-                )
-                self.whitening_ = _map_eigenvalues(
-                    lambda x: 1.0 / np.sqrt(x), self.mean_
-                )
-            else:
-                self.mean_ = np.mean(connectivities, axis=0)
-                # Fight numerical instabilities: make symmetric
-                self.mean_ = self.mean_ + self.mean_.T
-                self.mean_ *= 0.5
+            self._fit_mean(
+                covariances if self.kind == "tangent" else connectivities,
+                partial=partial,
+            )
 
         # Compute the vector we return on transform
         if do_transform:
@@ -620,15 +1204,15 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
                 for x in X:
                     validate_data(self, x, reset=False)
 
+            connectivities = np.asarray(
+                connectivities, dtype=self.dtype or np.float64
+            )
             if self.kind == "tangent":
-                connectivities = [
-                    _map_eigenvalues(
-                        np.log, self.whitening_.dot(cov).dot(self.whitening_)
-                    )
-                    for cov in connectivities
-                ]
-
-            connectivities = np.array(connectivities)
+                connectivities = _map_eigenvalues(
+                    np.log,
+                    self.whitening_ @ connectivities @ self.whitening_,
+                    n_jobs=self.n_jobs,
+                )
 
             if confounds is not None and not self.vectorize:
                 error_message = (
@@ -785,13 +1369,11 @@ class ConnectivityMeasure(TransformerMixin, BaseEstimator):
 
         if self.kind == "tangent":
             mean_sqrt = _map_eigenvalues(np.sqrt, self.mean_)
-            connectivities = [
-                mean_sqrt.dot(_map_eigenvalues(np.exp, displacement)).dot(
-                    mean_sqrt
-                )
-                for displacement in connectivities
-            ]
-            connectivities = np.array(connectivities)
+            connectivities = (
+                mean_sqrt
+                @ _map_eigenvalues(np.exp, connectivities, n_jobs=self.n_jobs)
+                @ mean_sqrt
+            )
 
         return connectivities
 
@@ -6,6 +6,7 @@ import collections.abc
 import itertools
 import operator
 import warnings
+from math import sqrt
 
 import numpy as np
 import scipy.linalg
@@ -73,46 +74,58 @@ def compute_alpha_max(emp_covs, n_samples):
     return np.max(norms), np.min(norms[norms > 0])
 
 
-def _update_submatrix(full, sub, sub_inv, p, h, v):
-    """Update submatrix and its inverse.
+def _update_submatrix(full, sub, sub_inv, p, h, v, buffer):
+    """Update submatrices and their inverses, for all subjects at once.
 
-    sub_inv is the inverse of the submatrix of "full" obtained by removing
-    the p-th row and column.
+    full has shape (n_features, n_features, n_subjects), while sub, sub_inv
+    and buffer have shape (n_subjects, n_features - 1, n_features - 1).
+    sub_inv[k] is the inverse of the submatrix of full[..., k] obtained by
+    removing the p-th row and column.
 
-    sub_inv is modified in-place. After execution of this function, it contains
-    the inverse of the submatrix of "full" obtained by removing the n+1-th row
-    and column.
+    sub and sub_inv are modified in-place. After execution of this function,
+    sub_inv[k] contains the inverse of the submatrix of full[..., k] obtained
+    by removing the n+1-th row and column. buffer is used as workspace.
 
     This computation is based on the Sherman-Woodbury-Morrison identity.
 
     """
     n = p - 1
-    v[: n + 1] = full[: n + 1, n]
-    v[n + 1 :] = full[n + 2 :, n]
-    h[: n + 1] = full[n, : n + 1]
-    h[n + 1 :] = full[n, n + 2 :]
+    v[:, : n + 1] = full[: n + 1, n, :].T
+    v[:, n + 1 :] = full[n + 2 :, n, :].T
+    h[:, : n + 1] = full[n, : n + 1, :].T
+    h[:, n + 1 :] = full[n, n + 2 :, :].T
 
     # change row: first usage of SWM identity
-    coln = sub_inv[:, n : n + 1]  # 2d array, useful for sub_inv below
-    V = h - sub[n, :]
-    coln = coln / (1.0 + np.dot(V, coln))
-    # The following line is equivalent to
-    # sub_inv -= np.outer(coln, np.dot(V, sub_inv))
-    sub_inv -= np.dot(coln, np.dot(V, sub_inv)[np.newaxis, :])
-    sub[n, :] = h
+    V = h - sub[:, n, :]
+    coln = sub_inv[:, :, n]
+    coln = coln / (1.0 + np.einsum("ki,ki->k", V, coln))[:, np.newaxis]
+    # The following lines are equivalent to
+    # sub_inv[k] -= np.outer(coln[k], np.dot(V[k], sub_inv[k]))
+    np.multiply(
+        coln[:, :, np.newaxis],
+        np.matmul(V[:, np.newaxis, :], sub_inv),
+        out=buffer,
+    )
+    sub_inv -= buffer
+    sub[:, n, :] = h
 
     # change column: second usage of SWM identity
-    rown = sub_inv[n : n + 1, :]  # 2d array, useful for sub_inv below
-    U = v - sub[:, n]
-    rown = rown / (1.0 + np.dot(rown, U))
-    # The following line is equivalent to (but faster)
-    # sub_inv -= np.outer(np.dot(sub_inv, U), rown)
-    sub_inv -= np.dot(np.dot(sub_inv, U)[:, np.newaxis], rown)
-    sub[:, n] = v  # equivalent to sub[n, :] += U
+    U = v - sub[:, :, n]
+    rown = sub_inv[:, n, :]
+    rown = rown / (1.0 + np.einsum("ki,ki->k", rown, U))[:, np.newaxis]
+    # The following lines are equivalent to
+    # sub_inv[k] -= np.outer(np.dot(sub_inv[k], U[k]), rown[k])
+    np.multiply(
+        np.matmul(sub_inv, U[:, :, np.newaxis]),
+        rown[:, np.newaxis, :],
+        out=buffer,
+    )
+    sub_inv -= buffer
+    sub[:, :, n] = v  # equivalent to sub[:, n, :] += U
 
     # Make sub_inv symmetric (overcome some numerical limitations)
-    sub_inv += sub_inv.T.copy()
-    sub_inv /= 2.0
+    np.add(sub_inv, np.swapaxes(sub_inv, 1, 2), out=buffer)
+    np.multiply(buffer, 0.5, out=sub_inv)
 
 
 def _assert_submatrix(full, sub, n):
@@ -264,21 +277,19 @@ def _group_sparse_covariance(
     # Preallocate arrays
     y = np.ndarray(shape=(n_subjects, n_features - 1), dtype=np.float64)
     u = np.ndarray(shape=(n_subjects, n_features - 1), dtype=np.float64)
-    y_1 = np.ndarray(shape=(n_subjects, n_features - 2), dtype=np.float64)
-    h_12 = np.ndarray(shape=(n_subjects, n_features - 2), dtype=np.float64)
     q = np.ndarray(shape=(n_subjects,), dtype=np.float64)
-    aq = np.ndarray(shape=(n_subjects,), dtype=np.float64)  # temp. array
     c = np.ndarray(shape=(n_subjects,), dtype=np.float64)
+    # Stacks of W(k) and W^-1(k), subjects first so that each matrix is
+    # contiguous for the batched linear algebra.
     W = np.ndarray(
-        shape=(omega.shape[0] - 1, omega.shape[1] - 1, omega.shape[2]),
-        dtype=np.float64,
-        order="F",
+        shape=(n_subjects, n_features - 1, n_features - 1), dtype=np.float64
     )
-    W_inv = np.ndarray(shape=W.shape, dtype=np.float64, order="F")
+    W_inv = np.ndarray(shape=W.shape, dtype=np.float64)
 
     # Auxiliary arrays.
-    v = np.ndarray((omega.shape[0] - 1,), dtype=np.float64)
-    h = np.ndarray((omega.shape[1] - 1,), dtype=np.float64)
+    v = np.ndarray((n_subjects, n_features - 1), dtype=np.float64)
+    h = np.ndarray((n_subjects, n_features - 1), dtype=np.float64)
+    buffer = np.ndarray(shape=W.shape, dtype=np.float64)
 
     # Optional.
     tolerance_reached = False
@@ -315,15 +326,13 @@ def _group_sparse_covariance(
         omega_old[...] = omega
         for p in range(n_features):
             if p == 0:
-                W, W_inv = _set_initial_state_w_and_w_inv(omega, debug, p)
+                _set_initial_state_w_and_w_inv(omega, debug, p, W, W_inv)
 
             else:
                 if debug:
                     omega_orig = omega.copy()
 
-                _update_w_and_w_inv(
-                    omega, debug, W, W_inv, n_subjects, p, h, v
-                )
+                _update_w_and_w_inv(omega, debug, W, W_inv, p, h, v, buffer)
 
                 if debug:
                     # Check that omega has not been modified.
@@ -336,25 +345,27 @@ def _group_sparse_covariance(
 
             u[:, :p] = emp_covs[:p, p, :].T
             u[:, p:] = emp_covs[p + 1 :, p, :].T
+            # T(k) * v(k) and T(k) * u(k), constant for all m
+            n_samples_v = n_samples * emp_covs[p, p, :]
+            u *= n_samples[:, np.newaxis]
 
             for m in range(n_features - 1):
                 # Coordinate descent on y
 
                 # T(k) -> n_samples[k]
                 # v(k) -> emp_covs[p, p, k]
-                # h_22(k) -> W_inv[m, m, k]
-                # h_12(k) -> W_inv[:m, m, k],  W_inv[m+1:, m, k]
+                # h_22(k) -> W_inv[k, m, m]
+                # h_12(k) -> W_inv[k, :m, m],  W_inv[k, m+1:, m]
                 # y_1(k) -> y[k, :m], y[k, m+1:]
-                # u_2(k) -> u[k, m]
-                h_12[:, :m] = W_inv[:m, m, :].T
-                h_12[:, m:] = W_inv[m + 1 :, m, :].T
-                y_1[:, :m] = y[:, :m]
-                y_1[:, m:] = y[:, m + 1 :]
-
-                c[:] = -n_samples * (
-                    emp_covs[p, p, :] * (h_12 * y_1).sum(axis=1) + u[:, m]
-                )
-                c2 = np.sqrt(np.dot(c, c))
+                # T(k) * u_2(k) -> u[k, m]
+                # h_12(k).y_1(k) is obtained from the full dot product,
+                # without copying h_12 and y_1.
+                h_22 = W_inv[:, m, m]
+                h_12_y_1 = np.einsum("ki,ki->k", W_inv[:, :, m], y)
+                h_12_y_1 -= h_22 * y[:, m]
+
+                c[:] = -(n_samples_v * h_12_y_1 + u[:, m])
+                c2 = sqrt(np.dot(c, c))
 
                 # x -> y[:][m]
                 if c2 <= alpha:
@@ -362,7 +373,7 @@ def _group_sparse_covariance(
                 else:
                     # q(k) -> T(k) * v(k) * h_22(k)
                     # \lambda -> gamma   (lambda is a Python keyword)
-                    q[:] = n_samples * emp_covs[p, p, :] * W_inv[m, m, :]
+                    q[:] = n_samples_v * h_22
 
                     if debug:
                         assert np.all(q > 0)
@@ -380,10 +391,11 @@ def _group_sparse_covariance(
                     for _ in itertools.repeat(None, 100):
                         # Function whose zero must be determined (fval) and
                         # its derivative (fder).
-                        # Written inplace to save some function calls.
+                        # The sums over the few subjects are done with dot
+                        # products, which have a much lower overhead.
                         aq = 1.0 + gamma * q
-                        aq2 = aq * aq
-                        fder = (two_ccq / (aq2 * aq)).sum()
+                        inv_aq2 = 1.0 / (aq * aq)
+                        fder = np.dot(two_ccq / aq, inv_aq2)
 
                         if fder == 0:
                             msg = "derivative was zero."
@@ -393,7 +405,7 @@ def _group_sparse_covariance(
                                 stacklevel=find_stack_level(),
                             )
                             break
-                        fval = -(alpha2 - (cc / aq2).sum()) / fder
+                        fval = -(alpha2 - np.dot(cc, inv_aq2)) / fder
                         gamma = fval + gamma
                         if abs(fval) < 1.5e-8:
                             break
@@ -416,12 +428,12 @@ def _group_sparse_covariance(
             omega[p, :p, :] = y[:, :p].T
             omega[p, p + 1 :, :] = y[:, p:].T
 
-            for k in range(n_subjects):
-                omega[p, p, k] = 1.0 / emp_covs[p, p, k] + np.dot(
-                    np.dot(y[k, :], W_inv[..., k]), y[k, :]
-                )
+            omega[p, p, :] = 1.0 / emp_covs[p, p, :] + np.einsum(
+                "ki,ki->k", np.matmul(y[:, np.newaxis, :], W_inv)[:, 0], y
+            )
 
-                if debug:
+            if debug:
+                for k in range(n_subjects):
                     assert is_spd(omega[..., k])
 
         if probe_function is not None and probe_function(
@@ -499,36 +511,35 @@ def _check_diagonal_normalization(emp_covs, n_subjects):
             break
 
 
-def _set_initial_state_w_and_w_inv(omega, debug, p):
-    """Set initial state by removing first col/row."""
-    W = omega[1:, 1:, :].copy()  # stack of W(k)
-    W_inv = np.ndarray(shape=W.shape, dtype=np.float64)
-    for k in range(W.shape[2]):
-        # stack of W^-1(k)
-        W_inv[..., k] = scipy.linalg.inv(W[..., k])
+def _set_initial_state_w_and_w_inv(omega, debug, p, W, W_inv):
+    """Set initial state by removing first col/row.
 
-        if debug:
+    W and W_inv are filled in-place with the stacks of W(k) and W^-1(k).
+    """
+    W[...] = np.moveaxis(omega[1:, 1:, :], -1, 0)
+    W_inv[...] = np.linalg.inv(W)
+
+    if debug:
+        for k in range(W.shape[0]):
             np.testing.assert_almost_equal(
-                np.dot(W_inv[..., k], W[..., k]),
-                np.eye(W_inv[..., k].shape[0]),
+                np.dot(W_inv[k], W[k]),
+                np.eye(W_inv[k].shape[0]),
                 decimal=10,
             )
-            _assert_submatrix(omega[..., k], W[..., k], p)
-            assert is_spd(W_inv[..., k])
+            _assert_submatrix(omega[..., k], W[k], p)
+            assert is_spd(W_inv[k])
 
-    return W, W_inv
 
+def _update_w_and_w_inv(omega, debug, W, W_inv, p, h, v, buffer):
+    _update_submatrix(omega, W, W_inv, p, h, v, buffer)
 
-def _update_w_and_w_inv(omega, debug, W, W_inv, n_subjects, p, h, v):
-    for k in range(n_subjects):
-        _update_submatrix(omega[..., k], W[..., k], W_inv[..., k], p, h, v)
-
-        if debug:
-            _assert_submatrix(omega[..., k], W[..., k], p)
-            assert is_spd(W_inv[..., k], decimal=14)
+    if debug:
+        for k in range(W.shape[0]):
+            _assert_submatrix(omega[..., k], W[k], p)
+            assert is_spd(W_inv[k], decimal=14)
             np.testing.assert_almost_equal(
-                np.dot(W[..., k], W_inv[..., k]),
-                np.eye(W_inv[..., k].shape[0]),
+                np.dot(W[k], W_inv[k]),
+                np.eye(W_inv[k].shape[0]),
                 decimal=10,
             )
 
@@ -940,6 +951,11 @@ def group_sparse_covariance_path(
         train_subjs, assume_centered=False, standardize=True
     )
 
+    if test_subjs is not None:
+        test_covs, _ = empirical_covariances(
+            test_subjs, assume_centered=False, standardize=True
+        )
+
     scores = []
     precisions_list = []
     for alpha in alphas:
@@ -957,9 +973,6 @@ def group_sparse_covariance_path(
 
         # Compute log-likelihood
         if test_subjs is not None:
-            test_covs, _ = empirical_covariances(
-                test_subjs, assume_centered=False, standardize=True
-            )
             scores.append(
                 group_sparse_scores(precisions, train_n_samples, test_covs, 0)[
                     0
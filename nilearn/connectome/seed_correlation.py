@@ -0,0 +1,97 @@
+"""Seed-to-voxel correlation maps."""
+
+import numpy as np
+from sklearn.base import clone
+
+from nilearn._utils.docs import fill_doc
+from nilearn.connectome.connectivity_matrices import _unit_norm_columns
+from nilearn.maskers import NiftiMasker
+from nilearn.maskers.nifti_spheres_masker import apply_mask_and_get_affinity
+
+
+@fill_doc
+def seed_correlation_maps(
+    imgs, seeds, radius=None, masker=None, confounds=None, block_size=1000
+):
+    """Compute the correlation maps between many seeds and all the voxels.
+
+    The voxel time series are extracted and cleaned once by the masker.
+    The seed time series are then averaged from the in-mask voxels of each
+    sphere, rather than extracted again from the images. Both are
+    standardized once, and the correlation maps are computed by blocks of
+    seeds with matrix products.
+
+    .. versionadded:: 0.12.1
+
+    Parameters
+    ----------
+    imgs : 4D Niimg-like object
+        See :ref:`extracting_data`.
+        Images of a single run.
+
+    seeds : :obj:`list` of triplet of coordinates in native space
+        Seed definitions. List of coordinates of the seeds in the same space
+        as the images (typically MNI or TAL).
+
+    radius : :obj:`float`, default=None
+        Indicates, in millimeters, the radius for the sphere around the seed.
+        By default signal is extracted on a single voxel.
+
+    masker : :class:`~nilearn.maskers.NiftiMasker` or None, default=None
+        Masker used to extract and clean the voxel time series, for instance
+        to detrend or filter them. If not fitted, a clone of the masker is
+        fitted on imgs. If None, a :class:`~nilearn.maskers.NiftiMasker`
+        with default parameters is used.
+        Seeds outside of the mask of the masker raise an error.
+
+    %(confounds)s
+
+    block_size : :obj:`int`, default=1000
+        Number of seeds whose correlation maps are computed at once.
+
+    Returns
+    -------
+    seed_maps : 4D :class:`nibabel.nifti1.Nifti1Image`
+        Pearson correlation between the time series of each seed and of each
+        voxel, with one volume per seed.
+
+    See Also
+    --------
+    nilearn.maskers.NiftiSpheresMasker
+    nilearn.connectome.sparse_correlation_matrix
+
+    """
+    if not isinstance(block_size, (int, np.integer)) or block_size < 1:
+        raise ValueError(
+            f"'block_size' must be a positive integer. Got {block_size!r}."
+        )
+    if masker is None:
+        masker = NiftiMasker()
+    if not masker.__sklearn_is_fitted__():
+        masker = clone(masker).fit(imgs if masker.mask_img is None else None)
+
+    voxel_signals = masker.transform(imgs, confounds=confounds)
+    _, adjacency = apply_mask_and_get_affinity(
+        seeds, None, radius, allow_overlap=True, mask_img=masker.mask_img_
+    )
+    adjacency = adjacency.tocsr()
+    sphere_sizes = np.asarray(adjacency.sum(axis=1)).ravel()
+    seed_signals = (adjacency @ voxel_signals.T).T / sphere_sizes
+
+    voxel_signals = _unit_norm_columns(voxel_signals)
+    seed_signals = _unit_norm_columns(seed_signals).astype(
+        voxel_signals.dtype, copy=False
+    )
+    n_seeds = seed_signals.shape[1]
+    seed_maps = np.empty(
+        (n_seeds, voxel_signals.shape[1]), dtype=voxel_signals.dtype
+    )
+    for start in range(0, n_seeds, block_size):
+        stop = min(start + block_size, n_seeds)
+        np.matmul(
+            seed_signals[:, start:stop].T,
+            voxel_signals,
+            out=seed_maps[start:stop],
+        )
+
+    return masker.inverse_transform(seed_maps)
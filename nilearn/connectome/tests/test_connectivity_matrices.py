@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_array_almost_equal, assert_array_equal
 from pandas import DataFrame
-from scipy import linalg
+from scipy import linalg, sparse
 from sklearn.covariance import EmpiricalCovariance, LedoitWolf
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
@@ -23,8 +23,12 @@ from nilearn.connectome.connectivity_matrices import (
     _check_square,
     _form_symmetric,
     _geometric_mean,
+    _lower_triangle_plan,
     _map_eigenvalues,
+    _symmetric_gather_plan,
     prec_to_partial,
+    sliding_window_connectivity,
+    sparse_correlation_matrix,
     sym_matrix_to_vec,
     vec_to_sym_matrix,
 )
@@ -243,6 +247,35 @@ def test_map_eigenvalues_on_log_map():
     assert_array_almost_equal(_map_eigenvalues(np.log, spd), spd_log)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_map_eigenvalues_stack(rng, n_jobs):
+    """Check that a stack of matrices is mapped as each of its elements."""
+    spds = []
+    for _ in range(5):
+        tmp = rng.random((4, 4))
+        spds.append(tmp.dot(tmp.T) + np.eye(4))
+    spds = np.array(spds)
+
+    logs = _map_eigenvalues(np.log, spds, n_jobs=n_jobs)
+
+    assert logs.shape == spds.shape
+    for spd, spd_log in zip(spds, logs):
+        assert_array_almost_equal(spd_log, _map_eigenvalues(np.log, spd))
+
+
+def test_geometric_mean_float32():
+    n_matrices = 10
+    spds = [
+        random_spd(5, eig_min=1.0, cond=10.0, random_state=k)
+        for k in range(n_matrices)
+    ]
+    gmean = _geometric_mean(spds)
+    gmean_32 = _geometric_mean(spds, dtype=np.float32, tol=1e-5)
+
+    assert gmean_32.dtype == np.float32
+    assert_array_almost_equal(gmean_32, gmean, decimal=4)
+
+
 def test_geometric_mean_couple():
     n_features = 7
     spd1 = np.ones((n_features, n_features))
@@ -583,6 +616,102 @@ def test_vec_to_sym_matrix():
     assert_array_almost_equal(vec_to_sym_matrix(vec, diagonal=diagonal), sym)
 
 
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("discard_diagonal", [True, False])
+def test_sym_matrix_to_vec_stacked(rng, dtype, discard_diagonal):
+    n_features = 6
+    syms = rng.standard_normal((2, 3, n_features, n_features)).astype(dtype)
+    syms += np.swapaxes(syms, -1, -2)
+
+    vecs = sym_matrix_to_vec(syms, discard_diagonal=discard_diagonal)
+
+    assert vecs.dtype == dtype
+    for index in np.ndindex(syms.shape[:2]):
+        assert_array_almost_equal(
+            vecs[index],
+            sym_matrix_to_vec(syms[index], discard_diagonal=discard_diagonal),
+        )
+
+    diagonals = None
+    if discard_diagonal:
+        diagonals = np.diagonal(syms, axis1=-2, axis2=-1) / sqrt(2)
+    round_trip = vec_to_sym_matrix(vecs, diagonal=diagonals)
+
+    assert round_trip.dtype == dtype
+    assert_array_almost_equal(round_trip, syms, decimal=5)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.int8, bool])
+@pytest.mark.parametrize("discard_diagonal", [True, False])
+def test_sym_matrix_to_vec_int_and_bool(dtype, discard_diagonal):
+    """Check that the diagonal scaling converts integers to float64."""
+    sym = np.stack([np.eye(3), np.ones((3, 3))]).astype(dtype)
+
+    vec = sym_matrix_to_vec(sym, discard_diagonal=discard_diagonal)
+
+    expected = sym_matrix_to_vec(
+        sym.astype(np.float64), discard_diagonal=discard_diagonal
+    )
+    if discard_diagonal:
+        assert vec.dtype == dtype
+    else:
+        assert vec.dtype == np.float64
+    assert_array_almost_equal(vec, expected)
+
+
+def test_sym_matrix_to_vec_complex():
+    """Check that complex matrices keep their imaginary part."""
+    sym = np.full((3, 3), 1 + 2j)
+
+    vec = sym_matrix_to_vec(sym)
+
+    assert vec.dtype == np.complex128
+    assert_array_almost_equal(vec[1], 1 + 2j)
+    assert_array_almost_equal(vec[0], (1 + 2j) / sqrt(2))
+
+
+def test_sym_matrix_to_vec_plan_is_cached():
+    _lower_triangle_plan.cache_clear()
+    _symmetric_gather_plan.cache_clear()
+    sym = np.eye(4)
+    for _ in range(3):
+        sym_matrix_to_vec(sym)
+
+    assert _lower_triangle_plan.cache_info().hits == 2
+    assert _lower_triangle_plan.cache_info().misses == 1
+    # the gather plan is only built when going back to matrices
+    assert _symmetric_gather_plan.cache_info().currsize == 0
+
+    vec_to_sym_matrix(sym_matrix_to_vec(sym))
+
+    assert _symmetric_gather_plan.cache_info().misses == 1
+    # the cached plan cannot be modified by the callers
+    with pytest.raises(ValueError, match="read-only"):
+        _lower_triangle_plan(4, False)[0][0] = 1
+    with pytest.raises(ValueError, match="read-only"):
+        _symmetric_gather_plan(4, False)[0] = 1
+
+
+def test_sym_matrix_to_vec_large_plan_not_cached(monkeypatch, rng):
+    monkeypatch.setattr(
+        "nilearn.connectome.connectivity_matrices._MAX_CACHED_PLAN_SIZE", 8
+    )
+    _lower_triangle_plan.cache_clear()
+    _symmetric_gather_plan.cache_clear()
+    sym = rng.random((3, 3))
+    sym += sym.T
+
+    assert_array_almost_equal(vec_to_sym_matrix(sym_matrix_to_vec(sym)), sym)
+    assert _lower_triangle_plan.cache_info().currsize == 0
+    assert _symmetric_gather_plan.cache_info().currsize == 0
+
+
+def test_vec_to_sym_matrix_single_feature():
+    sym = vec_to_sym_matrix(np.empty((2, 0)), diagonal=np.ones((2, 1)))
+
+    assert_array_almost_equal(sym, np.full((2, 1, 1), sqrt(2)))
+
+
 def test_vec_to_sym_matrix_errors():
     # Check error if unsuitable size
     vec = np.ones(31)
@@ -616,6 +745,12 @@ def test_prec_to_partial():
 
     assert_array_almost_equal(prec_to_partial(precision), partial)
 
+    # stacked matrices
+    assert_array_almost_equal(
+        prec_to_partial(np.array([precision, 2.0 * precision])),
+        np.array([partial, partial]),
+    )
+
 
 def test_connectivity_measure_errors():
     # Raising error for input subjects not iterable
@@ -959,6 +1094,211 @@ def test_connectivity_measure_inverse_transform_tangent(
         tangent_measure.inverse_transform(vectorized_displacements)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_connectivity_measure_tangent_float32(signals, n_jobs):
+    """Check the single precision and multi-threaded tangent space."""
+    tangent_measure = ConnectivityMeasure(kind="tangent")
+    displacements = tangent_measure.fit_transform(signals)
+
+    tangent_measure_32 = ConnectivityMeasure(
+        kind="tangent", dtype=np.float32, n_jobs=n_jobs
+    )
+    displacements_32 = tangent_measure_32.fit_transform(signals)
+
+    assert tangent_measure_32.mean_.dtype == np.float32
+    assert displacements_32.dtype == np.float32
+    assert_array_almost_equal(
+        tangent_measure_32.mean_, tangent_measure.mean_, decimal=2
+    )
+    assert_array_almost_equal(displacements_32, displacements, decimal=2)
+    assert_array_almost_equal(
+        tangent_measure_32.inverse_transform(displacements_32),
+        tangent_measure.inverse_transform(displacements),
+        decimal=2,
+    )
+
+
+@pytest.mark.parametrize("kind", CONNECTIVITY_KINDS)
+def test_connectivity_measure_partial_fit(kind, signals):
+    """Check that fitting by batches matches fitting all the subjects."""
+    conn_measure = ConnectivityMeasure(kind=kind).fit(signals)
+
+    partial_measure = ConnectivityMeasure(kind=kind)
+    for batch in (signals[:2], signals[2:3], signals[3:]):
+        partial_measure.partial_fit(batch)
+
+    assert partial_measure.n_subjects_seen_ == len(signals)
+    if kind == "tangent":
+        # the online geometric mean is only an approximation
+        mean_error = np.linalg.norm(partial_measure.mean_ - conn_measure.mean_)
+        assert mean_error < 0.05 * np.linalg.norm(conn_measure.mean_)
+    else:
+        assert_array_almost_equal(partial_measure.mean_, conn_measure.mean_)
+        assert_array_almost_equal(
+            partial_measure.transform(signals),
+            conn_measure.transform(signals),
+        )
+
+    # fit starts over
+    partial_measure.fit(signals)
+
+    assert partial_measure.n_subjects_seen_ == len(signals)
+    assert_array_almost_equal(partial_measure.mean_, conn_measure.mean_)
+
+
+def test_connectivity_measure_partial_fit_commuting_tangent():
+    """The online geometric mean is exact for commuting matrices."""
+    diags = [
+        np.diag([1.0 + k, 2.0, 1.0 / (1.0 + k)]) for k in range(N_SUBJECTS)
+    ]
+    geo = np.prod(np.array(diags), axis=0) ** (1 / N_SUBJECTS)
+    conn_measure = ConnectivityMeasure(kind="tangent")
+    conn_measure.mean_ = diags[0]
+    conn_measure.n_subjects_seen_ = 1
+    for diag in diags[1:]:
+        conn_measure._update_mean([diag])
+
+    assert_array_almost_equal(conn_measure.mean_, geo)
+
+
+def test_connectivity_measure_partial_fit_errors(signals):
+    conn_measure = ConnectivityMeasure().partial_fit(signals)
+    with pytest.raises(ValueError, match="is expecting 49 features"):
+        conn_measure.partial_fit([np.ones((100, 40))])
+
+
+@pytest.mark.parametrize("step", [1, 3, 20, 25])
+@pytest.mark.parametrize("kind", ["covariance", "correlation"])
+def test_sliding_window_connectivity(rng, kind, step):
+    """Check the running windows against matrices computed from scratch."""
+    window_length = 20
+    signals = rng.standard_normal((100, 6)) + 5.0
+
+    connectivities = sliding_window_connectivity(
+        signals, window_length, step=step, kind=kind
+    )
+
+    conn_measure = ConnectivityMeasure(
+        cov_estimator=EmpiricalCovariance(), kind=kind, standardize=False
+    )
+    expected = conn_measure.fit_transform(
+        [
+            signals[start : start + window_length]
+            for start in range(0, 100 - window_length + 1, step)
+        ]
+    )
+    assert connectivities.shape == expected.shape
+    assert_array_almost_equal(connectivities, expected)
+
+    vectorized = sliding_window_connectivity(
+        signals,
+        window_length,
+        step=step,
+        kind=kind,
+        vectorize=True,
+        discard_diagonal=True,
+    )
+
+    assert_array_almost_equal(
+        vectorized, sym_matrix_to_vec(expected, discard_diagonal=True)
+    )
+
+
+def test_sliding_window_connectivity_errors(rng):
+    signals = rng.standard_normal((50, 3))
+    with pytest.raises(ValueError, match="'window_length' must be"):
+        sliding_window_connectivity(signals, 51)
+    with pytest.raises(ValueError, match="'window_length' must be"):
+        sliding_window_connectivity(signals, 1)
+    with pytest.raises(ValueError, match="'step' must be"):
+        sliding_window_connectivity(signals, 10, step=0)
+    with pytest.raises(ValueError, match="Allowed connectivity kinds"):
+        sliding_window_connectivity(signals, 10, kind="tangent")
+
+
+@pytest.mark.parametrize("block_size", [7, 1000])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_sparse_correlation_matrix_top_k(rng, block_size, n_jobs):
+    signals = rng.standard_normal((50, 30))
+    correlation = np.corrcoef(signals.T)
+    np.fill_diagonal(correlation, -np.inf)
+
+    connectome = sparse_correlation_matrix(
+        signals, top_k=3, block_size=block_size, n_jobs=n_jobs
+    )
+
+    assert sparse.issparse(connectome)
+    assert connectome.shape == (30, 30)
+    assert connectome.nnz == 30 * 3
+    dense = connectome.toarray()
+    for row, expected in zip(dense, correlation):
+        top = np.argsort(expected)[-3:]
+        assert_array_equal(np.sort(np.flatnonzero(row)), np.sort(top))
+        assert_array_almost_equal(row[top], expected[top])
+
+
+def test_sparse_correlation_matrix_threshold(rng):
+    signals = rng.standard_normal((50, 30)).astype(np.float32)
+    correlation = np.corrcoef(signals.T)
+    np.fill_diagonal(correlation, 0)
+
+    connectome = sparse_correlation_matrix(
+        signals, threshold=0.2, block_size=4
+    )
+
+    assert connectome.dtype == np.float32
+    assert_array_almost_equal(
+        connectome.toarray(), np.where(correlation >= 0.2, correlation, 0)
+    )
+
+    # both top_k and threshold
+    connectome = sparse_correlation_matrix(signals, top_k=50, threshold=0.2)
+
+    assert connectome.nnz == np.sum(correlation >= 0.2)
+
+
+def test_sparse_correlation_matrix_errors(rng):
+    signals = rng.standard_normal((50, 3))
+    with pytest.raises(ValueError, match="At least one of"):
+        sparse_correlation_matrix(signals)
+    with pytest.raises(ValueError, match="'top_k' must be"):
+        sparse_correlation_matrix(signals, top_k=0)
+    with pytest.raises(ValueError, match="'block_size' must be"):
+        sparse_correlation_matrix(signals, top_k=1, block_size=0)
+
+
+@pytest.mark.parametrize("kind", CONNECTIVITY_KINDS)
+@pytest.mark.parametrize(
+    "cov_estimator", [EmpiricalCovariance(), LedoitWolf(block_size=7)]
+)
+def test_connectivity_measure_batched_covariances(rng, kind, cov_estimator):
+    """Check the batched covariances against the per-subject estimators."""
+    # subjects of different lengths, some of them with the same length
+    signals = [
+        rng.standard_normal((n_samples, 10)) + 3.0
+        for n_samples in (30, 50, 30, 40, 30)
+    ]
+
+    class _Estimator(type(cov_estimator)):
+        """Not a default estimator: fitted on each subject."""
+
+    looped = ConnectivityMeasure(
+        cov_estimator=_Estimator(**cov_estimator.get_params()), kind=kind
+    ).fit(signals)
+    batched = ConnectivityMeasure(cov_estimator=cov_estimator, kind=kind).fit(
+        signals
+    )
+
+    assert_array_almost_equal(batched.mean_, looped.mean_)
+    # both estimators are left fitted on the last subject
+    assert_array_almost_equal(
+        batched.cov_estimator_.covariance_, looped.cov_estimator_.covariance_
+    )
+    assert_array_almost_equal(
+        batched.transform(signals), looped.transform(signals)
+    )
+
+
 def test_confounds_connectome_measure():
     n_subjects = 10
 
@@ -11,6 +11,7 @@ from nilearn._utils.estimator_checks import (
 from nilearn._utils.tags import SKLEARN_LT_1_6
 from nilearn.connectome import GroupSparseCovariance, GroupSparseCovarianceCV
 from nilearn.connectome.group_sparse_cov import (
+    _update_submatrix,
     group_sparse_covariance,
     group_sparse_scores,
 )
@@ -86,6 +87,29 @@ def test_group_sparse_covariance(rng):
     np.testing.assert_almost_equal(omega, omega2, decimal=4)
 
 
+@pytest.mark.parametrize("p", [1, 3, 5])
+def test_update_submatrix(rng, p):
+    """Check the batched update of the submatrices and their inverses."""
+    n_subjects, n_features = 3, 6
+    full = rng.standard_normal((n_subjects, n_features, n_features))
+    full = full @ full.transpose(0, 2, 1) + n_features * np.eye(n_features)
+    full = np.moveaxis(full, 0, -1)
+
+    def remove(index):
+        keep = np.arange(n_features) != index
+        return np.moveaxis(full[keep][:, keep], -1, 0)
+
+    sub = remove(p - 1)
+    sub_inv = np.linalg.inv(sub)
+    h = np.empty((n_subjects, n_features - 1))
+    v = np.empty((n_subjects, n_features - 1))
+
+    _update_submatrix(full, sub, sub_inv, p, h, v, np.empty_like(sub))
+
+    np.testing.assert_almost_equal(sub, remove(p))
+    np.testing.assert_almost_equal(sub_inv, np.linalg.inv(remove(p)))
+
+
 @pytest.mark.parametrize("duality_gap", [True, False])
 def test_group_sparse_covariance_with_probe_function(rng, duality_gap):
     signals, _, _ = generate_group_sparse_gaussian_graphs(
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from nibabel import Nifti1Image
+from numpy.testing import assert_array_almost_equal
+
+from nilearn.connectome import seed_correlation_maps
+from nilearn.maskers import NiftiMasker, NiftiSpheresMasker
+
+
+@pytest.fixture
+def imgs_and_mask(rng, affine_eye):
+    shape = (7, 8, 9)
+    imgs = Nifti1Image(rng.standard_normal((*shape, 30)), affine_eye)
+    mask = np.zeros(shape, dtype="int8")
+    mask[1:-1, 1:-1, 1:-1] = 1
+    return imgs, Nifti1Image(mask, affine_eye)
+
+
+@pytest.mark.parametrize("radius", [None, 1.5])
+@pytest.mark.parametrize("block_size", [1, 1000])
+def test_seed_correlation_maps(imgs_and_mask, radius, block_size):
+    imgs, mask_img = imgs_and_mask
+    seeds = [(2, 2, 2), (3, 4, 5), (5, 6, 7)]
+    masker = NiftiMasker(mask_img=mask_img, detrend=True)
+
+    seed_maps = seed_correlation_maps(
+        imgs, seeds, radius=radius, masker=masker, block_size=block_size
+    )
+
+    assert seed_maps.shape == (*imgs.shape[:3], len(seeds))
+    # the masker passed is not modified
+    assert not masker.__sklearn_is_fitted__()
+
+    voxel_signals = masker.fit_transform(imgs)
+    seed_signals = NiftiSpheresMasker(
+        seeds, radius=radius, mask_img=mask_img, detrend=True
+    ).fit_transform(imgs)
+    correlation = np.corrcoef(seed_signals.T, voxel_signals.T)[
+        : len(seeds), len(seeds) :
+    ]
+
+    maps = NiftiMasker(mask_img=mask_img).fit().transform(seed_maps)
+
+    assert_array_almost_equal(maps, correlation)
+    if radius is None:
+        for k, seed in enumerate(seeds):
+            assert seed_maps.get_fdata()[(*seed, k)] == pytest.approx(1.0)
+
+
+def test_seed_correlation_maps_default_masker(imgs_and_mask):
+    imgs, _ = imgs_and_mask
+    seed_maps = seed_correlation_maps(imgs, [(3, 4, 5)])
+
+    assert seed_maps.shape == (*imgs.shape[:3], 1)
+    assert seed_maps.get_fdata()[3, 4, 5, 0] == pytest.approx(1.0)
+
+
+def test_seed_correlation_maps_errors(imgs_and_mask):
+    imgs, mask_img = imgs_and_mask
+    masker = NiftiMasker(mask_img=mask_img)
+    with pytest.raises(ValueError, match="'block_size' must be"):
+        seed_correlation_maps(imgs, [(3, 4, 5)], masker=masker, block_size=0)
+    with pytest.raises(ValueError, match="spheres are empty"):
+        seed_correlation_maps(imgs, [(0, 0, 0)], masker=masker)
@@ -117,7 +117,7 @@ def tv_l1_from_gradient(spatial_grad):
     return l1_term + tv_term
 
 
-def divergence_id(grad, l1_ratio=0.5):
+def divergence_id(grad, l1_ratio=0.5, out=None):
     """Compute divergence + id of image gradient + id.
 
     Parameters
@@ -129,6 +129,11 @@ def divergence_id(grad, l1_ratio=0.5):
     l1_ratio : float in the interval [0, 1]; default=0.5
         Constant that mixes L1 and spatial prior terms in the penalization.
 
+    out : ndarray, shape (nx, ny, nz, ...), default=None
+        Buffer in which the result is written, to avoid reallocating it
+        across iterations. If None, a new array with the dtype of `grad`
+        is allocated.
+
     Returns
     -------
     res : ndarray, shape (nx, ny, nz, ...)
@@ -144,7 +149,11 @@ def divergence_id(grad, l1_ratio=0.5):
             f"l1_ratio must be in the interval [0, 1]; got {l1_ratio}"
         )
 
-    res = np.zeros(grad.shape[1:])
+    if out is None:
+        res = np.zeros(grad.shape[1:], dtype=grad.dtype)
+    else:
+        res = out
+        res.fill(0.0)
 
     # the divergence part
     for d in range(grad.shape[0] - 1):
@@ -163,7 +172,7 @@ def divergence_id(grad, l1_ratio=0.5):
     return res
 
 
-def gradient_id(img, l1_ratio=0.5):
+def gradient_id(img, l1_ratio=0.5, out=None):
     """Compute gradient + id of an image.
 
     Parameters
@@ -174,6 +183,11 @@ def gradient_id(img, l1_ratio=0.5):
     l1_ratio : float in the interval [0, 1]; default=0.5
         Constant that mixes L1 and spatial prior terms in the penalization.
 
+    out : ndarray, shape (4, nx, ny, nz, ...), default=None
+        Buffer in which the result is written, to avoid reallocating it
+        across iterations. If None, a new array is allocated, with the
+        dtype of `img` if it is a floating point one and float64 otherwise.
+
     Returns
     -------
     gradient : ndarray, shape (4, nx, ny, nz, ...).
@@ -190,14 +204,24 @@ def gradient_id(img, l1_ratio=0.5):
             f"l1_ratio must be in the interval [0, 1]; got {l1_ratio}"
         )
 
-    shape = [img.ndim + 1, *img.shape]
-    gradient = np.zeros(shape, dtype=np.float64)
+    if out is None:
+        shape = [img.ndim + 1, *img.shape]
+        dtype = img.dtype if img.dtype.kind == "f" else np.float64
+        gradient = np.zeros(shape, dtype=dtype)
+    else:
+        gradient = out
 
     # the gradient part: 'Clever' code to have a view of the gradient
     # with dimension i stop at -1
     slice_all = [0, slice(None, -1)]
     for d in range(img.ndim):
-        gradient[tuple(slice_all)] = np.diff(img, axis=d)
+        np.subtract(
+            img[(*slice_all[1:-1], slice(1, None))],
+            img[tuple(slice_all[1:])],
+            out=gradient[tuple(slice_all)],
+        )
+        if out is not None:
+            np.rollaxis(gradient[d], d)[-1] = 0.0
         slice_all[0] = d + 1
         slice_all.insert(1, slice(None))
 
@@ -255,7 +279,7 @@ def logistic_loss_grad(X, y, w):
     yz = y * z
     z = _sigmoid(yz, copy=False)
     z0 = (z - 1.0) * y
-    grad = np.empty(w.shape)
+    grad = np.empty(w.shape, dtype=w.dtype)
     grad[:-1] = np.dot(X.T, z0)
     grad[-1] = np.sum(z0)
     return grad
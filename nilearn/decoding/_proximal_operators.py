@@ -15,7 +15,7 @@ from ._objective_functions import (
 
 def prox_l1(y, alpha, copy=True):
     """Compute proximity operator for L1 norm."""
-    shrink = np.zeros(y.shape)
+    shrink = np.zeros(y.shape, dtype=y.dtype)
     if copy:
         y = y.copy()
     y_nz = y.nonzero()
@@ -181,8 +181,11 @@ def prox_tvl1(
     if input_img.dtype.kind != "f":
         input_img = input_img.astype(np.float64)
     shape = [len(input_img.shape) + 1, *input_img.shape]
-    grad_im = np.zeros(shape)
-    grad_aux = np.zeros(shape)
+    grad_im = np.zeros(shape, dtype=input_img.dtype)
+    grad_aux = np.zeros(shape, dtype=input_img.dtype)
+    # buffers reused across iterations for the gradient and the divergence
+    grad_buffer = np.zeros(shape, dtype=input_img.dtype)
+    div_buffer = np.empty(input_img.shape, dtype=input_img.dtype)
     t = 1.0
     i = 0
     lipschitz_constant = 1.1 * (
@@ -211,7 +214,9 @@ def prox_tvl1(
     fista_step = fista
 
     while i < max_iter:
-        grad_tmp = gradient_id(negated_output, l1_ratio=l1_ratio)
+        grad_tmp = gradient_id(
+            negated_output, l1_ratio=l1_ratio, out=grad_buffer
+        )
         grad_tmp *= 1.0 / (lipschitz_constant * weight)
         grad_aux += grad_tmp
         grad_tmp = _projector_on_tvl1_dual(grad_aux, l1_ratio)
@@ -228,7 +233,8 @@ def prox_tvl1(
 
         grad_im = grad_tmp
         t = t_new
-        gap = weight * divergence_id(grad_aux, l1_ratio=l1_ratio)
+        gap = divergence_id(grad_aux, l1_ratio=l1_ratio, out=div_buffer)
+        gap *= weight
 
         # Compute the primal variable
         negated_output = gap - input_img
@@ -13,9 +13,13 @@ ensembling to achieve state of the art performance
 import itertools
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import numpy as np
 from joblib import Parallel, delayed
+from nibabel import load
+from nibabel.spatialimages import SpatialImage
 from sklearn import clone
 from sklearn.base import (
     BaseEstimator,
@@ -40,6 +44,7 @@ from sklearn.model_selection import (
 )
 from sklearn.preprocessing import LabelBinarizer
 from sklearn.svm import SVR, LinearSVC, l1_min_c
+from sklearn.utils import check_random_state
 from sklearn.utils.extmath import safe_sparse_dot
 from sklearn.utils.validation import check_is_fitted, check_X_y
 
@@ -55,6 +60,7 @@ from nilearn._utils.param_validation import (
     check_params,
 )
 from nilearn._utils.tags import SKLEARN_LT_1_6
+from nilearn.image import index_img
 from nilearn.maskers import SurfaceMasker
 from nilearn.regions.rena_clustering import ReNA
 from nilearn.surface import SurfaceImage
@@ -323,6 +329,42 @@ def _replace_param_grid_key(param_grid, key_to_replace, new_key):
     return new_param_grid
 
 
+def _iter_batches(X, batch_size):
+    """Split images or masked data into batches of samples.
+
+    4D Nifti images are sliced through their array proxy, so that only
+    one batch of volumes is read from disk at a time.
+    """
+    if isinstance(X, (str, Path)):
+        # keep compressed files open, so that each batch does not
+        # decompress the file from its start again
+        X = load(X, keep_file_open=True)
+
+    if isinstance(X, SpatialImage):
+        if len(X.shape) == 3:
+            yield X
+            return
+        for start in range(0, X.shape[3], batch_size):
+            yield X.slicer[..., start : start + batch_size]
+    elif isinstance(X, SurfaceImage):
+        if X.data.ndim == 1:
+            yield X
+            return
+        n_samples = X.shape[1]
+        for start in range(0, n_samples, batch_size):
+            yield index_img(
+                X, slice(start, min(start + batch_size, n_samples))
+            )
+    elif isinstance(X, np.ndarray):
+        for start in range(0, X.shape[0], batch_size):
+            yield X[start : start + batch_size]
+    else:
+        # any iterable of images, e.g. a generator over a large collection
+        images = iter(X)
+        while batch := list(itertools.islice(images, batch_size)):
+            yield batch
+
+
 def _check_estimator(estimator):
     if not isinstance(estimator, str):
         warnings.warn(
@@ -793,6 +835,133 @@ class _BaseDecoder(CacheMixin, BaseEstimator):
     def __sklearn_is_fitted__(self):
         return hasattr(self, "coef_") and hasattr(self, "masker_")
 
+    @fill_doc
+    def permutation_test(
+        self, X, y, groups=None, n_permutations=100, random_state=None
+    ):
+        """Assess the significance of the cross-validated score \
+        by permuting the target.
+
+        For each permutation of ``y``, the models are fitted again on the
+        cross-validation folds of the fitted decoder (``cv_``), with the same
+        estimator, parameter grid and scoring. The data are masked only
+        once, by the fitted masker, and the permutations are run in parallel
+        batches of folds. As the feature screening and the clustering
+        depend on the target, they are fitted again on each permuted fold.
+
+        Parameters
+        ----------
+        X : list of Niimg-like or :obj:`~nilearn.surface.SurfaceImage` \
+            objects, or :class:`numpy.ndarray` of shape (n_samples, n_features)
+            The data the decoder was fitted on, either as images or
+            already masked by ``masker_``.
+
+        y : numpy.ndarray of shape=(n_samples) or list of length n_samples
+            The target the decoder was fitted on.
+
+        groups : None or array-like of shape (n_samples,), default=None
+            Group labels of the samples. If given, the target is only
+            permuted within each group.
+
+        n_permutations : :obj:`int`, default=100
+            Number of permutations of the target.
+
+        %(random_state)s
+
+        Returns
+        -------
+        null_scores : numpy.ndarray, shape (n_permutations,)
+            Score obtained for each permutation of the target, averaged
+            over folds (and classes for multiclass problems) as ``cv_scores_``.
+
+        pvalue : :obj:`float`
+            Empirical p-value of the mean score in ``cv_scores_``, computed
+            as ``(C + 1) / (n_permutations + 1)`` where C is the number of
+            permutations scoring at least as well.
+        """
+        check_is_fitted(self)
+        if not isinstance(n_permutations, int) or n_permutations < 1:
+            raise ValueError(
+                "'n_permutations' must be a positive integer. "
+                f"Got {n_permutations!r}."
+            )
+        random_state = check_random_state(random_state)
+
+        # reuse the fitted masker: images are masked once for all
+        # permutations
+        if not isinstance(X, np.ndarray) or len(np.shape(X)) == 1:
+            X = self.masker_.transform(X)
+        X, y = check_X_y(X, y, dtype=np.float64, multi_output=True)
+
+        n_samples = X.shape[0]
+        n_cv_samples = 1 + max(
+            np.max(np.concatenate([train, test])) for train, test in self.cv_
+        )
+        if n_cv_samples > n_samples:
+            raise ValueError(
+                f"X has {n_samples} samples, but the decoder was fitted "
+                f"with folds over at least {n_cv_samples} samples."
+            )
+
+        # same problems as in fit: one per class for multiclass
+        # classification, a single one otherwise
+        if self.is_classification:
+            y = self._enc.transform(y)
+            n_problems = y.shape[1]
+        else:
+            y = y[:, np.newaxis]
+            n_problems = 1
+
+        mesh_n_vertices = (
+            self.mask_img_.mesh.n_vertices
+            if isinstance(self.mask_img_, SurfaceImage)
+            else None
+        )
+        selector = check_feature_screening(
+            self.screening_percentile,
+            self.mask_img_,
+            self.is_classification,
+            mesh_n_vertices=mesh_n_vertices,
+        )
+
+        if groups is None:
+            groups = np.zeros(n_samples)
+        groups = np.asarray(groups)
+        permutations = []
+        for _ in range(n_permutations):
+            permutation = np.arange(n_samples)
+            for group in np.unique(groups):
+                in_group = np.flatnonzero(groups == group)
+                permutation[in_group] = random_state.permutation(in_group)
+            permutations.append(permutation)
+
+        parallel = Parallel(n_jobs=self.n_jobs, verbose=2 * self.verbose)
+        outputs = parallel(
+            delayed(_parallel_fit)(
+                estimator=self.estimator_,
+                X=X,
+                y=y[permutation, c],
+                train=train,
+                test=test,
+                param_grid=self.param_grid,
+                selector=selector,
+                scorer=self.scorer_,
+                mask_img=self.mask_img_,
+                class_index=c,
+                clustering_percentile=self.clustering_percentile,
+            )
+            for permutation, c, (train, test) in itertools.product(
+                permutations, range(n_problems), self.cv_
+            )
+        )
+        null_scores = np.array([output[4] for output in outputs])
+        null_scores = null_scores.reshape(n_permutations, -1).mean(axis=1)
+
+        score = np.mean(list(self.cv_scores_.values()))
+        pvalue = (np.sum(null_scores >= score) + 1.0) / (n_permutations + 1)
+
+        return null_scores, pvalue
+
     def score(self, X, y, *args):
         """Compute the prediction score using the scoring \
         metric defined by the scoring attribute.
@@ -882,6 +1051,90 @@ class _BaseDecoder(CacheMixin, BaseEstimator):
         else:
             scores = self.decision_function(X)
 
+        return self._predict_from_scores(scores)
+
+    def predict_batches(self, X, batch_size=100, method="predict"):
+        """Predict on a large collection of images by batches.
+
+        Images are masked ``batch_size`` at a time, so that the whole
+        collection is never loaded in memory. The next batch is read and
+        masked in a background thread while the current one is scored, to
+        overlap reading images from disk with computations.
+
+        Parameters
+        ----------
+        X : Niimg-like, :obj:`~nilearn.surface.SurfaceImage`, \
+            iterable of either Niimg-like objects or :obj:`str` or \
+            path-like, or :class:`numpy.ndarray` of shape \
+            (n_samples, n_features)
+            See :ref:`extracting_data`.
+            Data on which prediction is to be made. 4D images given as
+            filenames are read one batch of volumes at a time, and
+            iterables (e.g. generators) are consumed one batch at a time.
+
+        batch_size : :obj:`int`, default=100
+            Number of images masked and scored at once.
+
+        method : {"predict", "decision_function"}, default="predict"
+            Method used on each batch.
+
+        Yields
+        ------
+        y_pred : :class:`numpy.ndarray`
+            Output of ``method`` on the next batch of at most
+            ``batch_size`` samples, in the order of ``X``.
+
+        Notes
+        -----
+        The masker cleans the signals (e.g. ``standardize``) over the
+        samples of each batch, so the predictions only match those of
+        :meth:`predict` on the whole data when the signals are not cleaned
+        across samples.
+        """
+        check_is_fitted(self)
+        if method not in ("predict", "decision_function"):
+            raise ValueError(
+                "'method' must be one of "
+                f"{('predict', 'decision_function')}. Got {method!r}."
+            )
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(
+                f"'batch_size' must be a positive integer. Got {batch_size!r}."
+            )
+
+        batches = _iter_batches(X, batch_size)
+
+        def next_masked_batch():
+            # the batch is read from disk, or taken from an iterable,
+            # in the worker thread as well
+            batch = next(batches, None)
+            if batch is None or (
+                isinstance(batch, np.ndarray) and batch.ndim == 2
+            ):
+                return batch
+            return self.masker_.transform(batch)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(next_masked_batch)
+            while (X_batch := future.result()) is not None:
+                # load the next batch while this one is scored
+                future = executor.submit(next_masked_batch)
+
+                if method == "decision_function":
+                    yield self.decision_function(X_batch)
+                elif isinstance(
+                    self.estimator_, (DummyClassifier, DummyRegressor)
+                ):
+                    yield self._predict_from_scores(
+                        self._predict_dummy(X_batch.shape[0])
+                    )
+                else:
+                    yield self._predict_from_scores(
+                        self.decision_function(X_batch)
+                    )
+
+    def _predict_from_scores(self, scores):
+        """Turn decision function scores into predictions."""
         if self.is_classification:
             if scores.ndim == 1:
                 indices = (scores > 0).astype(int)
@@ -72,6 +72,7 @@ def mfista(
     dgap_factor=None,
     callback=None,
     verbose=2,
+    dtype=np.float64,
 ):
     """Solve FISTA in a generic way.
 
@@ -128,6 +129,11 @@ def mfista(
     verbose : :obj:`int`, default=2
         Indicate the level of verbosity.
 
+    dtype : numpy dtype, default=np.float64
+        Floating point type of the solution, when no initialization is
+        given. The iterates keep this dtype as long as `f1_grad` and
+        `f2_prox` preserve it.
+
     Returns
     -------
     w : ndarray, shape (w_size,)
@@ -152,7 +158,7 @@ def mfista(
     # initialization
     if init is None:
         init = {}
-    w = init.get("w", np.zeros(w_size))
+    w = init.get("w", np.zeros(w_size, dtype=dtype))
     z = init.get("z", w.copy())
     t = init.get("t", 1.0)
     stepsize = init.get("stepsize", 1.0 / lipschitz_constant)
@@ -175,7 +181,8 @@ def mfista(
     best_z = z.copy()
     best_t = t
     prox_info = {"converged": True}
-    stepsize = 1.0 / lipschitz_constant
+    # a python float does not upcast float32 iterates
+    stepsize = 1.0 / float(lipschitz_constant)
     history = []
     w_old = w.copy()
 
@@ -396,9 +396,9 @@ def path_scores(
     # crop the mask to have a tighter bounding box
     mask = _crop_mask(mask)
 
-    # get train and test data
-    X_train, y_train = X[train].copy(), y[train].copy()
-    X_test, y_test = X[test].copy(), y[test].copy()
+    # get train and test data (fancy indexing already copies)
+    X_train, y_train = X[train], y[train]
+    X_test, y_test = X[test], y[test]
 
     # it is essential to center the data in regression
     X_train, y_train, _, y_train_mean, _ = center_data(
@@ -846,6 +846,13 @@ class BaseSpaceNet(CacheMixin, LinearRegression):
         -----
         self : `SpaceNet` object
             Model selection is via cross-validation with bagging.
+
+        The masked data are converted to float64 whatever the data type
+        of the images. The solvers of
+        :mod:`nilearn.decoding.space_net_solvers` preserve float32 inputs
+        only when called directly: their stopping criterion on the
+        decrease of the energy can take many more iterations to be met in
+        single precision.
         """
         check_params(self.__dict__)
         # sanity check on params
@@ -869,6 +876,8 @@ class BaseSpaceNet(CacheMixin, LinearRegression):
         self.masker_ = check_embedded_masker(self, masker_type="nii")
         X = self.masker_.fit_transform(X)
 
+        # the solvers stop on the energy decrease, which takes many more
+        # iterations to reach the default tolerance in float32
         X, y = check_X_y(
             X,
             y,
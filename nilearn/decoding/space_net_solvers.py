@@ -50,10 +50,11 @@ def _squared_loss_and_spatial_grad(X, y, w, mask, grad_weight):
         Value of Graph-Net objective.
     """
     data_section = np.dot(X, w) - y
-    grad_buffer = np.zeros(mask.shape)
+    grad_buffer = np.zeros(mask.shape, dtype=w.dtype)
     grad_buffer[mask] = w
-    grad_mask = np.tile(mask, [mask.ndim] + [1] * mask.ndim)
-    grad_section = gradient(grad_buffer)[grad_mask]
+    # the gradient is taken over the whole volume, consistently with
+    # _squared_loss_and_spatial_grad_derivative
+    grad_section = gradient(grad_buffer).ravel()
     return 0.5 * (
         np.dot(data_section, data_section)
         + grad_weight * np.dot(grad_section, grad_section)
@@ -83,7 +84,7 @@ def _squared_loss_and_spatial_grad_derivative(X, y, w, mask, grad_weight):
         Derivative of _squared_loss_and_spatial_grad function.
     """
     data_section = np.dot(X, w) - y
-    image_buffer = np.zeros(mask.shape)
+    image_buffer = np.zeros(mask.shape, dtype=w.dtype)
     image_buffer[mask] = w
     return (
         np.dot(X.T, data_section)
@@ -117,10 +118,10 @@ def _graph_net_data_function(X, w, mask, grad_weight):
         Data-fit term augmented with design matrix augmented with
         nabla operator (for spatial gradient).
     """
-    data_buffer = np.zeros(mask.shape)
+    data_buffer = np.zeros(mask.shape, dtype=w.dtype)
     data_buffer[mask] = w
     w_g = grad_weight * gradient(data_buffer)
-    out = np.ndarray(X.shape[0] + mask.ndim * X.shape[1])
+    out = np.ndarray(X.shape[0] + mask.ndim * X.shape[1], dtype=w.dtype)
     out[: X.shape[0]] = X.dot(w)
     out[X.shape[0] :] = np.concatenate(
         tuple(w_g[i][mask] for i in range(mask.ndim))
@@ -158,7 +159,7 @@ def _graph_net_adjoint_data_function(X, w, adjoint_mask, grad_weight):
     """
     n_samples, _ = X.shape
     out = X.T.dot(w[:n_samples])
-    div_buffer = np.zeros(adjoint_mask.shape)
+    div_buffer = np.zeros(adjoint_mask.shape, dtype=w.dtype)
     div_buffer[adjoint_mask] = w[n_samples:]
     out -= grad_weight * divergence(div_buffer)[adjoint_mask[0]]
     return out
@@ -234,10 +235,11 @@ def _logistic_data_loss_and_spatial_grad(X, y, w, mask, grad_weight):
     """Compute the smooth part of the Graph-Net objective, \
     with logistic loss.
     """
-    grad_buffer = np.zeros(mask.shape)
+    grad_buffer = np.zeros(mask.shape, dtype=w.dtype)
     grad_buffer[mask] = w[:-1]
-    grad_mask = np.array([mask for _ in range(mask.ndim)])
-    grad_section = gradient(grad_buffer)[grad_mask]
+    # the gradient is taken over the whole volume, consistently with
+    # _logistic_data_loss_and_spatial_grad_derivative
+    grad_section = gradient(grad_buffer).ravel()
     return logistic_loss(X, y, w) + 0.5 * grad_weight * np.dot(
         grad_section, grad_section
     )
@@ -247,7 +249,7 @@ def _logistic_data_loss_and_spatial_grad_derivative(
     X, y, w, mask, grad_weight
 ):
     """Compute the derivative of _logistic_loss_and_spatial_grad."""
-    image_buffer = np.zeros(mask.shape)
+    image_buffer = np.zeros(mask.shape, dtype=w.dtype)
     image_buffer[mask] = w[:-1]
     data_section = logistic_loss_grad(X, y, w)
     data_section[:-1] = (
@@ -257,6 +259,190 @@ def _logistic_data_loss_and_spatial_grad_derivative(
     return data_section
 
 
+def _graph_net_screened_solve(
+    solver,
+    smooth_grad,
+    lipschitz_constant_func,
+    X,
+    y,
+    alpha,
+    l1_ratio,
+    mask,
+    init,
+    fit_intercept=False,
+    callback=None,
+    lipschitz_constant=None,
+    **kwargs,
+):
+    """Solve a Graph-Net problem on a screened working set of features.
+
+    The working set holds the voxels that are nonzero in the solution or
+    in the FISTA extrapolation point of the previous point of the
+    regularization path, and those whose gradient of the smooth part at
+    that point is already at least the l1 weight of the current alpha,
+    i.e. whose KKT condition would be violated if the previous solution
+    was kept for the current problem.
+
+    Since the spatial gradient is computed on the full volume, fixing the
+    discarded coefficients to zero is the same as solving on the mask
+    restricted to the kept voxels. The reduced problem is solved with the
+    step size and the momentum of the full problem, so that its iterates
+    are those of the full problem as long as the discarded coefficients
+    stay at zero. The KKT conditions of the full problem are checked
+    afterwards and violating voxels are added to the working set before
+    solving again, so the screening does not change the solution.
+
+    Parameters
+    ----------
+    solver : callable
+        Graph-Net solver without screening.
+
+    smooth_grad : callable(X, y, w, mask, grad_weight) -> ndarray
+        Gradient of the smooth part of the energy.
+
+    lipschitz_constant_func : callable(X, mask, grad_weight) -> float
+        Lipschitz constant of ``smooth_grad``, as used by ``solver``.
+
+    init : :obj:`dict`
+        Warm start information returned by the solver at the previous
+        point of the path. Must have the keys "w" and "grad".
+
+    fit_intercept : :obj:`bool`, default=False
+        Whether the last coefficient is an unpenalized intercept.
+
+    Returns
+    -------
+    w : ndarray
+        Solution vector of the full problem.
+
+    objective : :obj:`list` of floats
+        Objective function (fval) computed on every iteration.
+
+    solver_info : :obj:`dict`
+        Solver information, for warm start.
+    """
+    n_features = X.shape[1]
+    l1_weight = alpha * l1_ratio
+    grad_weight = alpha * (1.0 - l1_ratio)
+    if lipschitz_constant is None:
+        lipschitz_constant = lipschitz_constant_func(X, mask, grad_weight)
+
+    w = np.asarray(init["w"])
+    z = np.asarray(init.get("z", w))
+    grad = np.abs(init["grad"][:n_features])
+    active = grad >= l1_weight
+    active |= w[:n_features] != 0.0
+    active |= z[:n_features] != 0.0
+    # always keep something to fit
+    active[np.argmax(grad)] = True
+
+    def expand(sub_w):
+        out = np.zeros_like(w)
+        out[keep] = sub_w
+        return out
+
+    sub_callback = None
+    if callback is not None:
+
+        def sub_callback(variables):
+            return callback({"w": expand(variables["w"])})
+
+    sub_init = {k: v for k, v in init.items() if k not in ("w", "z", "grad")}
+    objective = []
+    while True:
+        # the intercept is never screened
+        keep = np.append(active, True) if fit_intercept else active
+        sub_mask = mask.copy()
+        sub_mask[mask] = active
+        sub_w, sub_objective, solver_info = solver(
+            X[:, active],
+            y,
+            alpha,
+            l1_ratio,
+            sub_mask,
+            init={**sub_init, "w": w[keep], "z": z[keep]},
+            callback=sub_callback,
+            lipschitz_constant=lipschitz_constant,
+            **kwargs,
+        )
+        objective.extend(sub_objective)
+        w = expand(sub_w)
+        z = expand(solver_info["z"])
+
+        # KKT check on the discarded features
+        grad = smooth_grad(X, y, w, mask, grad_weight)
+        violators = ~active & (np.abs(grad[:n_features]) > l1_weight)
+        if not violators.any():
+            break
+        active |= violators
+        sub_init = {
+            k: v for k, v in solver_info.items() if k not in ("w", "z")
+        }
+
+    solver_info.update(w=w, z=z, grad=grad)
+    return w, objective, solver_info
+
+
+def _graph_net_path_step(
+    solver,
+    smooth_grad,
+    lipschitz_constant_func,
+    X,
+    y,
+    alpha,
+    l1_ratio,
+    mask,
+    init=None,
+    fit_intercept=False,
+    **kwargs,
+):
+    """Solve a Graph-Net problem, screening features when warm started.
+
+    When ``init`` comes from a previous point of a regularization path,
+    the problem is solved on a screened working set of features. The
+    returned solver information holds what the next point needs to
+    screen in turn.
+    """
+    if init is not None and "grad" in init:
+        return _graph_net_screened_solve(
+            solver,
+            smooth_grad,
+            lipschitz_constant_func,
+            X,
+            y,
+            alpha,
+            l1_ratio,
+            mask,
+            init,
+            fit_intercept=fit_intercept,
+            **kwargs,
+        )
+
+    w, objective, solver_info = solver(
+        X, y, alpha, l1_ratio, mask, init=init, **kwargs
+    )
+    solver_info["grad"] = smooth_grad(X, y, w, mask, alpha * (1.0 - l1_ratio))
+    return w, objective, solver_info
+
+
+def _graph_net_squared_loss_lipschitz_constant(X, mask, grad_weight):
+    """Compute the Lipschitz constant used by the Graph-Net regression \
+    solver.
+    """
+    # it's always a good idea to use something a bit bigger
+    return 1.05 * _squared_loss_derivative_lipschitz_constant(
+        X, mask, grad_weight
+    )
+
+
+def _graph_net_logistic_lipschitz_constant(X, mask, grad_weight):
+    """Compute the Lipschitz constant used by the Graph-Net classification \
+    solver.
+    """
+    # it's always a good idea to use somethx a bit bigger
+    return 1.1 * _logistic_derivative_lipschitz_constant(X, mask, grad_weight)
+
+
 def graph_net_squared_loss(
     X,
     y,
@@ -275,6 +461,10 @@ def graph_net_squared_loss(
     This function invokes the mfista backend (from fista.py) to solve the
     underlying optimization problem.
 
+    When warm started from the solver information of a previous point
+    of a regularization path, inactive voxels are screened out using the
+    KKT conditions (see ``_graph_net_screened_solve``).
+
     Returns
     -------
     w : ndarray, shape (n_features,)
@@ -287,7 +477,43 @@ def graph_net_squared_loss(
         Objective function (fval) computed on every iteration.
 
     """
+    return _graph_net_path_step(
+        _graph_net_squared_loss,
+        _squared_loss_and_spatial_grad_derivative,
+        _graph_net_squared_loss_lipschitz_constant,
+        X,
+        y,
+        alpha,
+        l1_ratio,
+        mask,
+        init=init,
+        max_iter=max_iter,
+        tol=tol,
+        callback=callback,
+        lipschitz_constant=lipschitz_constant,
+        verbose=verbose,
+    )
+
+
+def _graph_net_squared_loss(
+    X,
+    y,
+    alpha,
+    l1_ratio,
+    mask,
+    init=None,
+    max_iter=1000,
+    tol=1e-4,
+    callback=None,
+    lipschitz_constant=None,
+    verbose=0,
+):
+    """Solve the Graph-Net regression problem, without screening."""
     _, n_features = X.shape
+    # computations are carried in the floating point type of X, which
+    # numpy scalars (e.g. from the alpha grid) would upcast
+    y = np.asarray(y, dtype=X.dtype)
+    alpha, l1_ratio = float(alpha), float(l1_ratio)
 
     # misc
     model_size = n_features
@@ -295,13 +521,10 @@ def graph_net_squared_loss(
     grad_weight = alpha * (1.0 - l1_ratio)
 
     if lipschitz_constant is None:
-        lipschitz_constant = _squared_loss_derivative_lipschitz_constant(
+        lipschitz_constant = _graph_net_squared_loss_lipschitz_constant(
             X, mask, grad_weight
         )
 
-        # it's always a good idea to use something a bit bigger
-        lipschitz_constant *= 1.05
-
     # smooth part of energy, and gradient thereof
     def f1(w):
         return _squared_loss_and_spatial_grad(X, y, w, mask, grad_weight)
@@ -334,6 +557,7 @@ def graph_net_squared_loss(
         max_iter=max_iter,
         verbose=verbose,
         init=init,
+        dtype=X.dtype,
     )
 
 
@@ -356,6 +580,10 @@ def graph_net_logistic(
     This function invokes the mfista backend (from fista.py) to solve the
     underlying optimization problem.
 
+    When warm started from the solver information of a previous point
+    of a regularization path, inactive voxels are screened out using the
+    KKT conditions (see ``_graph_net_screened_solve``).
+
     Returns
     -------
     w : ndarray of shape (n_features,)
@@ -370,7 +598,44 @@ def graph_net_logistic(
         Cost function (fval) computed on every iteration.
 
     """
+    return _graph_net_path_step(
+        _graph_net_logistic,
+        _logistic_data_loss_and_spatial_grad_derivative,
+        _graph_net_logistic_lipschitz_constant,
+        X,
+        y,
+        alpha,
+        l1_ratio,
+        mask,
+        init=init,
+        fit_intercept=True,
+        max_iter=max_iter,
+        tol=tol,
+        callback=callback,
+        lipschitz_constant=lipschitz_constant,
+        verbose=verbose,
+    )
+
+
+def _graph_net_logistic(
+    X,
+    y,
+    alpha,
+    l1_ratio,
+    mask,
+    init=None,
+    max_iter=1000,
+    tol=1e-4,
+    callback=None,
+    verbose=0,
+    lipschitz_constant=None,
+):
+    """Solve the Graph-Net classification problem, without screening."""
     _, n_features = X.shape
+    # computations are carried in the floating point type of X, which
+    # numpy scalars (e.g. from the alpha grid) would upcast
+    y = np.asarray(y, dtype=X.dtype)
+    alpha, l1_ratio = float(alpha), float(l1_ratio)
 
     # misc
     model_size = n_features + 1
@@ -378,13 +643,10 @@ def graph_net_logistic(
     grad_weight = alpha * (1 - l1_ratio)
 
     if lipschitz_constant is None:
-        lipschitz_constant = _logistic_derivative_lipschitz_constant(
+        lipschitz_constant = _graph_net_logistic_lipschitz_constant(
             X, mask, grad_weight
         )
 
-        # it's always a good idea to use somethx a bit bigger
-        lipschitz_constant *= 1.1
-
     # smooth part of energy, and gradient of
     def f1(w):
         return _logistic_data_loss_and_spatial_grad(X, y, w, mask, grad_weight)
@@ -420,6 +682,7 @@ def graph_net_logistic(
         max_iter=max_iter,
         verbose=verbose,
         init=init,
+        dtype=X.dtype,
     )
 
 
@@ -526,7 +789,11 @@ def tvl1_solver(
     lipschitz_constant : :obj:`float`, default=None
         Lipschitz constant (i.e an upper bound of) of gradient of smooth part
         of the energy being minimized. If no value is specified (None),
-        then it will be calculated.
+        then it is taken from `init` when warm starting, or calculated.
+
+    init : :obj:`dict`, default=None
+        Solver information returned by a previous call on the same data,
+        for warm start.
 
     callback : callable(dict) -> bool, default=None
         Function called at the end of every energy descendent iteration of the
@@ -558,6 +825,11 @@ def tvl1_solver(
     # in logistic regression, we fit the intercept explicitly
     w_size = X.shape[1] + int(loss == "logistic")
 
+    # computations are carried in the floating point type of X, which
+    # numpy scalars (e.g. from the alpha grid) would upcast
+    y = np.asarray(y, dtype=X.dtype)
+    alpha, l1_ratio = float(alpha), float(l1_ratio)
+
     def unmaskvec(w):
         if loss == "mse":
             return unmask_from_to_3d_array(w, mask)
@@ -582,7 +854,10 @@ def tvl1_solver(
     def total_energy(w):
         return _tvl1_objective(X, y, w, alpha, l1_ratio, mask, loss=loss)
 
-    # Lipschitz constant of f1_grad
+    # Lipschitz constant of f1_grad: it does not depend on alpha nor
+    # l1_ratio, so it is computed only once along a regularization path
+    if lipschitz_constant is None and init is not None:
+        lipschitz_constant = init.get("lipschitz_constant")
     if lipschitz_constant is None:
         if loss == "mse":
             lipschitz_constant = 1.05 * spectral_norm_squared(X)
@@ -636,6 +911,8 @@ def tvl1_solver(
         verbose=verbose,
         max_iter=max_iter,
         callback=callback,
+        dtype=X.dtype,
     )
+    init["lipschitz_constant"] = lipschitz_constant
 
     return w, obj, init
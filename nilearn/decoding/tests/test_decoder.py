@@ -14,6 +14,7 @@ Order of tests from top to bottom:
 
 import collections
 import numbers
+import threading
 import warnings
 
 import numpy as np
@@ -74,6 +75,7 @@ from nilearn.decoding.decoder import (
     _wrap_param_grid,
 )
 from nilearn.decoding.tests.test_same_api import to_niimgs
+from nilearn.image import iter_img
 from nilearn.maskers import NiftiMasker, SurfaceMasker
 
 N_SAMPLES = 80
@@ -1041,6 +1043,151 @@ def test_decoder_multiclass_warnings(multiclass_data):
         model.fit(X, y)
 
 
+@pytest.mark.parametrize("data", ["binary", "multiclass"])
+def test_decoder_permutation_test(data, binary_classification_data):
+    """Check the permutation test of the cross-validated score."""
+    if data == "binary":
+        X, y, mask = binary_classification_data
+    else:
+        X, y, mask = _make_multiclass_classification_test_data(n_samples=40)
+    model = Decoder(mask=mask, cv=3, screening_percentile=100)
+    model.fit(X, y)
+
+    null_scores, pvalue = model.permutation_test(
+        X, y, n_permutations=4, random_state=0
+    )
+
+    assert null_scores.shape == (4,)
+    # the data are informative: no permutation does as well
+    assert pvalue == pytest.approx(1 / 5)
+
+    # images are masked once, so already masked data give the same results
+    null_scores_masked, _ = model.permutation_test(
+        model.masker_.transform(X), y, n_permutations=4, random_state=0
+    )
+
+    assert_array_almost_equal(null_scores, null_scores_masked)
+
+
+def test_decoder_regressor_permutation_test_groups(regression_data):
+    """Check that permutations stay within groups."""
+    X, y, mask = regression_data
+    groups = np.repeat([0, 1], len(y) // 2)
+    model = DecoderRegressor(mask=mask, cv=KFold(n_splits=3))
+    model.fit(X, y)
+
+    # a single sample per group: permutations keep the target unchanged
+    null_scores, pvalue = model.permutation_test(
+        X, y, groups=np.arange(len(y)), n_permutations=2, random_state=0
+    )
+
+    assert_array_almost_equal(
+        null_scores, np.mean(model.cv_scores_["beta"]) * np.ones(2)
+    )
+    assert pvalue == 1.0
+
+    null_scores, _ = model.permutation_test(
+        X, y, groups=groups, n_permutations=2, random_state=0
+    )
+
+    assert null_scores.shape == (2,)
+
+
+def test_decoder_permutation_test_errors(tiny_binary_classification_data):
+    X, y, mask = tiny_binary_classification_data
+    model = Decoder(mask=mask, cv=2)
+
+    with pytest.raises(ValueError, match="not fitted"):
+        model.permutation_test(X, y)
+
+    model.fit(X, y)
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        model.permutation_test(X, y, n_permutations=0)
+    with pytest.raises(ValueError, match="decoder was fitted"):
+        model.permutation_test(model.masker_.transform(X)[:10], y[:10])
+
+
+@pytest.mark.parametrize("method", ["predict", "decision_function"])
+def test_decoder_predict_batches(tmp_path, binary_classification_data, method):
+    """Check that batched predictions match the ones on the whole data."""
+    X, y, mask = binary_classification_data
+    # standardization across samples would be done per batch
+    model = Decoder(mask=mask, cv=2, standardize=False)
+    model.fit(X, y)
+    expected = getattr(model, method)(X)
+
+    # lazily sliced 4D file, in memory 4D image, iterable of 3D images and
+    # masked data
+    X_file = tmp_path / "X.nii.gz"
+    save(X, X_file)
+    for X_ in [
+        X_file,
+        X,
+        (img for img in iter_img(X)),
+        model.masker_.transform(X),
+    ]:
+        batches = list(model.predict_batches(X_, batch_size=7, method=method))
+
+        assert len(batches) == int(np.ceil(len(y) / 7))
+        assert all(len(batch) <= 7 for batch in batches)
+        assert_array_almost_equal(np.concatenate(batches), expected)
+
+
+def test_decoder_predict_batches_read_in_worker_thread(
+    binary_classification_data,
+):
+    """Check that the images are read in the prefetching thread."""
+    X, y, mask = binary_classification_data
+    model = Decoder(mask=mask, cv=2, standardize=False)
+    model.fit(X, y)
+    threads = []
+
+    def read_images():
+        for img in iter_img(X):
+            threads.append(threading.current_thread())
+            yield img
+
+    batches = list(model.predict_batches(read_images(), batch_size=7))
+
+    assert sum(len(batch) for batch in batches) == X.shape[-1]
+    assert threading.main_thread() not in threads
+
+
+def test_decoder_predict_batches_regression_and_dummy(regression_data):
+    X, y, mask = regression_data
+    model = DecoderRegressor(mask=mask, cv=2, standardize=False)
+    model.fit(X, y)
+
+    assert_array_almost_equal(
+        np.concatenate(list(model.predict_batches(X, batch_size=30))),
+        model.predict(X),
+    )
+
+    model = DecoderRegressor(estimator="dummy_regressor", mask=mask, cv=2)
+    model.fit(X, y)
+
+    assert_array_almost_equal(
+        np.concatenate(list(model.predict_batches(X, batch_size=30))),
+        model.predict(X),
+    )
+
+
+def test_decoder_predict_batches_errors(tiny_binary_classification_data):
+    X, y, mask = tiny_binary_classification_data
+    model = Decoder(mask=mask, cv=2)
+
+    with pytest.raises(ValueError, match="not fitted"):
+        next(model.predict_batches(X))
+
+    model.fit(X, y)
+
+    with pytest.raises(ValueError, match="'method' must be one of"):
+        next(model.predict_batches(X, method="score"))
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        next(model.predict_batches(X, batch_size=0))
+
+
 def test_decoder_tags_classification():
     """Check value returned by _more_tags."""
     model = Decoder()
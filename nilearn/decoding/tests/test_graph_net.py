@@ -17,6 +17,8 @@ from nilearn.decoding.space_net_solvers import (
     _squared_loss_and_spatial_grad,
     _squared_loss_and_spatial_grad_derivative,
     _squared_loss_derivative_lipschitz_constant,
+    graph_net_logistic,
+    graph_net_squared_loss,
     mfista,
 )
 from nilearn.decoding.tests._testing import create_graph_net_simulation_data
@@ -183,6 +185,43 @@ def test_logistic_gradient_at_simple_points():
         )
 
 
+@pytest.mark.parametrize(
+    "loss, loss_derivative",
+    [
+        (
+            _squared_loss_and_spatial_grad,
+            _squared_loss_and_spatial_grad_derivative,
+        ),
+        (
+            _logistic_data_loss_and_spatial_grad,
+            _logistic_data_loss_and_spatial_grad_derivative,
+        ),
+    ],
+)
+def test_gradient_with_holes_in_mask(rng, loss, loss_derivative):
+    """Check the energy is consistent with its derivative \
+    when the spatial gradient crosses the border of the mask.
+    """
+    mask = np.ones((4, 4, 4), dtype=bool)
+    mask[:2, :2, :2] = False
+    X = rng.standard_normal((10, mask.sum()))
+    y = np.sign(rng.standard_normal(10))
+    w = rng.standard_normal(mask.sum())
+    if loss is _logistic_data_loss_and_spatial_grad:
+        # Add the intercept
+        w = np.append(w, 0)
+
+    def func(w):
+        return loss(X, y, w, mask, 1.0)
+
+    def func_grad(w):
+        return loss_derivative(X, y, w, mask, 1.0)
+
+    assert_almost_equal(
+        sp.optimize.check_grad(func, func_grad, w), 0, decimal=3
+    )
+
+
 def test_squared_loss_derivative_lipschitz_constant(rng):
     """Test Lipschitz-continuity of the derivative of squared_loss loss \
     function.
@@ -318,3 +357,29 @@ def test_mfista_solver_graph_net_no_l1_term():
     solution = np.array([-10, 5])
 
     assert_almost_equal(estimate_solution, solution, decimal=4)
+
+
+@pytest.mark.parametrize(
+    "solver, task",
+    [
+        (graph_net_squared_loss, "regression"),
+        (graph_net_logistic, "classification"),
+    ],
+)
+def test_graph_net_strong_rule_screening(solver, task):
+    """Check that screening along the path does not change the solution."""
+    X, y, _, mask, _, _ = _make_data(task=task, size=5)
+    l1_ratio = 0.8
+    alpha_max = np.abs(X.T.dot(y)).max() / l1_ratio
+    alphas = alpha_max * np.array([0.5, 0.2])
+
+    _, _, init = solver(X, y, alphas[0], l1_ratio, mask, tol=1e-10)
+    assert "grad" in init
+    screened_w, _, screened_init = solver(
+        X, y, alphas[1], l1_ratio, mask, init=init, tol=1e-10
+    )
+    w, _, _ = solver(X, y, alphas[1], l1_ratio, mask, tol=1e-10)
+
+    assert screened_w.shape == w.shape
+    assert screened_init["w"].shape == w.shape
+    np.testing.assert_allclose(screened_w, w, atol=1e-3)
@@ -59,6 +59,36 @@ def test_3d_gradient_id(l1_ratio):
     assert_array_equal(gid.shape, [img.ndim + 1, *img.shape])
 
 
+@pytest.mark.parametrize("ndim", range(1, 4))
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_grad_div_out_buffers(rng, ndim, dtype, size=4):
+    """Check that gradient_id and divergence_id preserve the dtype \
+    and give the same results when writing into reused buffers.
+    """
+    shape = tuple([size] * ndim)
+    x = rng.normal(size=shape).astype(dtype)
+
+    grad = gradient_id(x, l1_ratio=0.5)
+    div = divergence_id(grad, l1_ratio=0.5)
+
+    assert grad.dtype == dtype
+    assert div.dtype == dtype
+
+    # buffers filled with garbage from a previous iteration
+    grad_buffer = rng.normal(size=[ndim + 1, *shape]).astype(dtype)
+    div_buffer = rng.normal(size=shape).astype(dtype)
+
+    out = gradient_id(x, l1_ratio=0.5, out=grad_buffer)
+
+    assert out is grad_buffer
+    assert_array_equal(out, grad)
+
+    out = divergence_id(grad, l1_ratio=0.5, out=div_buffer)
+
+    assert out is div_buffer
+    assert_array_equal(out, div)
+
+
 def test_logistic_loss_derivative(rng, n_samples=4, n_features=10, decimal=5):
     X = rng.standard_normal((n_samples, n_features))
     y = rng.standard_normal(n_samples)
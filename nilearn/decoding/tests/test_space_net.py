@@ -10,6 +10,7 @@ from sklearn.linear_model._coordinate_descent import _alpha_grid
 from sklearn.metrics import accuracy_score
 
 from nilearn._utils.param_validation import adjust_screening_percentile
+from nilearn.decoding import space_net_solvers
 from nilearn.decoding.space_net import (
     BaseSpaceNet,
     SpaceNetClassifier,
@@ -25,7 +26,7 @@ from nilearn.decoding.space_net_solvers import (
     graph_net_squared_loss,
 )
 from nilearn.decoding.tests._testing import create_graph_net_simulation_data
-from nilearn.image import get_data
+from nilearn.image import get_data, new_img_like
 
 from .test_same_api import to_niimgs
 
@@ -386,6 +387,54 @@ def test_lasso_vs_graph_net():
     assert_almost_equal(graph_net_perf, lasso_perf, decimal=2)
 
 
+@pytest.mark.parametrize(
+    "model, solver, task",
+    [
+        (SpaceNetRegressor, "graph_net_squared_loss", "regression"),
+        (SpaceNetClassifier, "graph_net_logistic", "classification"),
+    ],
+)
+def test_graph_net_screened_path_same_as_unscreened(
+    monkeypatch, model, solver, task
+):
+    """Check that screening voxels along the path does not change \
+    the selected alphas nor the coefficients.
+    """
+    size = 4
+    X_, y, _, _ = create_graph_net_simulation_data(
+        snr=1.0,
+        n_samples=20,
+        size=size,
+        n_points=5,
+        random_state=42,
+        task=task,
+    )
+    X, mask = to_niimgs(X_, [size] * 3)
+    params = {
+        "mask": mask,
+        "penalty": "graph-net",
+        "l1_ratios": 0.5,
+        "n_alphas": 5,
+        "cv": 2,
+        "screening_percentile": 100.0,
+        "tol": 1e-10,
+        "max_iter": 10000,
+    }
+
+    screened = model(**params).fit(X, y)
+    # the solvers without screening never receive what is needed to screen
+    monkeypatch.setattr(
+        f"nilearn.decoding.space_net.{solver}",
+        getattr(space_net_solvers, f"_{solver}"),
+    )
+    unscreened = model(**params).fit(X, y)
+
+    assert_array_equal(
+        screened.best_model_params_, unscreened.best_model_params_
+    )
+    np.testing.assert_allclose(screened.coef_, unscreened.coef_, atol=1e-4)
+
+
 def test_crop_mask(rng):
     mask = np.zeros((3, 4, 5), dtype=bool)
     box = mask[:2, :3, :4]
@@ -488,6 +537,21 @@ def test_space_net_one_alpha_no_crash(model):
     model(n_alphas=2, mask=mask, alphas=None).fit(X, y)
 
 
+@pytest.mark.parametrize("model", [SpaceNetRegressor, SpaceNetClassifier])
+def test_space_net_float32_images_fitted_in_float64(model):
+    """Check that float32 images are fitted as float64 data."""
+    iris = load_iris()
+    X, y = iris.data, iris.target
+    X, mask = to_niimgs(X, [2, 2, 2])
+    X_32 = new_img_like(X, get_data(X).astype(np.float32))
+
+    coef = model(n_alphas=2, mask=mask).fit(X, y).coef_
+    coef_32 = model(n_alphas=2, mask=mask).fit(X_32, y).coef_
+
+    assert coef_32.dtype == np.float64
+    np.testing.assert_allclose(coef_32, coef, rtol=1e-5)
+
+
 @pytest.mark.parametrize("model", [SpaceNetRegressor, SpaceNetClassifier])
 def test_checking_inputs_length(model):
     iris = load_iris()
@@ -38,3 +38,30 @@ def test_tvl1_solver_raises_value_error_if_invalid_loss():
         tvl1_solver(
             np.array([[1]]), None, None, None, None, loss="invalidloss"
         )
+
+
+@pytest.mark.parametrize("loss", ["mse", "logistic"])
+def test_tvl1_solver_float32(rng, loss, size=4, n_samples=10):
+    """Check that float32 data are solved for in float32 and that \
+    the Lipschitz constant is reused when warm starting.
+    """
+    mask = np.ones([size] * 3, dtype=bool)
+    X = rng.standard_normal((n_samples, mask.sum())).astype(np.float32)
+    y = np.sign(rng.standard_normal(n_samples))
+
+    w, _, init = tvl1_solver(
+        X, y, 0.1, 0.5, mask, loss=loss, max_iter=10, verbose=0
+    )
+
+    assert w.dtype == np.float32
+    assert "lipschitz_constant" in init
+
+    # an absurdly large cached constant gives tiny steps:
+    # the solution stays at the initialization
+    init = {"w": w, "lipschitz_constant": 1e30}
+    w_warm, _, _ = tvl1_solver(
+        X, y, 0.05, 0.5, mask, loss=loss, init=init, max_iter=2, verbose=0
+    )
+
+    assert w_warm.dtype == np.float32
+    np.testing.assert_allclose(w_warm, w, atol=1e-6)
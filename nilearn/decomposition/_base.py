@@ -12,7 +12,7 @@ from pathlib import Path
 from string import Template
 
 import numpy as np
-from joblib import Memory, Parallel, delayed
+from joblib import Memory, Parallel, delayed, effective_n_jobs
 from nibabel import Nifti1Image
 from scipy import linalg
 from sklearn.base import BaseEstimator, TransformerMixin
@@ -144,6 +144,8 @@ def _mask_and_reduce(
     memory_level=0,
     memory=None,
     n_jobs=1,
+    n_group_components=None,
+    do_cca=False,
 ):
     """Mask and reduce provided 4D images with given masker.
 
@@ -152,6 +154,10 @@ def _mask_and_reduce(
     the concatenation of data is returned, either as an ndarray or a memorymap
     (useful for big datasets that do not fit in memory).
 
+    If n_group_components is given, the reduced data are not concatenated:
+    the subjects are reduced by batches of n_jobs, and each batch is folded
+    into the leading components of an incremental SVD of the group data.
+
     Parameters
     ----------
     masker : :obj:`~nilearn.maskers.NiftiMasker` or \
@@ -192,10 +198,20 @@ def _mask_and_reduce(
         The number of CPUs to use to do the computation. -1 means
         'all CPUs', -2 'all CPUs but one', and so on.
 
+    n_group_components : integer, optional
+        Number of group components kept by the incremental SVD.
+        If None, the reduced data of all the subjects are concatenated.
+
+    do_cca : boolean, default=False
+        If True and n_group_components is given, the reduced data of each
+        subject are normalized before being folded, as done at group level by
+        the Canonical Correlation Analysis of _MultiPCA.
+
     Returns
     -------
     data : ndarray or memorymap
-        Concatenation of reduced data.
+        Concatenation of reduced data, or leading group components scaled by
+        their singular values if n_group_components is given.
 
     """
     if memory is None:
@@ -229,19 +245,40 @@ def _mask_and_reduce(
         # samples based on the reduction_ratio
         n_samples = None
 
-    data_list = Parallel(n_jobs=n_jobs)(
-        delayed(_mask_and_reduce_single)(
-            masker,
-            img,
-            confound,
-            reduction_ratio=reduction_ratio,
-            n_samples=n_samples,
-            memory=memory,
-            memory_level=memory_level,
-            random_state=random_state,
+    def reduce_subjects(imgs_and_confounds):
+        return Parallel(n_jobs=n_jobs)(
+            delayed(_mask_and_reduce_single)(
+                masker,
+                img,
+                confound,
+                reduction_ratio=reduction_ratio,
+                n_samples=n_samples,
+                memory=memory,
+                memory_level=memory_level,
+                random_state=random_state,
+            )
+            for img, confound in imgs_and_confounds
         )
-        for img, confound in zip(imgs, confounds)
-    )
+
+    if n_group_components is not None:
+        # Only one batch of reduced subjects is in memory at a time
+        batch_size = effective_n_jobs(n_jobs)
+        imgs_and_confounds = zip(imgs, confounds)
+        group_data = None
+        while batch := list(itertools.islice(imgs_and_confounds, batch_size)):
+            data_list = reduce_subjects(batch)
+            del batch
+            if do_cca:
+                for subject_data in data_list:
+                    S = np.sqrt(np.sum(subject_data**2, axis=1))
+                    S[S == 0] = 1
+                    subject_data /= S[:, np.newaxis]
+            group_data = _fold_group_svd(
+                group_data, data_list, n_group_components
+            )
+        return group_data
+
+    data_list = reduce_subjects(zip(imgs, confounds))
 
     subject_n_samples = [subject_data.shape[0] for subject_data in data_list]
 
@@ -301,6 +338,40 @@ def _mask_and_reduce_single(
     return U
 
 
+def _fold_group_svd(group_data, data_list, n_components):
+    """Fold reduced subject data into the leading components of the group.
+
+    Parameters
+    ----------
+    group_data : array, shape (n_components, n_features) or None
+        Leading right singular vectors of the data folded so far, scaled by
+        their singular values. None if no data was folded yet.
+
+    data_list : list of arrays, shape (n_samples_i, n_features)
+        Reduced data of the new subjects.
+
+    n_components : integer
+        Number of group components to keep.
+
+    Returns
+    -------
+    group_data : array, shape (n_components, n_features)
+        Leading group components scaled by their singular values. Has fewer
+        rows if less than n_components samples were folded so far.
+
+    """
+    if group_data is not None:
+        data_list = [group_data, *data_list]
+    data = np.vstack(data_list)
+    if data.shape[0] <= n_components:
+        return data
+    # The stacked data have few rows: the left singular vectors are the
+    # eigenvectors of their small Gram matrix, and S * V = U.T @ data
+    _, U = linalg.eigh(np.dot(data, data.T).astype(np.float64))
+    U = U[:, : -n_components - 1 : -1].astype(data.dtype)
+    return np.dot(U.T, data)
+
+
 @fill_doc
 class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
     """Base class for matrix factorization based decomposition estimators.
@@ -395,6 +466,8 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
 
     %(verbose0)s
 
+    %(n_group_components)s
+
     %(base_decomposition_attributes)s
     """
 
@@ -418,6 +491,7 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
         memory_level=0,
         n_jobs=1,
         verbose=0,
+        n_group_components=None,
     ):
         self.n_components = n_components
         self.random_state = random_state
@@ -438,6 +512,7 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
         self.memory_level = memory_level
         self.n_jobs = n_jobs
         self.verbose = verbose
+        self.n_group_components = n_group_components
 
     def _more_tags(self):
         """Return estimator tags.
@@ -496,7 +571,23 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
         del y
         # Base fit for decomposition estimators : compute the embedded masker
         check_params(self.__dict__)
+        imgs = self._check_imgs(imgs, confounds)
+        self._fit_masker(imgs)
 
+        # _mask_and_reduce step for decomposition estimators i.e.
+        # MultiPCA, CanICA and Dictionary Learning
+        data = self._load_data(imgs, confounds)
+        self._raw_fit(data)
+
+        self._fit_maps_masker()
+
+        return self
+
+    def _check_imgs(self, imgs, confounds):
+        """Check the images and confounds passed to fit.
+
+        Returns the images as a list.
+        """
         if (
             isinstance(imgs, str)
             and nilearn.EXPAND_PATH_WILDCARDS
@@ -527,6 +618,19 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
                 f"must match number of images ({len(imgs)=})."
             )
 
+        if (
+            self.n_group_components is not None
+            and self.n_group_components < self.n_components
+        ):
+            raise ValueError(
+                "'n_group_components' must be greater than or equal to "
+                f"'n_components'. Got {self.n_group_components=} and "
+                f"{self.n_components=}."
+            )
+        return imgs
+
+    def _fit_masker(self, imgs):
+        """Create and fit the embedded masker."""
         masker_type = "multi_nii"
         if isinstance(self.mask, (SurfaceMasker, SurfaceImage)) or any(
             isinstance(x, SurfaceImage) for x in imgs
@@ -544,10 +648,10 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
             self.masker_.fit()
         self.mask_img_ = self.masker_.mask_img_
 
-        # _mask_and_reduce step for decomposition estimators i.e.
-        # MultiPCA, CanICA and Dictionary Learning
+    def _load_data(self, imgs, confounds):
+        """Mask and reduce the images with the embedded masker."""
         logger.log("Loading data", self.verbose)
-        data = _mask_and_reduce(
+        return _mask_and_reduce(
             self.masker_,
             imgs,
             confounds=confounds,
@@ -556,11 +660,20 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
             memory=self.memory,
             memory_level=max(0, self.memory_level + 1),
             n_jobs=self.n_jobs,
+            n_group_components=self.n_group_components,
+            do_cca=self._normalize_subjects(),
         )
-        self._raw_fit(data)
 
-        # Create and fit appropriate MapsMasker for transform
-        # and inverse_transform
+    def _normalize_subjects(self):
+        """Return whether the subjects are normalized before being folded \
+        into the incremental group reduction.
+        """
+        return getattr(self, "do_cca", False)
+
+    def _fit_maps_masker(self):
+        """Create and fit the MapsMasker used by transform \
+        and inverse_transform.
+        """
         if isinstance(self.masker_, SurfaceMasker):
             self.maps_masker_ = SurfaceMapsMasker(
                 self.components_img_, self.masker_.mask_img_
@@ -575,8 +688,6 @@ class _BaseDecomposition(CacheMixin, TransformerMixin, BaseEstimator):
 
         self.n_elements_ = self.maps_masker_.n_elements_
 
-        return self
-
     @property
     def nifti_maps_masker_(self):
         # TODO: remove in 0.13
@@ -108,6 +108,8 @@ class _MultiPCA(_BaseDecomposition):
 
     %(verbose0)s
 
+    %(n_group_components)s
+
     %(base_decomposition_attributes)s
 
     %(multi_pca_attributes)s
@@ -135,6 +137,7 @@ class _MultiPCA(_BaseDecomposition):
         memory_level=0,
         n_jobs=1,
         verbose=0,
+        n_group_components=None,
     ):
         super().__init__(
             n_components=n_components,
@@ -155,13 +158,17 @@ class _MultiPCA(_BaseDecomposition):
             memory_level=memory_level,
             n_jobs=n_jobs,
             verbose=verbose,
+            n_group_components=n_group_components,
         )
 
         self.do_cca = do_cca
 
     def _raw_fit(self, data):
         """Process unmasked data directly."""
-        if self.do_cca:
+        # with n_group_components, the subjects were normalized
+        # before the group reduction
+        do_cca = self.do_cca and self.n_group_components is None
+        if do_cca:
             S = np.sqrt(np.sum(data**2, axis=1))
             S[S == 0] = 1
             data /= S[:, np.newaxis]
@@ -174,7 +181,7 @@ class _MultiPCA(_BaseDecomposition):
             random_state=self.random_state,
             n_iter=3,
         )
-        if self.do_cca:
+        if do_cca:
             data *= S[:, np.newaxis]
         self.components_ = components_.T
         if hasattr(self, "masker_"):
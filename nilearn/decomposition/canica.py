@@ -1,5 +1,6 @@
 """Canonical Independent Component Analysis."""
 
+import time
 import warnings as _warnings
 from operator import itemgetter
 
@@ -14,6 +15,24 @@ from nilearn._utils.logger import find_stack_level
 from nilearn.decomposition._multi_pca import _MultiPCA
 
 
+def _timed_fastica(components, random_state):
+    """Run FastICA on the components and time it.
+
+    Returns the independent maps, the number of iterations and the time taken.
+    The timing is part of the output, so that results loaded from the cache
+    report the time of the run that computed them.
+    """
+    start = time.perf_counter()
+    _, _, sources, n_iter = fastica(
+        components,
+        whiten="arbitrary-variance",
+        fun="cube",
+        random_state=random_state,
+        return_n_iter=True,
+    )
+    return sources.T, n_iter, time.perf_counter() - start
+
+
 @fill_doc
 class CanICA(_MultiPCA):
     """Perform :term:`Canonical Independent Component Analysis<CanICA>`.
@@ -114,10 +133,23 @@ class CanICA(_MultiPCA):
 
     %(verbose0)s
 
+    %(n_group_components)s
+
     %(base_decomposition_attributes)s
 
     %(multi_pca_attributes)s
 
+        init_times_ : numpy.ndarray of shape (n_init,)
+            Time in seconds taken by each run of FastICA. Runs loaded from
+            the cache report the time they took when they were computed.
+
+            .. versionadded:: 0.12.1
+
+        init_n_iter_ : numpy.ndarray of shape (n_init,)
+            Number of iterations of each run of FastICA.
+
+            .. versionadded:: 0.12.1
+
     References
     ----------
     .. footbibliography::
@@ -147,6 +179,7 @@ class CanICA(_MultiPCA):
         memory_level=0,
         n_jobs=1,
         verbose=0,
+        n_group_components=None,
     ):
         super().__init__(
             n_components=n_components,
@@ -168,6 +201,7 @@ class CanICA(_MultiPCA):
             memory_level=memory_level,
             n_jobs=n_jobs,
             verbose=verbose,
+            n_group_components=n_group_components,
         )
 
         self.threshold = threshold
@@ -181,20 +215,24 @@ class CanICA(_MultiPCA):
 
         seeds = random_state.randint(np.iinfo(np.int32).max, size=self.n_init)
         # Note: fastICA is very unstable, hence we use 64bit on it
-        results = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
-            delayed(self._cache(fastica, func_memory_level=2))(
-                components.astype(np.float64),
-                whiten="arbitrary-variance",
-                fun="cube",
-                random_state=seed,
+        components = components.astype(np.float64)
+        # The runs are independent: the components are converted once and
+        # memory mapped in the worker processes rather than copied
+        results = Parallel(
+            n_jobs=self.n_jobs, verbose=self.verbose, max_nbytes="1M"
+        )(
+            delayed(self._cache(_timed_fastica, func_memory_level=2))(
+                components, seed
             )
             for seed in seeds
         )
+        ica_maps_list, n_iters, times = zip(*results)
+        self.init_n_iter_ = np.asarray(n_iters)
+        self.init_times_ = np.asarray(times)
 
-        ica_maps_gen_ = (result[2].T for result in results)
         ica_maps_and_sparsities = (
             (ica_map, np.sum(np.abs(ica_map), axis=1).max())
-            for ica_map in ica_maps_gen_
+            for ica_map in ica_maps_list
         )
         ica_maps, _ = min(ica_maps_and_sparsities, key=itemgetter(-1))
 
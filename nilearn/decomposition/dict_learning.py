@@ -8,11 +8,13 @@ constitutes output maps
 import warnings
 
 import numpy as np
+from scipy import linalg
 from sklearn.decomposition import dict_learning_online
 from sklearn.linear_model import Ridge
 
 from nilearn._utils import fill_doc, logger
 from nilearn._utils.helpers import transfer_deprecated_param_vals
+from nilearn._utils.param_validation import check_params
 
 from ._base import _BaseDecomposition
 from .canica import CanICA
@@ -32,6 +34,53 @@ def _compute_loadings(components, data):
     return loadings
 
 
+def _update_code(code, A, B, alpha, max_iter=100, tol=1e-4):
+    """Solve the sparse coding of all voxels from sufficient statistics.
+
+    Minimizes, for each voxel v, 0.5 * c.T A c - c.T B[:, v] + alpha ||c||_1
+    with coordinate descent on the components, vectorized over the voxels.
+    This is the Lasso problem solved by dict_learning_online for the maps,
+    where A = D D.T and B = D X are accumulated over the time points.
+
+    Parameters
+    ----------
+    code : ndarray, shape (n_components, n_features)
+        Initial maps, updated in place.
+
+    A : ndarray, shape (n_components, n_components)
+        Gram matrix of the temporal dictionary.
+
+    B : ndarray, shape (n_components, n_features)
+        Product of the temporal dictionary and the data.
+
+    alpha : float
+        Sparsity controlling parameter.
+
+    max_iter : int, default=100
+        Maximum number of sweeps over the components.
+
+    tol : float, default=1e-4
+        Tolerance on the largest update relative to the largest coefficient.
+
+    Returns
+    -------
+    code : ndarray, shape (n_components, n_features)
+        The updated maps.
+    """
+    diagonal = np.diag(A)
+    for _ in range(max_iter):
+        max_update = 0.0
+        for j in np.flatnonzero(diagonal > 0):
+            residual = B[j] - A[j] @ code + diagonal[j] * code[j]
+            new = np.sign(residual) * np.maximum(np.abs(residual) - alpha, 0)
+            new /= diagonal[j]
+            max_update = max(max_update, np.max(np.abs(new - code[j])))
+            code[j] = new
+        if max_update <= tol * max(np.max(np.abs(code)), 1e-12):
+            break
+    return code
+
+
 @fill_doc
 class DictLearning(_BaseDecomposition):
     """Perform a map learning algorithm based on spatial component sparsity, \
@@ -145,6 +194,8 @@ class DictLearning(_BaseDecomposition):
 
     %(verbose0)s
 
+    %(n_group_components)s
+
     %(base_decomposition_attributes)s
 
     %(multi_pca_attributes)s
@@ -180,6 +231,7 @@ class DictLearning(_BaseDecomposition):
         verbose=0,
         memory=None,
         memory_level=0,
+        n_group_components=None,
     ):
         super().__init__(
             n_components=n_components,
@@ -199,6 +251,7 @@ class DictLearning(_BaseDecomposition):
             memory_level=memory_level,
             n_jobs=n_jobs,
             verbose=verbose,
+            n_group_components=n_group_components,
         )
         self.n_epochs = n_epochs
         self.batch_size = batch_size
@@ -207,6 +260,11 @@ class DictLearning(_BaseDecomposition):
         self.reduction_ratio = reduction_ratio
         self.dict_init = dict_init
 
+    def _normalize_subjects(self):
+        # The CanICA initialization uses a CCA, which can only be applied to
+        # the subjects before the incremental group reduction
+        return self.dict_init is None
+
     def _init_dict(self, data):
         if self.dict_init is not None:
             components = self.masker_.transform(self.dict_init)
@@ -224,6 +282,7 @@ class DictLearning(_BaseDecomposition):
                 memory_level=self.memory_level,
                 n_jobs=self.n_jobs,
                 verbose=self.verbose,
+                n_group_components=self.n_group_components,
             )
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", UserWarning)
@@ -273,7 +332,7 @@ class DictLearning(_BaseDecomposition):
         kwargs = transfer_deprecated_param_vals(
             {"n_iter": "max_iter"}, {"max_iter": max_iter}
         )
-        self.components_, _ = self._cache(dict_learning_online)(
+        code, dictionary = self._cache(dict_learning_online)(
             data.T,
             self.n_components,
             alpha=self.alpha,
@@ -287,7 +346,19 @@ class DictLearning(_BaseDecomposition):
             n_jobs=1,
             **kwargs,
         )
-        self.components_ = self.components_.T
+        # Keep the sufficient statistics of the maps to allow partial_fit
+        self._inner_stats = (
+            dictionary @ dictionary.T,
+            dictionary @ data,
+            code.T.copy(),
+        )
+        self._set_components(code.T)
+
+        return self
+
+    def _set_components(self, code):
+        """Set components_ from the maps learned by the dictionary."""
+        self.components_ = code.copy()
         # Unit-variance scaling
         S = np.sqrt(np.sum(self.components_**2, axis=1))
         S[S == 0] = 1
@@ -304,4 +375,72 @@ class DictLearning(_BaseDecomposition):
                 self.components_
             )
 
+    @fill_doc
+    def partial_fit(self, imgs, y=None, confounds=None):
+        """Update the components with a new batch of subjects.
+
+        The images are masked and reduced as in :meth:`fit`. Their temporal
+        loadings on the current maps are added to the sufficient statistics
+        of the dictionary, from which the sparse maps are updated. The memory
+        used thus does not grow with the number of subjects, and the
+        estimator can be saved and later updated with new subjects.
+        Unless :meth:`fit` was called before, the first call is equivalent
+        to :meth:`fit` on its images.
+
+        .. versionadded:: 0.12.1
+
+        Parameters
+        ----------
+        imgs : list of Niimg-like objects or \
+               list of :obj:`~nilearn.surface.SurfaceImage`
+            See :ref:`extracting_data`.
+            Images of the new subjects.
+
+        %(y_dummy)s
+
+        confounds : list of CSV file paths, numpy.ndarrays
+            or pandas DataFrames, optional.
+            This parameter is passed to nilearn.signal.clean.
+            Please see the related documentation for details.
+            Should match with the list of imgs given.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+
+        """
+        del y
+        check_params(self.__dict__)
+        imgs = self._check_imgs(imgs, confounds)
+        if not hasattr(self, "_inner_stats"):
+            # The first batch is fitted as a whole
+            self._fit_masker(imgs)
+            self._raw_fit(self._load_data(imgs, confounds))
+            self._fit_maps_masker()
+            return self
+
+        data = self._load_data(imgs, confounds)
+        A, B, code = self._inner_stats
+
+        logger.log("Updating dictionary", self.verbose)
+        # Loadings of the new samples on the current maps
+        gram = code @ code.T
+        gram.flat[:: len(gram) + 1] += 1e-8 * np.trace(gram)
+        loadings = linalg.solve(gram, code @ data.T, assume_a="pos")
+        A += loadings @ loadings.T
+        B += loadings @ data
+        # Solve the maps for unit norm temporal atoms, as in fit
+        norms = np.sqrt(np.diag(A))
+        norms[norms == 0] = 1
+        unit_code = _update_code(
+            code * norms[:, np.newaxis],
+            A / np.outer(norms, norms),
+            B / norms[:, np.newaxis],
+            self.alpha,
+        )
+        code[...] = unit_code / norms[:, np.newaxis]
+        self._set_components(unit_code)
+        self._fit_maps_masker()
+
         return self
@@ -190,3 +190,67 @@ def test_mask_reducer_reduced_reproducible(
         )
 
     assert_array_almost_equal(np.tile(data1, (2, 1)), data2)
+
+
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_mask_reducer_group_components(
+    data_type,  # noqa: ARG001
+    n_jobs,
+    decomposition_masker,
+    decomposition_images,
+):
+    """Check the incremental group reduction against the concatenation."""
+    n_components = 3
+    data = _mask_and_reduce(
+        masker=decomposition_masker,
+        imgs=decomposition_images,
+        n_components=n_components,
+        random_state=RANDOM_STATE,
+    )
+
+    # keeping all the components, the incremental SVD is a rotation of the
+    # concatenated data
+    group_data = _mask_and_reduce(
+        masker=decomposition_masker,
+        imgs=decomposition_images,
+        n_components=n_components,
+        random_state=RANDOM_STATE,
+        n_jobs=n_jobs,
+        n_group_components=N_SUBJECTS * n_components,
+    )
+
+    assert group_data.shape == data.shape
+    assert_array_almost_equal(group_data.T @ group_data, data.T @ data)
+
+    # otherwise only the leading components are kept
+    group_data = _mask_and_reduce(
+        masker=decomposition_masker,
+        imgs=decomposition_images,
+        n_components=n_components,
+        random_state=RANDOM_STATE,
+        n_jobs=n_jobs,
+        n_group_components=n_components,
+    )
+
+    assert group_data.shape == (n_components, data.shape[1])
+    cov = group_data @ group_data.T
+    assert_array_almost_equal(cov, np.diag(np.diag(cov)))
+
+
+@pytest.mark.parametrize("data_type", ["nifti"])
+def test_mask_reducer_group_components_cca(
+    decomposition_masker, decomposition_images
+):
+    """Check the subjects are normalized before the group reduction."""
+    group_data = _mask_and_reduce(
+        masker=decomposition_masker,
+        imgs=decomposition_images,
+        n_components=3,
+        random_state=RANDOM_STATE,
+        n_group_components=N_SUBJECTS * 3,
+        do_cca=True,
+    )
+
+    # all the normalized subject components are kept
+    assert np.trace(group_data @ group_data.T) == pytest.approx(N_SUBJECTS * 3)
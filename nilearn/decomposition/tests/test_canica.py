@@ -4,7 +4,7 @@ import sys
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from nilearn.decomposition.canica import CanICA
 from nilearn.decomposition.tests.conftest import (
@@ -111,3 +111,52 @@ def test_component_sign(canica_data, data_type):
             mp = get_data(mp) if data_type == "nifti" else get_surface_data(mp)
 
             assert -mp.min() <= mp.max()
+
+
+@pytest.mark.parametrize("data_type", ["nifti"])
+def test_canica_parallel_inits(decomposition_mask_img, canica_data):
+    """Check the inits run in parallel give the same maps, and are timed."""
+    n_init = 4
+    components = {}
+    for n_jobs in [1, 2]:
+        canica = CanICA(
+            n_components=4,
+            n_init=n_init,
+            mask=decomposition_mask_img,
+            random_state=RANDOM_STATE,
+            smoothing_fwhm=None,
+            n_jobs=n_jobs,
+        )
+        canica.fit(canica_data)
+
+        assert canica.init_times_.shape == (n_init,)
+        assert np.all(canica.init_times_ > 0)
+        assert canica.init_n_iter_.shape == (n_init,)
+        assert np.all(canica.init_n_iter_ >= 1)
+        components[n_jobs] = canica.components_
+
+    assert_array_almost_equal(components[1], components[2])
+
+
+@pytest.mark.parametrize("data_type", ["nifti"])
+def test_canica_cached_inits_keep_their_times(
+    tmp_path, decomposition_mask_img, canica_data
+):
+    """Check that FastICA runs loaded from the cache report the time \
+    of the run that computed them.
+    """
+    times = []
+    for _ in range(2):
+        canica = CanICA(
+            n_components=4,
+            n_init=2,
+            mask=decomposition_mask_img,
+            random_state=RANDOM_STATE,
+            smoothing_fwhm=None,
+            memory=tmp_path,
+            memory_level=2,
+        )
+        canica.fit(canica_data)
+        times.append(canica.init_times_)
+
+    assert_array_equal(times[0], times[1])
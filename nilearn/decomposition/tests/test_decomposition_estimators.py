@@ -160,6 +160,31 @@ def test_masker_attributes_with_fit(
     check_decomposition_estimator(est, data_type)
 
 
+@pytest.mark.timeout(0)
+@pytest.mark.parametrize("estimator", [CanICA, _MultiPCA, DictLearning])
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+def test_fit_n_group_components(
+    data_type, canica_data, decomposition_mask_img, estimator
+):
+    """Fit with the incremental group reduction."""
+    est = estimator(
+        n_components=3,
+        mask=decomposition_mask_img,
+        random_state=RANDOM_STATE,
+        smoothing_fwhm=None,
+        n_group_components=6,
+        n_jobs=2,
+    )
+    est.fit(canica_data)
+
+    check_decomposition_estimator(est, data_type)
+    assert np.all(np.isfinite(est.components_))
+
+    est = clone(est).set_params(n_group_components=2)
+    with pytest.raises(ValueError, match="'n_group_components' must be"):
+        est.fit(canica_data)
+
+
 @pytest.mark.timeout(0)
 @pytest.mark.parametrize("estimator", [CanICA, _MultiPCA, DictLearning])
 @pytest.mark.parametrize("data_type", ["nifti", "surface"])
@@ -1,8 +1,14 @@
+import pickle
+
 import numpy as np
 import pytest
+from sklearn.base import clone
+from sklearn.decomposition import sparse_encode
 
-from nilearn.decomposition.dict_learning import DictLearning
+from nilearn.decomposition import CanICA
+from nilearn.decomposition.dict_learning import DictLearning, _update_code
 from nilearn.decomposition.tests.conftest import (
+    N_SUBJECTS,
     RANDOM_STATE,
     check_decomposition_estimator,
 )
@@ -126,3 +132,125 @@ def test_component_sign(
     for mp in iter_img(dict_learning.components_img_):
         mp = get_data(mp) if data_type == "nifti" else get_surface_data(mp)
         assert np.sum(mp[mp <= 0]) <= np.sum(mp[mp > 0])
+
+
+@pytest.mark.timeout(0)
+@pytest.mark.parametrize("data_type", ["nifti"])
+def test_dict_learning_partial_fit(
+    decomposition_mask_img, canica_components, canica_data, data_type
+):
+    """Check partial_fit over subjects recovers the components."""
+    masker = NiftiMasker(mask_img=decomposition_mask_img).fit()
+    mask = get_data(decomposition_mask_img) != 0
+    masked_components = canica_components[:, mask.ravel()]
+    masked_components /= np.linalg.norm(masked_components, axis=1)[:, None]
+
+    dict_learning = DictLearning(
+        n_components=4,
+        random_state=RANDOM_STATE,
+        dict_init=masker.inverse_transform(masked_components),
+        mask=decomposition_mask_img,
+        smoothing_fwhm=None,
+        alpha=1,
+    )
+    for img in canica_data:
+        dict_learning.partial_fit(img)
+
+        check_decomposition_estimator(dict_learning, data_type)
+
+    maps = masker.transform(dict_learning.components_img_)
+    K = np.abs(masked_components @ maps.T)
+
+    assert np.sum(K > 0.9) >= 2
+    # the fitted estimator can transform the data
+    signals = dict_learning.transform(canica_data)
+    assert signals[0].shape == (canica_data[0].shape[-1], 4)
+
+
+@pytest.mark.timeout(0)
+@pytest.mark.parametrize("data_type", ["nifti", "surface"])
+def test_dict_learning_partial_fit_resume(
+    decomposition_mask_img, canica_data, data_type
+):
+    """Check partial_fit updates a fitted estimator and can be resumed."""
+    dict_learning = DictLearning(
+        n_components=4,
+        random_state=RANDOM_STATE,
+        mask=decomposition_mask_img,
+        smoothing_fwhm=None,
+        alpha=1,
+    )
+    dict_learning.fit(canica_data[:2])
+    fitted_components = dict_learning.components_.copy()
+
+    saved = pickle.loads(pickle.dumps(dict_learning))
+    dict_learning.partial_fit(canica_data[2:])
+    saved.partial_fit(canica_data[2:])
+
+    check_decomposition_estimator(dict_learning, data_type)
+    assert not np.allclose(dict_learning.components_, fitted_components)
+    np.testing.assert_allclose(saved.components_, dict_learning.components_)
+
+
+@pytest.mark.timeout(0)
+@pytest.mark.parametrize("data_type", ["nifti"])
+def test_dict_learning_n_group_components_init(
+    monkeypatch, decomposition_mask_img, canica_data
+):
+    """Check the data of the initial CanICA with n_group_components.
+
+    When the group keeps all the reduced samples, the CanICA initialization
+    must decompose the same normalized data as with the concatenated
+    subjects.
+    """
+    init_data = []
+    raw_fit = CanICA._raw_fit
+
+    def record_raw_fit(self, data):
+        init_data.append(data.copy())
+        # CanICA only normalizes the concatenated subjects
+        if self.n_group_components is None:
+            S = np.linalg.norm(init_data[-1], axis=1)
+            init_data[-1] /= S[:, np.newaxis]
+        return raw_fit(self, data)
+
+    monkeypatch.setattr(CanICA, "_raw_fit", record_raw_fit)
+
+    n_components = 4
+    dict_learning = DictLearning(
+        n_components=n_components,
+        random_state=RANDOM_STATE,
+        mask=decomposition_mask_img,
+        smoothing_fwhm=None,
+        n_epochs=1,
+    )
+    dict_learning.fit(canica_data)
+    clone(dict_learning).set_params(
+        n_group_components=N_SUBJECTS * n_components
+    ).fit(canica_data)
+
+    concatenated, incremental = init_data
+    np.testing.assert_allclose(incremental, concatenated, atol=1e-12)
+
+
+@pytest.mark.parametrize("alpha", [0.1, 1.0])
+def test_update_code(rng, alpha):
+    """Check the sparse maps match the Lasso of sklearn."""
+    n_samples, n_features, n_components = 60, 200, 5
+    dictionary = rng.standard_normal((n_components, n_samples))
+    dictionary /= np.linalg.norm(dictionary, axis=1)[:, np.newaxis]
+    data = rng.standard_normal((n_samples, n_features))
+
+    expected = sparse_encode(
+        data.T, dictionary, algorithm="lasso_cd", alpha=alpha, max_iter=2000
+    )
+    code = _update_code(
+        np.zeros((n_components, n_features)),
+        dictionary @ dictionary.T,
+        dictionary @ data,
+        alpha,
+        max_iter=1000,
+        tol=1e-8,
+    )
+
+    np.testing.assert_allclose(code, expected.T, atol=1e-3)
@@ -74,7 +74,13 @@ def get_data(img):
 
 
 def high_variance_confounds(
-    imgs, n_confounds=5, percentile=2.0, detrend=True, mask_img=None
+    imgs,
+    n_confounds=5,
+    percentile=2.0,
+    detrend=True,
+    mask_img=None,
+    svd_solver="full",
+    dtype=None,
 ) -> np.ndarray:
     """Return confounds extracted from input signals with highest variance.
 
@@ -100,6 +106,18 @@ def high_variance_confounds(
     detrend : :obj:`bool`, default=True
         If True, detrend signals before processing.
 
+    svd_solver : {"full", "randomized"}, default="full"
+        How the singular vectors are computed.
+        See :func:`nilearn.signal.high_variance_confounds`.
+
+        .. versionadded:: 0.12.1
+
+    dtype : dtype like or None, default=None
+        Floating point type in which the confounds are computed.
+        See :func:`nilearn.signal.high_variance_confounds`.
+
+        .. versionadded:: 0.12.1
+
     Returns
     -------
     :class:`numpy.ndarray`
@@ -145,7 +163,12 @@ def high_variance_confounds(
     del imgs  # help reduce memory consumption
 
     return signal.high_variance_confounds(
-        sigs, n_confounds=n_confounds, percentile=percentile, detrend=detrend
+        sigs,
+        n_confounds=n_confounds,
+        percentile=percentile,
+        detrend=detrend,
+        svd_solver=svd_solver,
+        dtype=dtype,
     )
 
 
@@ -1,3 +1,9 @@
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
 from nilearn import image
 
 
@@ -19,3 +25,98 @@ def compute_middle_image(img):
     if len(dim) in {4, 5}:
         img = image.index_img(img, dim[-1] // 2)
     return img, len(dim)
+
+
+class _ResampledImgCache:
+    """In-memory LRU cache of resampled images, bounded in bytes.
+
+    Images are identified by the object given to :meth:`resample`, so that
+    a masker transforming many images in the same space resamples its atlas
+    or mask once, even when no joblib cache is configured.
+
+    Parameters
+    ----------
+    max_bytes : :obj:`int`
+        Maximum number of bytes of data of the cached images.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._n_bytes = 0
+        self._lock = threading.Lock()
+
+    def resample(
+        self,
+        resample_img,
+        img,
+        interpolation,
+        target_shape,
+        target_affine,
+        **kwargs,
+    ):
+        """Return img resampled by resample_img, from the cache if possible.
+
+        Parameters
+        ----------
+        resample_img : callable
+            Function used to resample img on a cache miss, typically
+            :func:`nilearn.image.resample_img` or a joblib cached version of
+            it.
+
+        img : Niimg-like object
+            Image to resample.
+
+        interpolation, target_shape, target_affine, **kwargs
+            Passed to resample_img. Only interpolation, target_shape and
+            target_affine are part of the key of the cache.
+        """
+        key = (
+            id(img),
+            interpolation,
+            tuple(target_shape),
+            np.asarray(target_affine, dtype=float).tobytes(),
+        )
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item[0]() is img:
+                self._items.move_to_end(key)
+                return item[1]
+
+        resampled = resample_img(
+            img,
+            interpolation=interpolation,
+            target_shape=target_shape,
+            target_affine=target_affine,
+            **kwargs,
+        )
+        n_bytes = image.get_data(resampled).nbytes
+        if n_bytes > self.max_bytes:
+            return resampled
+
+        with self._lock:
+            self._pop(key)
+            self._items[key] = (weakref.ref(img), resampled, n_bytes)
+            self._n_bytes += n_bytes
+            for old_key in [
+                k for k, v in self._items.items() if v[0]() is None
+            ]:
+                self._pop(old_key)
+            while self._n_bytes > self.max_bytes:
+                self._pop(next(iter(self._items)))
+        return resampled
+
+    def clear(self):
+        """Remove all the images from the cache."""
+        with self._lock:
+            self._items.clear()
+            self._n_bytes = 0
+
+    def _pop(self, key):
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._n_bytes -= item[2]
+
+
+# Atlases and masks resampled by the maskers at transform time.
+RESAMPLED_IMGS = _ResampledImgCache(max_bytes=2**28)
@@ -4,6 +4,7 @@ import abc
 import contextlib
 import itertools
 import warnings
+import weakref
 from collections.abc import Iterable
 from copy import deepcopy
 from pathlib import Path
@@ -37,7 +38,7 @@ from nilearn.image import (
     resample_img,
     smooth_img,
 )
-from nilearn.masking import load_mask_img, unmask
+from nilearn.masking import _MaskIndices, _unmask_array, load_mask_img
 from nilearn.signal import clean
 from nilearn.surface.surface import SurfaceImage, at_least_2d, check_surf_img
 from nilearn.surface.utils import check_polymesh_equal
@@ -144,10 +145,53 @@ def filter_and_extract(
     # Confounds removing (from csv file or numpy array)
     # Normalizing
 
+    region_signals = clean_extracted_signals(
+        region_signals,
+        parameters,
+        memory_level=memory_level,
+        memory=memory,
+        verbose=verbose,
+        confounds=confounds,
+        sample_mask=sample_mask,
+    )
+
+    if temp_imgs.ndim == 3:
+        region_signals = region_signals.squeeze()
+
+    return region_signals, aux
+
+
+def clean_extracted_signals(
+    region_signals,
+    parameters,
+    memory_level=0,
+    memory=None,
+    verbose=0,
+    confounds=None,
+    sample_mask=None,
+):
+    """Clean the time series extracted by a masker.
+
+    Parameters
+    ----------
+    region_signals : 2D numpy array
+        Extracted signals, with shape n_samples x n_features.
+
+    For all other parameters refer to NiftiMasker documentation
+
+    Returns
+    -------
+    signals : 2D numpy array
+        Cleaned signals, with shape n_samples x n_features.
+
+    """
+    if memory is None:
+        memory = Memory(location=None)
+
     mask_logger("cleaning", verbose=verbose)
 
     runs = parameters.get("runs", None)
-    region_signals = cache(
+    return cache(
         clean,
         memory=memory,
         func_memory_level=2,
@@ -166,10 +210,17 @@ def filter_and_extract(
         **parameters["clean_kwargs"],
     )
 
-    if temp_imgs.ndim == 3:
-        region_signals = region_signals.squeeze()
 
-    return region_signals, aux
+# Flat indices of the voxels of the fitted masks, computed once per mask.
+_MASK_INDICES = weakref.WeakKeyDictionary()
+
+
+def _get_mask_indices(mask_img):
+    """Return the flat indices of the voxels of a fitted mask image."""
+    if mask_img not in _MASK_INDICES:
+        mask, _ = load_mask_img(mask_img)
+        _MASK_INDICES[mask_img] = _MaskIndices(mask)
+    return _MASK_INDICES[mask_img]
 
 
 def prepare_confounds_multimaskers(masker, imgs_list, confounds):
@@ -457,7 +508,10 @@ class BaseMasker(TransformerMixin, CacheMixin, BaseEstimator):
 
         mask_logger("inverse_transform", verbose=self.verbose)
 
-        img = self._cache(unmask)(X, self.mask_img_)
+        unmasked = self._cache(_unmask_array)(
+            X, _get_mask_indices(self.mask_img_)
+        )
+        img = new_img_like(self.mask_img_, unmasked, self.mask_img_.affine)
         # Be robust again memmapping that will create read-only arrays in
         # internal structures of the header: remove the memmaped array
         with contextlib.suppress(Exception):
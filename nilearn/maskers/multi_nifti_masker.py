@@ -4,8 +4,11 @@ on multi subject MRI data.
 
 import collections.abc
 import itertools
+import os
+import tempfile
 import warnings
 from functools import partial
+from pathlib import Path
 
 import numpy as np
 from joblib import Parallel, delayed
@@ -68,6 +71,33 @@ def _get_mask_strategy(strategy):
         )
 
 
+def _new_signals_file(output_dir, index):
+    """Create an empty file with a unique name to save signals in.
+
+    Unique names ensure that the files of a previous call are never
+    overwritten, as they may still be memory-mapped.
+    """
+    fd, filename = tempfile.mkstemp(
+        suffix=".npy", prefix=f"signals_{index}_", dir=output_dir
+    )
+    os.close(fd)
+    return Path(filename)
+
+
+def _save_signals(func, filename, *args, **kwargs):
+    """Call func and save the signals it returns in filename.
+
+    The name of the file is returned instead of the signals, so that they
+    do not have to be sent back from the worker processes. If filename is
+    None, the signals are returned.
+    """
+    signals = func(*args, **kwargs)
+    if filename is None:
+        return signals
+    np.save(filename, signals)
+    return filename
+
+
 @fill_doc
 class MultiNiftiMasker(NiftiMasker):
     """Applying a mask to extract time-series from multiple Niimg-like objects.
@@ -398,7 +428,13 @@ class MultiNiftiMasker(NiftiMasker):
 
     @fill_doc
     def transform_imgs(
-        self, imgs_list, confounds=None, sample_mask=None, copy=True, n_jobs=1
+        self,
+        imgs_list,
+        confounds=None,
+        sample_mask=None,
+        copy=True,
+        n_jobs=1,
+        output_dir=None,
     ):
         """Prepare multi subject data in parallel.
 
@@ -419,6 +455,17 @@ class MultiNiftiMasker(NiftiMasker):
 
         %(n_jobs)s
 
+        output_dir : :obj:`str` or :obj:`pathlib.Path` or None, default=None
+            If not None, each worker saves the signals of its image in a new
+            file ``signals_<index>_<random>.npy`` in this directory, created
+            if needed, instead of sending them back to the parent process.
+            The signals are then returned as read-only memory-mapped arrays,
+            so that the memory used by the parent process does not grow with
+            the number of images. Files of previous calls are never
+            overwritten, and the files are not removed by the masker.
+
+            .. versionadded:: 0.12.1
+
         Returns
         -------
         %(signals_transform_imgs_multi_nifti)s
@@ -426,6 +473,10 @@ class MultiNiftiMasker(NiftiMasker):
         """
         check_is_fitted(self)
 
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
         target_fov = "first" if self.target_affine is None else None
         niimg_iter = iter_check_niimg(
             imgs_list,
@@ -472,10 +523,18 @@ class MultiNiftiMasker(NiftiMasker):
                 "memory_level",
                 "copy",
             ],
-            shelve=self._shelving,
+            shelve=self._shelving and output_dir is None,
         )
+        if output_dir is None:
+            filenames = itertools.repeat(None)
+        else:
+            filenames = (
+                _new_signals_file(output_dir, i) for i in itertools.count()
+            )
         data = Parallel(n_jobs=n_jobs)(
-            delayed(func)(
+            delayed(_save_signals)(
+                func,
+                filename,
                 imgs,
                 self.mask_img_,
                 params,
@@ -487,8 +546,12 @@ class MultiNiftiMasker(NiftiMasker):
                 dtype=self.dtype,
                 sample_mask=sms,
             )
-            for imgs, cfs, sms in zip(niimg_iter, confounds, sample_mask)
+            for imgs, cfs, sms, filename in zip(
+                niimg_iter, confounds, sample_mask, filenames
+            )
         )
+        if output_dir is not None:
+            data = [np.load(filename, mmap_mode="r") for filename in data]
         return data
 
     @fill_doc
@@ -28,7 +28,7 @@ from nilearn._utils.param_validation import (
     check_reduction_strategy,
 )
 from nilearn.image import get_data, load_img, resample_img
-from nilearn.maskers._utils import compute_middle_image
+from nilearn.maskers._utils import RESAMPLED_IMGS, compute_middle_image
 from nilearn.maskers.base_masker import (
     BaseMasker,
     filter_and_extract,
@@ -790,7 +790,8 @@ class NiftiLabelsMasker(BaseMasker):
                     ),
                     stacklevel=find_stack_level(),
                 )
-                mask_img_ = self._cache(resample_img, func_memory_level=2)(
+                mask_img_ = RESAMPLED_IMGS.resample(
+                    self._cache(resample_img, func_memory_level=2),
                     mask_img_,
                     interpolation="nearest",
                     target_shape=imgs_.shape[:3],
@@ -862,7 +863,8 @@ class NiftiLabelsMasker(BaseMasker):
         labels_before_resampling = set(
             np.unique(safe_get_data(self.labels_img_))
         )
-        labels_img_ = self._cache(resample_img, func_memory_level=2)(
+        labels_img_ = RESAMPLED_IMGS.resample(
+            self._cache(resample_img, func_memory_level=2),
             self.labels_img_,
             interpolation="nearest",
             target_shape=imgs_.shape[:3],
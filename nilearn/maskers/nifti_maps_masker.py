@@ -13,7 +13,7 @@ from nilearn._utils.logger import find_stack_level
 from nilearn._utils.niimg_conversions import check_niimg, check_same_fov
 from nilearn._utils.param_validation import check_params
 from nilearn.image import clean_img, get_data, index_img, resample_img
-from nilearn.maskers._utils import compute_middle_image
+from nilearn.maskers._utils import RESAMPLED_IMGS, compute_middle_image
 from nilearn.maskers.base_masker import (
     BaseMasker,
     filter_and_extract,
@@ -614,7 +614,8 @@ class NiftiMapsMasker(BaseMasker):
                 )
                 # TODO switch to force_resample=True
                 # when bumping to version > 0.13
-                maps_img_ = self._cache(resample_img)(
+                maps_img_ = RESAMPLED_IMGS.resample(
+                    self._cache(resample_img),
                     self.maps_img_,
                     interpolation="linear",
                     target_shape=ref_img.shape[:3],
@@ -638,7 +639,8 @@ class NiftiMapsMasker(BaseMasker):
                 )
                 # TODO switch to force_resample=True
                 # when bumping to version > 0.13
-                mask_img_ = self._cache(resample_img)(
+                mask_img_ = RESAMPLED_IMGS.resample(
+                    self._cache(resample_img),
                     self.mask_img_,
                     interpolation="nearest",
                     target_shape=ref_img.shape[:3],
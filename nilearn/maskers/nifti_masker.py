@@ -3,19 +3,24 @@
 import warnings
 from copy import copy as copy_object
 from functools import partial
+from pathlib import Path
 
+import nibabel
 import numpy as np
 from joblib import Memory
 from sklearn.utils.estimator_checks import check_is_fitted
 
 from nilearn import _utils
 from nilearn._utils.docs import fill_doc
+from nilearn._utils.helpers import stringify_path
 from nilearn._utils.logger import find_stack_level
+from nilearn._utils.niimg import _get_target_dtype
 from nilearn._utils.param_validation import check_params
 from nilearn.image import crop_img, resample_img
 from nilearn.maskers._utils import compute_middle_image
 from nilearn.maskers.base_masker import (
     BaseMasker,
+    clean_extracted_signals,
     filter_and_extract,
     mask_logger,
 )
@@ -45,6 +50,63 @@ class _ExtractionFunctor:
         )
 
 
+# Maximum size in bytes of the chunk of volumes read at once when the
+# signals are extracted directly from a 4D NIfTI file.
+_STREAM_CHUNK_BYTES = 2**26
+
+
+@fill_doc
+def _stream_masked_signals(img, mask_img_, dtype=None):
+    """Extract the signals of a 4D image by chunks of volumes.
+
+    The volumes are read from the proxy of the image, so that only one chunk
+    of volumes is in memory at a time besides the signals.
+
+    Parameters
+    ----------
+    img : 4D :class:`nibabel.spatialimages.SpatialImage`
+        Image whose data has not been loaded, in the same field of view as
+        the mask.
+
+    mask_img_ : 3D Niimg-like object
+        Mask of the voxels to extract.
+
+    %(dtype)s
+
+    Returns
+    -------
+    signals : 2D numpy array
+        Signals of the voxels of the mask, with shape n_samples x n_features.
+        Non-finite values are replaced by zeros, as in
+        :func:`nilearn.masking.apply_mask`.
+
+    """
+    mask, _ = load_mask_img(mask_img_)
+    n_samples = img.shape[3]
+    volume_bytes = (
+        mask.size * np.dtype(_utils.niimg.img_data_dtype(img)).itemsize
+    )
+    chunk_size = max(1, _STREAM_CHUNK_BYTES // volume_bytes)
+
+    signals = None
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        chunk = np.asanyarray(img.dataobj[..., start:stop])
+        if signals is None:
+            target_dtype = _get_target_dtype(chunk.dtype, dtype)
+            signals = np.empty(
+                (int(mask.sum()), n_samples),
+                dtype=chunk.dtype if target_dtype is None else target_dtype,
+            )
+        chunk = chunk[mask].astype(signals.dtype, copy=False)
+        if chunk.dtype.kind == "f":
+            chunk[~np.isfinite(chunk)] = 0
+        signals[:, start:stop] = chunk
+        del chunk
+
+    return signals.T
+
+
 def _get_mask_strategy(strategy):
     """Return the mask computing method based on a provided strategy."""
     if strategy == "background":
@@ -104,6 +166,35 @@ def filter_and_mask(
     """
     if memory is None:
         memory = Memory(location=None)
+
+    # 4D NIfTI files in the space of the mask are read by chunks of volumes
+    # rather than loaded at once.
+    imgs = stringify_path(imgs)
+    if (
+        isinstance(imgs, str)
+        and imgs.endswith((".nii", ".nii.gz"))
+        and Path(imgs).is_file()
+        and parameters.get("smoothing_fwhm") is None
+    ):
+        img = nibabel.load(imgs, keep_file_open=True)
+        if img.ndim == 4 and _utils.niimg_conversions.check_same_fov(
+            img, mask_img_
+        ):
+            mask_logger("load_data", imgs, verbose)
+            mask_logger("extracting", verbose=verbose)
+            data = _stream_masked_signals(img, mask_img_, dtype=dtype)
+            del img
+            return clean_extracted_signals(
+                data,
+                parameters,
+                memory_level=memory_level,
+                memory=memory,
+                verbose=verbose,
+                confounds=confounds,
+                sample_mask=sample_mask,
+            )
+        del img
+
     # Convert input to niimg to check shape.
     # This must be repeated after the shape check because check_niimg will
     # coerce 5D data to 4D, which we don't want.
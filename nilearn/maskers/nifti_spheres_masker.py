@@ -3,7 +3,6 @@
 Mask nifti images by spherical volumes for seed-region analyses
 """
 
-import contextlib
 import warnings
 
 import numpy as np
@@ -37,6 +36,29 @@ from nilearn.maskers.base_masker import (
 from nilearn.masking import apply_mask_fmri, load_mask_img, unmask
 
 
+def _match_rows(reference, queries):
+    """Yield pairs (i, j) such that row i of the integer-truncated queries \
+    is the first row j of reference equal to it.
+    """
+    queries = np.asarray(queries).astype(reference.dtype)
+
+    def _as_keys(rows):
+        rows = np.ascontiguousarray(rows)
+        return rows.view(
+            np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))
+        ).ravel()
+
+    reference_keys = _as_keys(reference)
+    order = np.argsort(reference_keys, kind="stable")
+    sorted_keys = reference_keys[order]
+    query_keys = _as_keys(queries)
+    positions = np.searchsorted(sorted_keys, query_keys)
+    positions = np.minimum(positions, len(sorted_keys) - 1)
+    for i, (position, key) in enumerate(zip(positions, query_keys)):
+        if sorted_keys[position] == key:
+            yield i, order[position]
+
+
 def apply_mask_and_get_affinity(
     seeds, niimg, radius, allow_overlap, mask_img=None
 ):
@@ -85,7 +107,7 @@ def apply_mask_and_get_affinity(
     if niimg is None:
         mask, affine = load_mask_img(mask_img)
         # Get coordinate for all voxels inside of mask
-        mask_coords = np.asarray(np.nonzero(mask)).T.tolist()
+        mask_coords = np.asarray(np.nonzero(mask)).T
         X = None
 
     elif mask_img is not None:
@@ -102,7 +124,7 @@ def apply_mask_and_get_affinity(
             force_resample=False,
         )
         mask, _ = load_mask_img(mask_img)
-        mask_coords = list(zip(*np.where(mask != 0)))
+        mask_coords = np.asarray(np.nonzero(mask)).T
 
         X = apply_mask_fmri(niimg, mask_img)
 
@@ -118,22 +140,24 @@ def apply_mask_and_get_affinity(
         else:
             X = safe_get_data(niimg).reshape([-1, niimg.shape[3]]).T
 
-        mask_coords = list(np.ndindex(niimg.shape[:3]))
+        mask = np.ones(niimg.shape[:3], dtype=bool)
+        mask_coords = np.asarray(np.nonzero(mask)).T
 
-    # For each seed, get coordinates of nearest voxel
+    # For each seed, get index of nearest voxel, looked up in a volume
+    # holding the index of each in-mask voxel
+    voxel_index = np.full(mask.shape, -1)
+    voxel_index[tuple(mask_coords.T)] = np.arange(len(mask_coords))
     nearests = []
     for sx, sy, sz in seeds:
         nearest = np.round(coord_transform(sx, sy, sz, np.linalg.inv(affine)))
         nearest = nearest.astype(int)
-        nearest = (nearest[0], nearest[1], nearest[2])
-        try:
-            nearests.append(mask_coords.index(nearest))
-        except ValueError:
-            nearests.append(None)
+        if np.all(nearest >= 0) and np.all(nearest < mask.shape):
+            nearests.append(voxel_index[tuple(nearest)])
+        else:
+            nearests.append(-1)
 
-    mask_coords = np.asarray(list(zip(*mask_coords)))
     mask_coords = coord_transform(
-        mask_coords[0], mask_coords[1], mask_coords[2], affine
+        mask_coords[:, 0], mask_coords[:, 1], mask_coords[:, 2], affine
     )
     mask_coords = np.asarray(mask_coords).T
 
@@ -141,16 +165,14 @@ def apply_mask_and_get_affinity(
     A = clf.fit(mask_coords).radius_neighbors_graph(seeds)
     A = A.tolil()
     for i, nearest in enumerate(nearests):
-        if nearest is None:
+        if nearest < 0:
             continue
 
         A[i, nearest] = True
 
     # Include the voxel containing the seed itself if not masked
-    mask_coords = mask_coords.astype(int).tolist()
-    for i, seed in enumerate(seeds):
-        with contextlib.suppress(ValueError):  # if seed is not in the mask
-            A[i, mask_coords.index(list(map(int, seed)))] = True
+    for i, voxel in _match_rows(mask_coords.astype(int), np.asarray(seeds)):
+        A[i, voxel] = True
 
     sphere_sizes = np.asarray(A.tocsr().sum(axis=1)).ravel()
     empty_spheres = np.nonzero(sphere_sizes == 0)[0]
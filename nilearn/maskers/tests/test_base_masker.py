@@ -5,6 +5,7 @@ from nibabel import Nifti1Image
 from numpy.testing import assert_array_almost_equal
 
 from nilearn import image
+from nilearn.maskers._utils import _ResampledImgCache
 from nilearn.maskers.nifti_masker import filter_and_mask
 
 
@@ -47,3 +48,42 @@ def test_cropping_code_paths(rng):
     out_data_cropped = filter_and_mask(img, cropped_mask_img, parameters)
 
     assert_array_almost_equal(out_data_cropped, out_data_uncropped)
+
+
+def test_resampled_img_cache(rng, affine_eye):
+    """Resampled images are reused and the cache is bounded in bytes."""
+    img = Nifti1Image(rng.standard_normal((6, 7, 8)), affine_eye)
+    calls = []
+
+    def resample_img(img, **kwargs):
+        calls.append(kwargs)
+        return image.resample_img(img, **kwargs)
+
+    # room for exactly one resampled image of 4x4x4 float64
+    cache = _ResampledImgCache(max_bytes=4**3 * 8)
+    kwargs = {
+        "interpolation": "nearest",
+        "target_shape": (4, 4, 4),
+        "target_affine": np.diag((2, 2, 2, 1)),
+        "copy_header": True,
+        "force_resample": True,
+    }
+    first = cache.resample(resample_img, img, **kwargs)
+    second = cache.resample(resample_img, img, **kwargs)
+
+    assert second is first
+    assert len(calls) == 1
+
+    # a different target evicts the least recently used image
+    cache.resample(resample_img, img, **{**kwargs, "target_shape": (4, 4, 3)})
+    assert len(calls) == 2
+    assert cache._n_bytes == 4 * 4 * 3 * 8
+    cache.resample(resample_img, img, **kwargs)
+    assert len(calls) == 3
+
+    # images larger than the cache are not kept
+    cache.resample(resample_img, img, **{**kwargs, "target_shape": (5, 5, 5)})
+    assert cache._n_bytes == 4**3 * 8
+
+    cache.clear()
+    assert cache._n_bytes == 0
@@ -1,6 +1,7 @@
 """Test the multi_nifti_masker module."""
 
 import shutil
+from pathlib import Path
 from tempfile import mkdtemp
 
 import numpy as np
@@ -206,6 +207,57 @@ def test_shelving(rng):
         shutil.rmtree(cachedir, ignore_errors=True)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_transform_imgs_output_dir(
+    rng, tmp_path, shape_3d_default, affine_eye, n_jobs
+):
+    """Check that signals can be saved to memory-mapped files."""
+    imgs = [
+        Nifti1Image(rng.standard_normal((*shape_3d_default, n)), affine_eye)
+        for n in (5, 7, 6)
+    ]
+    masker = MultiNiftiMasker(
+        Nifti1Image(np.ones(shape_3d_default, dtype="int8"), affine_eye),
+        detrend=True,
+    ).fit()
+    output_dir = tmp_path / "signals"
+
+    signals = masker.transform_imgs(imgs, n_jobs=n_jobs, output_dir=output_dir)
+    expected = masker.transform_imgs(imgs)
+
+    assert len(signals) == len(imgs)
+    for i, (signal, expected_signal) in enumerate(zip(signals, expected)):
+        assert isinstance(signal, np.memmap)
+        assert not signal.flags.writeable
+        filename = Path(signal.filename)
+        assert filename.parent == output_dir
+        assert filename.name.startswith(f"signals_{i}_")
+        assert_array_equal(signal, expected_signal)
+
+
+def test_transform_imgs_output_dir_twice(
+    rng, tmp_path, shape_3d_default, affine_eye
+):
+    """Check that a second call does not modify the first signals."""
+    masker = MultiNiftiMasker(
+        Nifti1Image(np.ones(shape_3d_default, dtype="int8"), affine_eye),
+    ).fit()
+    imgs = [
+        Nifti1Image(rng.standard_normal((*shape_3d_default, 7)), affine_eye)
+    ]
+    first = masker.transform_imgs(imgs, output_dir=tmp_path)
+    expected = np.array(first[0])
+
+    other_imgs = [
+        Nifti1Image(rng.standard_normal((*shape_3d_default, 3)), affine_eye)
+    ]
+    second = masker.transform_imgs(other_imgs, output_dir=tmp_path)
+
+    assert second[0].shape[0] == 3
+    assert first[0].filename != second[0].filename
+    assert_array_equal(first[0], expected)
+
+
 @pytest.fixture
 def list_random_imgs(img_3d_rand_eye):
     """Create a list of random 3D nifti images."""
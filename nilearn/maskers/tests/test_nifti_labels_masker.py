@@ -12,6 +12,7 @@ from nibabel import Nifti1Image
 from numpy.testing import assert_almost_equal, assert_array_equal
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
+from nilearn import image
 from nilearn._utils.data_gen import (
     generate_labeled_regions,
     generate_random_img,
@@ -329,6 +330,32 @@ def test_nifti_labels_masker_resampling_to_data(affine_eye, n_regions, length):
     assert_array_equal(masker.labels_img_.affine, affine2)
 
 
+def test_nifti_labels_masker_resampling_at_transform_cached(
+    affine_eye, shape_3d_default, img_labels, monkeypatch
+):
+    """Labels are resampled once for images on the same grid."""
+    calls = []
+
+    def resample_img(*args, **kwargs):
+        calls.append(kwargs)
+        return image.resample_img(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "nilearn.maskers.nifti_labels_masker.resample_img", resample_img
+    )
+    masker = NiftiLabelsMasker(img_labels, resampling_target="data").fit()
+    imgs = [
+        generate_random_img((*shape_3d_default, 5), affine=2 * affine_eye)[0]
+        for _ in range(2)
+    ]
+
+    with pytest.warns(UserWarning, match="Resampling labels at transform"):
+        signals = [masker.transform(img) for img in imgs]
+
+    assert len(calls) == 1
+    assert signals[0].shape == signals[1].shape
+
+
 @pytest.mark.parametrize("resampling_target", ["data", "labels"])
 def test_nifti_labels_masker_resampling(
     affine_eye,
@@ -11,8 +11,8 @@ from tempfile import mkdtemp
 
 import numpy as np
 import pytest
-from nibabel import Nifti1Image
-from numpy.testing import assert_array_equal
+from nibabel import Nifti1Image, load
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
 from nilearn._utils import data_gen, exceptions, testing
@@ -24,8 +24,10 @@ from nilearn._utils.estimator_checks import (
 )
 from nilearn._utils.tags import SKLEARN_LT_1_6
 from nilearn.image import get_data, index_img
-from nilearn.maskers import NiftiMasker
+from nilearn.maskers import NiftiMasker, base_masker
 from nilearn.maskers.nifti_masker import filter_and_mask
+from nilearn.masking import unmask
+from nilearn.signal import CleaningPlan
 
 ESTIMATORS_TO_CHECK = [NiftiMasker()]
 
@@ -444,6 +446,90 @@ def test_filter_and_mask(affine_eye):
     assert data.shape == (data_shape[3], np.prod(np.array(mask.shape)))
 
 
+def test_transform_cleaning_plan(rng, img_4d_rand_eye_medium, mask_img_1):
+    """Confounds can be given as a cleaning plan shared between maskers."""
+    n_samples = img_4d_rand_eye_medium.shape[3]
+    confounds = rng.standard_normal((n_samples, 3))
+    plan = CleaningPlan(
+        n_samples, confounds, detrend=False, low_pass=0.1, t_r=2.0
+    )
+    masker = NiftiMasker(mask_img_1, low_pass=0.1, t_r=2.0).fit()
+
+    assert_array_almost_equal(
+        masker.transform(img_4d_rand_eye_medium, confounds=plan),
+        masker.transform(img_4d_rand_eye_medium, confounds=confounds),
+    )
+
+    masker = NiftiMasker(mask_img_1, detrend=True, low_pass=0.1, t_r=2.0)
+    with pytest.raises(ValueError, match="detrend=True"):
+        masker.fit().transform(img_4d_rand_eye_medium, confounds=plan)
+
+
+@pytest.mark.parametrize("suffix", [".nii", ".nii.gz"])
+@pytest.mark.parametrize("dtype", [None, "auto"])
+def test_transform_file_by_chunks(
+    rng, tmp_path, monkeypatch, affine_eye, mask_img_1, suffix, dtype
+):
+    """4D files are read by chunks of volumes, with unchanged results."""
+    data = rng.integers(-100, 100, size=(*mask_img_1.shape, 11))
+    img = Nifti1Image(data.astype("int16"), affine_eye)
+    img.header.set_slope_inter(0.5, 1.0)
+    filename = tmp_path / f"img{suffix}"
+    img.to_filename(filename)
+    masker = NiftiMasker(mask_img_1, dtype=dtype, detrend=True).fit()
+
+    expected = masker.transform(load(filename))
+    monkeypatch.setattr(
+        "nilearn.maskers.nifti_masker._STREAM_CHUNK_BYTES",
+        3 * data[..., 0].size * 2,
+    )
+    monkeypatch.setattr(
+        "nilearn._utils.check_niimg",
+        lambda *args, **kwargs: pytest.fail("the file was loaded"),
+    )
+    signals = masker.transform(filename)
+
+    assert signals.dtype == expected.dtype
+    assert_array_almost_equal(signals, expected)
+
+
+def test_transform_file_by_chunks_non_finite(tmp_path, affine_eye):
+    """Non-finite values of files read by chunks are replaced by zeros."""
+    data = np.ones((3, 4, 5, 6), dtype="float32")
+    data[1, 2, 3, 4] = np.nan
+    data[0, 0, 0, 0] = np.inf
+    filename = tmp_path / "img.nii"
+    Nifti1Image(data, affine_eye).to_filename(filename)
+    mask_img = Nifti1Image(np.ones(data.shape[:3], dtype="int8"), affine_eye)
+
+    signals = NiftiMasker(mask_img).fit().transform(filename)
+
+    assert np.isfinite(signals).all()
+    assert_array_equal(
+        signals, NiftiMasker(mask_img).fit().transform(load(filename))
+    )
+
+
+def test_inverse_transform_mask_indices(rng, mask_img_1, monkeypatch):
+    """The flat indices of the fitted mask are computed only once."""
+    masker = NiftiMasker(mask_img_1).fit()
+    X = rng.standard_normal((3, masker.n_elements_))
+
+    expected = get_data(unmask(X, mask_img_1))
+    assert_array_equal(get_data(masker.inverse_transform(X)), expected)
+    assert masker.mask_img_ in base_masker._MASK_INDICES
+
+    monkeypatch.setattr(
+        base_masker,
+        "load_mask_img",
+        lambda *args, **kwargs: pytest.fail("the mask was loaded again"),
+    )
+    assert_array_equal(get_data(masker.inverse_transform(X)), expected)
+    assert_array_equal(
+        get_data(masker.inverse_transform(X[0])), expected[..., 0]
+    )
+
+
 def test_standardization(rng, shape_3d_default, affine_eye):
     """Check output properly standardized with 'standardize' parameter."""
     n_samples = 500
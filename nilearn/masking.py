@@ -958,10 +958,58 @@ def apply_mask_fmri(
         ensure_finite=ensure_finite,
         copy=False,
     )
-    return series[mask_data].T
+    indices = _MaskIndices(mask_data)
+    return np.take(
+        series.reshape((-1, *series.shape[3:])), indices.c, axis=0
+    ).T
 
 
-def _unmask_3d(X, mask, order="C"):
+class _MaskIndices:
+    """Flat indices of the voxels of a 3D boolean mask.
+
+    Computing the indices once allows to gather and scatter the voxels of
+    many images with :func:`numpy.take` and :func:`numpy.put` instead of
+    boolean indexing.
+
+    Parameters
+    ----------
+    mask : 3D :class:`numpy.ndarray` of bool
+        Mask of the voxels.
+
+    Attributes
+    ----------
+    shape : :obj:`tuple`
+        Shape of the mask.
+
+    n_features : :obj:`int`
+        Number of voxels in the mask.
+
+    c : 1D :class:`numpy.ndarray`
+        Indices of the voxels of the mask in the C-ordered flattened mask.
+
+    f : 1D :class:`numpy.ndarray`
+        Indices of the same voxels, in the same order, in the F-ordered
+        flattened mask.
+    """
+
+    def __init__(self, mask):
+        self.shape = mask.shape
+        self.c = np.flatnonzero(mask)
+        self.f = np.ravel_multi_index(
+            np.unravel_index(self.c, self.shape), self.shape, order="F"
+        )
+        self.n_features = self.c.shape[0]
+
+
+def _check_unmask_out(out, shape):
+    """Check that out can receive unmasked data of the given shape."""
+    if out.shape != shape:
+        raise ValueError(f"out must be of shape {shape}. Got {out.shape}.")
+    if not (out.flags.c_contiguous or out.flags.f_contiguous):
+        raise ValueError("out must be a C or F contiguous array.")
+
+
+def _unmask_3d(X, mask, order="C", out=None):
     """Take masked data and bring them back to 3D (space only).
 
     Parameters
@@ -969,28 +1017,36 @@ def _unmask_3d(X, mask, order="C"):
     X : :class:`numpy.ndarray`
         Masked data. shape: (features,)
 
-    mask : Niimg-like object
-        See :ref:`extracting_data`.
+    mask : :class:`numpy.ndarray` or _MaskIndices
         Mask. mask.ndim must be equal to 3, and dtype *must* be bool.
+
+    order : "F" or "C", default="C"
+        Data ordering of the output array, if out is None.
+
+    out : :class:`numpy.ndarray` or None, default=None
+        C or F contiguous array of the shape of the mask in which to place
+        the unmasked data. Voxels outside of the mask are not modified.
     """
-    if mask.dtype != bool:
-        raise TypeError("mask must be a boolean array")
+    if not isinstance(mask, _MaskIndices):
+        if mask.dtype != bool:
+            raise TypeError("mask must be a boolean array")
+        mask = _MaskIndices(mask)
     if X.ndim != 1:
         raise TypeError("X must be a 1-dimensional array")
-    n_features = mask.sum()
-    if X.shape[0] != n_features:
-        raise TypeError(f"X must be of shape (samples, {n_features}).")
-
-    data = np.zeros(
-        (mask.shape[0], mask.shape[1], mask.shape[2]),
-        dtype=X.dtype,
-        order=order,
-    )
-    data[mask] = X
-    return data
+    if X.shape[0] != mask.n_features:
+        raise TypeError(f"X must be of shape (samples, {mask.n_features}).")
+
+    if out is None:
+        out = np.zeros(mask.shape, dtype=X.dtype, order=order)
+    _check_unmask_out(out, mask.shape)
+    if out.flags.c_contiguous:
+        np.put(out, mask.c, X)
+    else:
+        np.put(out.ravel(order="F"), mask.f, X)
+    return out
 
 
-def _unmask_4d(X, mask, order="C"):
+def _unmask_4d(X, mask, order="C", out=None):
     """Take masked data and bring them back to 4D.
 
     Parameters
@@ -998,8 +1054,15 @@ def _unmask_4d(X, mask, order="C"):
     X : :class:`numpy.ndarray`
         Masked data. shape: (samples, features)
 
-    mask : :class:`numpy.ndarray`
-        Mask. mask.ndim must be equal to 4, and dtype *must* be bool.
+    mask : :class:`numpy.ndarray` or _MaskIndices
+        Mask. mask.ndim must be equal to 3, and dtype *must* be bool.
+
+    order : "F" or "C", default="C"
+        Data ordering of the output array, if out is None.
+
+    out : :class:`numpy.ndarray` or None, default=None
+        C or F contiguous array in which to place the unmasked data.
+        Voxels outside of the mask are not modified.
 
     Returns
     -------
@@ -1007,20 +1070,45 @@ def _unmask_4d(X, mask, order="C"):
         Unmasked data.
         Shape: (mask.shape[0], mask.shape[1], mask.shape[2], X.shape[0])
     """
-    if mask.dtype != bool:
-        raise TypeError("mask must be a boolean array")
+    if not isinstance(mask, _MaskIndices):
+        if mask.dtype != bool:
+            raise TypeError("mask must be a boolean array")
+        mask = _MaskIndices(mask)
     if X.ndim != 2:
         raise TypeError("X must be a 2-dimensional array")
-    n_features = mask.sum()
-    if X.shape[1] != n_features:
-        raise TypeError(f"X must be of shape (samples, {n_features}).")
+    if X.shape[1] != mask.n_features:
+        raise TypeError(f"X must be of shape (samples, {mask.n_features}).")
+
+    n_samples = X.shape[0]
+    if out is None:
+        out = np.zeros((*mask.shape, n_samples), dtype=X.dtype, order=order)
+    _check_unmask_out(out, (*mask.shape, n_samples))
+    if out.flags.f_contiguous:
+        # Each volume is contiguous: scatter the samples one at a time.
+        volumes = out.reshape((-1, n_samples), order="F").T
+        for volume, x in zip(volumes, X):
+            np.put(volume, mask.f, x)
+    else:
+        out.reshape((-1, n_samples))[mask.c] = X.T
+    return out
+
 
-    data = np.zeros((*mask.shape, X.shape[0]), dtype=X.dtype, order=order)
-    data[mask, :] = X.T
-    return data
+def _unmask_array(X, mask, order="F", out=None):
+    """Unmask 1D or 2D masked data into a 3D or 4D array.
+
+    See :func:`unmask` for the parameters, with mask a boolean array or
+    _MaskIndices.
+    """
+    if np.ndim(X) == 2:
+        return _unmask_4d(X, mask, order=order, out=out)
+    elif np.ndim(X) == 1:
+        return _unmask_3d(X, mask, order=order, out=out)
+    raise TypeError(
+        f"Masked data X must be 2D or 1D array; got shape: {X.shape!s}"
+    )
 
 
-def unmask(X, mask_img, order="F"):
+def unmask(X, mask_img, order="F", out=None):
     """Take masked data and bring them back into 3D/4D.
 
     This function can be applied to a list of masked data.
@@ -1039,6 +1127,17 @@ def unmask(X, mask_img, order="F"):
         Data ordering in output array. This function is slightly faster with
         Fortran ordering.
 
+    out : :class:`numpy.ndarray` or None, default=None
+        C or F contiguous array in which to place the unmasked data, of
+        shape (mask.shape[0], mask.shape[1], mask.shape[2], X.shape[0]) if
+        X is two-dimensional and of the shape of the mask otherwise.
+        ``order`` is then ignored. Voxels outside of the mask are not
+        modified, so a buffer reused for images of the same mask only needs
+        to be filled with zeros once. Not supported for lists of masked
+        data.
+
+        .. versionadded:: 0.12.1
+
     Returns
     -------
     data : :class:`nibabel.nifti1.Nifti1Image`
@@ -1053,6 +1152,8 @@ def unmask(X, mask_img, order="F"):
     # Handle lists. This can be a list of other lists / arrays, or a list or
     # numbers. In the latter case skip.
     if isinstance(X, list) and not isinstance(X[0], numbers.Number):
+        if out is not None:
+            raise ValueError("out is not supported for lists of masked data.")
         return [unmask(x, mask_img, order=order) for x in X]
 
     # The code after this block assumes that X is an ndarray; ensure this
@@ -1061,14 +1162,7 @@ def unmask(X, mask_img, order="F"):
     mask_img = check_niimg_3d(mask_img)
     mask, affine = load_mask_img(mask_img)
 
-    if np.ndim(X) == 2:
-        unmasked = _unmask_4d(X, mask, order=order)
-    elif np.ndim(X) == 1:
-        unmasked = _unmask_3d(X, mask, order=order)
-    else:
-        raise TypeError(
-            f"Masked data X must be 2D or 1D array; got shape: {X.shape!s}"
-        )
+    unmasked = _unmask_array(X, mask, order=order, out=out)
 
     return new_img_like(mask_img, unmasked, affine)
 
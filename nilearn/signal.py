@@ -5,15 +5,18 @@ All functions in this module should take X matrices with samples x
 features
 """
 
+import functools
 import warnings
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from scipy import linalg
 from scipy import signal as sp_signal
 from scipy.interpolate import CubicSpline
 from sklearn.utils import as_float_array, gen_even_slices
+from sklearn.utils.extmath import randomized_svd
 
 from nilearn._utils import fill_doc, stringify_path
 from nilearn._utils.exceptions import AllVolumesRemovedError
@@ -25,6 +28,7 @@ from nilearn._utils.param_validation import (
 )
 
 __all__ = [
+    "CleaningPlan",
     "butterworth",
     "clean",
     "high_variance_confounds",
@@ -341,6 +345,7 @@ def butterworth(
     padtype="odd",
     padlen=None,
     copy=False,
+    n_jobs=1,
 ):
     """Apply a low-pass, high-pass or band-pass \
     `Butterworth filter <https://en.wikipedia.org/wiki/Butterworth_filter>`_.
@@ -376,7 +381,12 @@ def butterworth(
 
     copy : :obj:`bool`, default=False
         If False, `signals` is modified inplace, and memory consumption is
-        lower than for ``copy=True``, though computation time is higher.
+        lower than for ``copy=True``.
+
+    %(n_jobs)s
+        Blocks of signals are filtered in parallel threads.
+
+        .. versionadded:: 0.12.1
 
     Returns
     -------
@@ -427,13 +437,13 @@ def butterworth(
     else:
         critical_freq = critical_freq[0]
 
-    sos = sp_signal.butter(
-        N=order,
-        Wn=critical_freq,
-        btype=btype,
-        output="sos",
-        fs=sampling_rate,
-    )
+    # scipy needs a writeable array of coefficients
+    sos = _butterworth_sos(
+        order,
+        tuple(np.atleast_1d(critical_freq).tolist()),
+        btype,
+        sampling_rate,
+    ).copy()
     if signals.ndim == 1:
         # 1D case
         output = sp_signal.sosfiltfilt(
@@ -446,34 +456,61 @@ def butterworth(
             signals = output
         else:
             signals[...] = output
-    elif copy:
-        # No way to save memory when a copy has been requested,
-        # because filtfilt does out-of-place processing
-        signals = sp_signal.sosfiltfilt(
+        return signals
+
+    if copy:
+        signals = signals.astype(np.result_type(signals, sos))
+
+    # Filter blocks of time series in place, so that the padded copies and
+    # temporaries made by sosfiltfilt stay small.
+    def filter_block(columns):
+        signals[:, columns] = sp_signal.sosfiltfilt(
             sos,
-            x=signals,
+            x=signals[:, columns],
             axis=0,
             padtype=padtype,
             padlen=padlen,
         )
-    else:
-        # Lesser memory consumption, slower.
-        for timeseries in signals.T:
-            timeseries[:] = sp_signal.sosfiltfilt(
-                sos,
-                x=timeseries,
-                padtype=padtype,
-                padlen=padlen,
-            )
-
-        # results returned in-place
 
+    _apply_by_blocks(
+        filter_block,
+        signals.shape[1],
+        max(1, _BLOCK_N_ELEMENTS // max(signals.shape[0], 1)),
+        n_jobs,
+    )
     return signals
 
 
+# Number of elements of the blocks of signals processed at once
+_BLOCK_N_ELEMENTS = 2**20
+
+
+@functools.lru_cache(maxsize=32)
+def _butterworth_sos(order, critical_freq, btype, sampling_rate):
+    """Return the second-order sections of a Butterworth filter.
+
+    The design only depends on the filter parameters, so it is cached for
+    the signals filtered repeatedly with the same filter.
+    """
+    sos = sp_signal.butter(
+        N=order,
+        Wn=critical_freq[0] if len(critical_freq) == 1 else critical_freq,
+        btype=btype,
+        output="sos",
+        fs=sampling_rate,
+    )
+    sos.flags.writeable = False
+    return sos
+
+
 @fill_doc
 def high_variance_confounds(
-    series, n_confounds=5, percentile=2.0, detrend=True
+    series,
+    n_confounds=5,
+    percentile=2.0,
+    detrend=True,
+    svd_solver="full",
+    dtype=None,
 ) -> np.ndarray:
     """Return confounds time series extracted from series \
     with highest variance.
@@ -495,6 +532,25 @@ def high_variance_confounds(
     %(detrend)s
         Default=True.
 
+    svd_solver : {"full", "randomized"}, default="full"
+        How the singular vectors are computed:
+
+        - "full": exact, from the leading eigenvectors of the Gram matrix
+          of the extracted series.
+        - "randomized": approximate, with
+          :func:`sklearn.utils.extmath.randomized_svd` and a fixed random
+          state. It can be faster for long series.
+
+        .. versionadded:: 0.12.1
+
+    dtype : dtype like or None, default=None
+        Floating point type in which the confounds are computed, for
+        instance "float32" to halve the memory used. If None, the type of
+        series is used. Other types are converted as when detrending: to
+        float64 if their items take 8 bytes, to float32 otherwise.
+
+        .. versionadded:: 0.12.1
+
     Returns
     -------
     v : :class:`numpy.ndarray`
@@ -522,31 +578,59 @@ def high_variance_confounds(
     nilearn.image.high_variance_confounds
     """
     check_params(locals())
-    if detrend:
-        series = _detrend(series)  # copy
+    if svd_solver not in ("full", "randomized"):
+        raise ValueError(
+            f"'svd_solver' must be 'full' or 'randomized'. Got {svd_solver!r}."
+        )
+    dtype = _float_dtype(np.dtype(series.dtype if dtype is None else dtype))
 
     # Retrieve the voxels|features with highest variance
 
-    # Compute variance without mean removal.
-    var = _mean_of_squares(series)
+    # Compute variance without mean removal, on blocks of detrended series
+    # to avoid copying all of them.
+    var = np.empty(series.shape[1])
+
+    def mean_of_squares_block(columns):
+        block = np.array(series[:, columns], dtype=dtype)
+        if detrend:
+            block = _detrend(block, inplace=True)
+        var[columns] = _mean_of_squares(block)
+
+    _apply_by_blocks(
+        mean_of_squares_block,
+        series.shape[1],
+        max(1, _BLOCK_N_ELEMENTS // max(series.shape[0], 1)),
+        1,
+    )
     var_thr = np.nanpercentile(var, 100.0 - percentile)
-    series = series[:, var > var_thr]  # extract columns (i.e. features)
+    # extract columns (i.e. features)
+    series = np.array(series[:, var > var_thr], dtype=dtype)
+    if detrend and series.shape[1] > 0:
+        series = _detrend(series, inplace=True)
+
     # Return the singular vectors with largest singular values
+    if svd_solver == "randomized":
+        u, _, _ = randomized_svd(series, n_confounds, random_state=0)
+        return u
     # We solve the symmetric eigenvalue problem here, increasing stability
-    s, u = linalg.eigh(series.dot(series.T) / series.shape[0])
-    ix_ = np.argsort(s)[::-1]
-    u = u[:, ix_[:n_confounds]].copy()
-    return u
+    n_samples = series.shape[0]
+    _, u = linalg.eigh(
+        series.dot(series.T) / n_samples,
+        subset_by_index=[max(n_samples - n_confounds, 0), n_samples - 1],
+    )
+    return u[:, ::-1].copy()
+
+
+def _float_dtype(dtype):
+    """Return the floating point dtype data of a given dtype is cast to."""
+    if dtype.kind == "f":
+        return dtype
+    return np.dtype(np.float64 if dtype.itemsize == 8 else np.float32)
 
 
 def _ensure_float(data):
     """Make sure that data is a float type."""
-    if data.dtype.kind != "f":
-        if data.dtype.itemsize == 8:
-            data = data.astype(np.float64)
-        else:
-            data = data.astype(np.float32)
-    return data
+    return data.astype(_float_dtype(data.dtype), copy=False)
 
 
 @fill_doc
@@ -564,6 +648,8 @@ def clean(
     t_r=2.5,
     ensure_finite=False,
     extrapolate=True,
+    block_size=None,
+    n_jobs=1,
     **kwargs,
 ):
     """Improve :term:`SNR` on masked :term:`fMRI` signals.
@@ -629,6 +715,8 @@ def clean(
         containing signals as columns, with an optional one-line header.
         If a list is provided, all confounds are removed from the input
         signal, as if all were in the same array.
+        A :class:`CleaningPlan` created with the same cleaning parameters can
+        be given instead, to reuse confounds prepared once.
 
     sample_mask : None, Any type compatible with numpy-array indexing, \
                   or :obj:`list` of \
@@ -692,6 +780,18 @@ def clean(
         the signal data will be interpolated before filtering. Otherwise, they
         will be discarded from the band-pass filtering process.
 
+    block_size : :obj:`int` or None, default=None
+        Number of features cleaned at once. Each block of features is copied
+        and cleaned in place, which bounds the size of the temporary arrays.
+        If None, all the features are cleaned in a single block.
+
+        .. versionadded:: 0.12.1
+
+    %(n_jobs)s
+        Blocks of features are cleaned in parallel threads.
+
+        .. versionadded:: 0.12.1
+
     kwargs : :obj:`dict`
         Keyword arguments to be passed to functions called within ``clean``.
         Kwargs prefixed with ``'butterworth__'`` will be passed to
@@ -702,7 +802,8 @@ def clean(
     -------
     cleaned_signals : :class:`numpy.ndarray`
         Input signals, cleaned. Same shape as `signals` unless `sample_mask`
-        is applied.
+        is applied. Floating point signals keep their dtype, other signals
+        are cast to floating point.
 
     Notes
     -----
@@ -721,138 +822,518 @@ def clean(
     nilearn.image.clean_img
     """
     check_params(locals())
-    # Raise warning for some parameter combinations when confounds present
-    confounds = stringify_path(confounds)
-    if confounds is not None:
-        _check_signal_parameters(detrend, standardize_confounds)
-    # check if filter parameters are satisfied and return correct filter
-    filter_type = _check_filter_parameters(filter, low_pass, high_pass, t_r)
-
-    # Read confounds and signals
-    signals, runs, confounds, sample_mask = _sanitize_inputs(
-        signals, runs, confounds, sample_mask, ensure_finite
+    # maskers pass the confounds as a list
+    if isinstance(confounds, (list, tuple)) and any(
+        isinstance(confound, CleaningPlan) for confound in confounds
+    ):
+        if len(confounds) != 1:
+            raise ValueError(
+                "A CleaningPlan cannot be combined with other confounds."
+            )
+        confounds = confounds[0]
+    if isinstance(confounds, CleaningPlan):
+        plan = confounds
+        plan._check_clean_parameters(
+            runs=runs,
+            sample_mask=sample_mask,
+            detrend=detrend,
+            standardize_confounds=standardize_confounds,
+            # check if filter parameters are satisfied and return correct
+            # filter
+            filter_type=_check_filter_parameters(
+                filter, low_pass, high_pass, t_r
+            ),
+            low_pass=low_pass,
+            high_pass=high_pass,
+            t_r=t_r,
+            extrapolate=extrapolate,
+            butterworth_kwargs=_butterworth_kwargs(kwargs),
+        )
+    else:
+        # The confounds of each run are prepared before cleaning the signals
+        plan = CleaningPlan(
+            len(signals),
+            confounds=confounds,
+            sample_mask=sample_mask,
+            runs=runs,
+            detrend=detrend,
+            standardize_confounds=standardize_confounds,
+            filter=filter,
+            low_pass=low_pass,
+            high_pass=high_pass,
+            t_r=t_r,
+            extrapolate=extrapolate,
+            **kwargs,
+        )
+    return plan.clean(
+        signals,
+        standardize=standardize,
+        ensure_finite=ensure_finite,
+        block_size=block_size,
+        n_jobs=n_jobs,
     )
 
-    # Process each run independently
-    if runs is not None:
-        return _process_runs(
-            signals,
-            runs,
-            detrend,
-            standardize,
-            confounds,
-            sample_mask,
-            filter_type,
-            low_pass,
-            high_pass,
-            t_r,
-        )
 
-    # For the following steps, sample_mask should be either None or index-like
+def _as_slice(indices):
+    """Return a slice equivalent to sorted indices if they are contiguous.
 
-    # Generate cosine drift terms using the full length of the signals
-    if filter_type == "cosine":
-        confounds = _create_cosine_drift_terms(
-            signals, confounds, high_pass, t_r
-        )
+    Signals of contiguous runs are then views instead of copies.
+    """
+    if indices.size > 0 and indices[-1] - indices[0] == indices.size - 1:
+        return slice(indices[0], indices[-1] + 1)
+    return indices
 
-    # Interpolation / censoring
-    signals, confounds, sample_mask = _handle_scrubbed_volumes(
-        signals, confounds, sample_mask, filter_type, t_r, extrapolate
-    )
-    # Detrend
-    # Detrend and filtering should apply to confounds, if confound presents
-    # keep filters orthogonal (according to Lindquist et al. (2018))
-    # Restrict the signal to the orthogonal of the confounds
-    original_mean_signals = signals.mean(axis=0)
-    if detrend:
-        signals = standardize_signal(
-            signals, standardize=False, detrend=detrend
-        )
-        if confounds is not None:
-            confounds = standardize_signal(
-                confounds, standardize=False, detrend=detrend
-            )
 
-    # Butterworth filtering
-    if filter_type == "butterworth":
-        butterworth_kwargs = {
-            k.replace("butterworth__", ""): v
-            for k, v in kwargs.items()
-            if k.startswith("butterworth__")
-        }
-        signals = butterworth(
-            signals,
-            sampling_rate=1.0 / t_r,
-            low_pass=low_pass,
-            high_pass=high_pass,
-            **butterworth_kwargs,
+def _butterworth_kwargs(kwargs):
+    """Return the kwargs of clean to pass to butterworth."""
+    return {
+        k.replace("butterworth__", ""): v
+        for k, v in kwargs.items()
+        if k.startswith("butterworth__")
+    }
+
+
+def _clean_single_run(
+    signals,
+    confound_basis,
+    sample_mask,
+    detrend,
+    standardize,
+    filter_type,
+    low_pass,
+    high_pass,
+    t_r,
+    ensure_finite,
+    extrapolate,
+    butterworth_kwargs,
+    block_size,
+    n_jobs,
+    out=None,
+):
+    """Clean the signals of a single run.
+
+    confound_basis is an orthonormal basis of the cleaned confounds, as
+    returned by _confound_basis, or None. The cleaned signals are written in
+    out if it is given.
+    """
+    n_time, n_features = signals.shape
+    n_samples = (
+        n_time if sample_mask is None else np.arange(n_time)[sample_mask].size
+    )
+    dtype = _float_dtype(signals.dtype)
+    cleaned_signals = (
+        np.empty((n_samples, n_features), dtype=dtype) if out is None else out
+    )
+    original_mean_signals = np.empty(n_features, dtype=dtype)
+
+    def clean_block(columns):
+        block = np.array(signals[:, columns], dtype=dtype)
+        if ensure_finite:
+            block[~np.isfinite(block)] = 0
+        # Interpolation / censoring
+        block, _, block_sample_mask = _handle_scrubbed_volumes(
+            block,
+            None,
+            None if sample_mask is None else sample_mask.copy(),
+            filter_type,
+            t_r,
+            extrapolate,
         )
-        if confounds is not None:
-            # Apply low- and high-pass filters to keep filters orthogonal
-            # (according to Lindquist et al. (2018))
-            confounds = butterworth(
-                confounds,
+        original_mean_signals[columns] = block.mean(axis=0)
+        if detrend:
+            block = _detrend(block, inplace=True)
+        if filter_type == "butterworth":
+            block = butterworth(
+                block,
                 sampling_rate=1.0 / t_r,
                 low_pass=low_pass,
                 high_pass=high_pass,
                 **butterworth_kwargs,
             )
+            # apply sample_mask to remove censored volumes after signal
+            # filtering
+            if block_sample_mask is not None:
+                block = block[block_sample_mask, :]
+        # Restrict the signal to the orthogonal of the confounds
+        if confound_basis is not None:
+            block -= confound_basis @ (confound_basis.T @ block)
+        cleaned_signals[:, columns] = block
 
-        # apply sample_mask to remove censored volumes after signal filtering
-        if sample_mask is not None:
-            signals, confounds = _censor_signals(
-                signals, confounds, sample_mask
-            )
-
-    # Remove confounds
-    if confounds is not None:
-        confounds = standardize_signal(
-            confounds, standardize=standardize_confounds, detrend=False
-        )
-        if not standardize_confounds:
-            # Improve numerical stability by controlling the range of
-            # confounds. We don't rely on standardize_signal as it removes any
-            # constant contribution to confounds.
-            confound_max = np.max(np.abs(confounds), axis=0)
-            confound_max[confound_max == 0] = 1
-            confounds /= confound_max
-
-        # Pivoting in qr decomposition was added in scipy 0.10
-        Q, R, _ = linalg.qr(confounds, mode="economic", pivoting=True)
-        Q = Q[:, np.abs(np.diag(R)) > np.finfo(np.float64).eps * 100.0]
-        signals -= Q.dot(Q.T).dot(signals)
+    _apply_by_blocks(clean_block, n_features, block_size, n_jobs)
 
     # Standardize
     if not standardize:
-        return signals
+        return cleaned_signals
 
     # detect if mean is close to zero; This can obscure the scale of the signal
     # with percent signal change standardization. This should happen when the
     # data was 1. detrended 2. high pass filtered.
     filtered_mean_check = (
-        np.abs(signals.mean(0)).mean() / np.abs(original_mean_signals).mean()
+        np.abs(cleaned_signals.mean(0)).mean()
+        / np.abs(original_mean_signals).mean()
         < 1e-1
     )
-    if standardize == "psc" and filtered_mean_check:
-        # If the signal is detrended, the mean signal will be zero or close to
-        # zero. If signal is high pass filtered with butterworth, the constant
-        # (mean) will be removed. This is detected through checking the scale
-        # difference of the original mean and filtered mean signal. When the
-        # mean is too small, we have to know the original mean signal to
-        # calculate the psc to avoid weird scaling.
-        signals = standardize_signal(
-            signals + original_mean_signals,
-            standardize=standardize,
-            detrend=False,
+    # If the signal is detrended, the mean signal will be zero or close to
+    # zero. If signal is high pass filtered with butterworth, the constant
+    # (mean) will be removed. This is detected through checking the scale
+    # difference of the original mean and filtered mean signal. When the
+    # mean is too small, we have to know the original mean signal to
+    # calculate the psc to avoid weird scaling.
+    add_original_mean = standardize == "psc" and filtered_mean_check
+
+    def standardize_block(columns):
+        block = cleaned_signals[:, columns]
+        if add_original_mean:
+            block = block + original_mean_signals[columns]
+        cleaned_signals[:, columns] = standardize_signal(
+            block, standardize=standardize, detrend=False
         )
-    else:
-        signals = standardize_signal(
-            signals,
-            standardize=standardize,
-            detrend=False,
+
+    _apply_by_blocks(standardize_block, n_features, block_size, n_jobs)
+    return cleaned_signals
+
+
+def _confound_basis(
+    confounds,
+    sample_mask,
+    filter_type,
+    detrend,
+    standardize_confounds,
+    low_pass,
+    high_pass,
+    t_r,
+    extrapolate,
+    butterworth_kwargs,
+):
+    """Return an orthonormal basis of the cleaned confounds.
+
+    The confounds go through the same interpolation, detrending, filtering
+    and censoring as the signals. Returns None if there are no confounds.
+    """
+    if confounds is None:
+        return None
+
+    confounds, _, sample_mask = _handle_scrubbed_volumes(
+        confounds,
+        None,
+        None if sample_mask is None else sample_mask.copy(),
+        filter_type,
+        t_r,
+        extrapolate,
+    )
+    if detrend:
+        confounds = standardize_signal(
+            confounds, standardize=False, detrend=detrend
         )
-    return signals
+    if filter_type == "butterworth":
+        confounds = butterworth(
+            confounds,
+            sampling_rate=1.0 / t_r,
+            low_pass=low_pass,
+            high_pass=high_pass,
+            **butterworth_kwargs,
+        )
+        if sample_mask is not None:
+            confounds = confounds[sample_mask, :]
+
+    confounds = standardize_signal(
+        confounds, standardize=standardize_confounds, detrend=False
+    )
+    if not standardize_confounds:
+        # Improve numerical stability by controlling the range of
+        # confounds. We don't rely on standardize_signal as it removes any
+        # constant contribution to confounds.
+        confound_max = np.max(np.abs(confounds), axis=0)
+        confound_max[confound_max == 0] = 1
+        confounds /= confound_max
+
+    # Pivoting in qr decomposition was added in scipy 0.10
+    Q, R, _ = linalg.qr(confounds, mode="economic", pivoting=True)
+    return Q[:, np.abs(np.diag(R)) > np.finfo(np.float64).eps * 100.0]
+
+
+def _apply_by_blocks(function, n_features, block_size, n_jobs):
+    """Call function on blocks of at most block_size feature indices.
+
+    The blocks are processed in threads, function must write its results in
+    place.
+    """
+    if block_size is None or n_features == 0:
+        block_size = max(n_features, 1)
+    blocks = [
+        slice(start, min(start + block_size, n_features))
+        for start in range(0, max(n_features, 1), block_size)
+    ]
+    if len(blocks) == 1 or n_jobs == 1:
+        for block in blocks:
+            function(block)
+        return
+    Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(function)(block) for block in blocks
+    )
+
+
+@fill_doc
+class CleaningPlan:
+    """Confound removal prepared once and shared by calls to :func:`clean`.
+
+    The cosine drift terms, the interpolation, detrending, filtering and
+    censoring of the confounds and their orthonormalization do not depend on
+    the signals. A plan computes them once for a run, so that several
+    signals of this run, for instance extracted by different maskers, can be
+    cleaned without preparing the confounds again.
+
+    A plan can be passed as ``confounds`` to :func:`clean` or to the
+    ``transform`` method of maskers, instead of the confounds it was created
+    from. The cleaning parameters of the call must then be the ones of the
+    plan, and ``runs`` and ``sample_mask`` must not be given again.
+
+    .. versionadded:: 0.12.1
+
+    Parameters
+    ----------
+    n_samples : :obj:`int`
+        Number of time points of the signals to clean.
+
+    confounds : :class:`numpy.ndarray`, :obj:`str`, :class:`pathlib.Path`, \
+                :class:`pandas.DataFrame` \
+                or :obj:`list` of confounds timeseries, default=None
+        Confounds to remove from the signals.
+        See :func:`clean` for details.
+
+    sample_mask : Any type compatible with numpy-array indexing, \
+                  or :obj:`list` of them, default=None
+        Volumes kept in the signals. See :func:`clean` for details.
+
+    runs : :class:`numpy.ndarray`, default=None
+        Run of each time point. See :func:`clean` for details.
+
+    %(detrend)s
+        Default=True.
+
+    %(standardize_confounds)s
+
+    filter : {'butterworth', 'cosine', False}, default='butterworth'
+        Filtering method. See :func:`clean` for details.
+
+    %(low_pass)s
+
+    %(high_pass)s
+
+    %(t_r)s
+        Default=2.5.
+
+    extrapolate : :obj:`bool`, default=True
+        If `True` and filter='butterworth', censored volumes in both ends of
+        the signal data will be interpolated before filtering.
+
+    kwargs : :obj:`dict`
+        Kwargs prefixed with ``'butterworth__'`` will be passed to
+        :func:`~nilearn.signal.butterworth`.
+
+    See Also
+    --------
+    nilearn.signal.clean
+    """
+
+    def __init__(
+        self,
+        n_samples,
+        confounds=None,
+        sample_mask=None,
+        runs=None,
+        detrend=True,
+        standardize_confounds=True,
+        filter="butterworth",
+        low_pass=None,
+        high_pass=None,
+        t_r=2.5,
+        extrapolate=True,
+        **kwargs,
+    ):
+        confounds = stringify_path(confounds)
+        if confounds is not None:
+            _check_signal_parameters(detrend, standardize_confounds)
+        filter_type = _check_filter_parameters(
+            filter, low_pass, high_pass, t_r
+        )
+        self.n_samples = n_samples
+        self._parameters = {
+            "detrend": detrend,
+            "standardize_confounds": standardize_confounds,
+            "filter_type": filter_type,
+            "low_pass": low_pass,
+            "high_pass": high_pass,
+            "t_r": t_r,
+            "extrapolate": extrapolate,
+            "butterworth_kwargs": _butterworth_kwargs(kwargs),
+        }
+
+        n_runs, runs = _sanitize_runs(n_samples, runs)
+        confounds = sanitize_confounds(n_samples, confounds)
+        sample_mask = _sanitize_sample_mask(
+            n_samples, n_runs, runs, sample_mask
+        )
+        self._run_indices = [slice(None)]
+        if runs is not None:
+            self._run_indices = [
+                _as_slice(np.flatnonzero(runs == run))
+                for run in np.unique(runs)
+            ]
+        self._sample_masks = (
+            sample_mask
+            if isinstance(sample_mask, list)
+            else [sample_mask] * n_runs
+        )
+        self._confound_bases = []
+        for indices, run_sample_mask in zip(
+            self._run_indices, self._sample_masks
+        ):
+            run_confounds = None if confounds is None else confounds[indices]
+            if filter_type == "cosine":
+                # only the number of samples of the run is used
+                run_confounds = _create_cosine_drift_terms(
+                    np.arange(n_samples)[indices],
+                    run_confounds,
+                    high_pass,
+                    t_r,
+                )
+            self._confound_bases.append(
+                _confound_basis(
+                    run_confounds,
+                    run_sample_mask,
+                    filter_type,
+                    detrend,
+                    standardize_confounds,
+                    low_pass,
+                    high_pass,
+                    t_r,
+                    extrapolate,
+                    self._parameters["butterworth_kwargs"],
+                )
+            )
+
+    def _check_clean_parameters(self, runs, sample_mask, **parameters):
+        """Check that clean is called with the parameters of the plan."""
+        for name, value in (("runs", runs), ("sample_mask", sample_mask)):
+            if value is not None:
+                raise ValueError(
+                    f"'{name}' must be given to the CleaningPlan, "
+                    "not to clean."
+                )
+        if not self._parameters["filter_type"]:
+            # the repetition time and cutoff frequencies are not used
+            for name in ("low_pass", "high_pass", "t_r", "butterworth_kwargs"):
+                parameters[name] = self._parameters[name]
+        mismatches = [
+            f"{name}={value!r} (plan: {self._parameters[name]!r})"
+            for name, value in parameters.items()
+            if value != self._parameters[name]
+        ]
+        if mismatches:
+            raise ValueError(
+                "clean was called with cleaning parameters different from "
+                f"the ones of the CleaningPlan: {', '.join(mismatches)}."
+            )
+
+    @fill_doc
+    def clean(
+        self,
+        signals,
+        standardize="zscore",
+        ensure_finite=False,
+        block_size=None,
+        n_jobs=1,
+    ):
+        """Clean signals with the plan.
+
+        Parameters
+        ----------
+        signals : :class:`numpy.ndarray`
+            Timeseries of shape (n_samples, features number).
+            This array is not modified.
+
+        standardize : {'zscore_sample', 'zscore', 'psc', True, False}, \
+                      default="zscore"
+            Strategy to standardize the signal.
+            See :func:`clean` for details.
+
+        ensure_finite : :obj:`bool`, default=False
+            If `True`, the non-finite values (NANs and infs) found in the
+            data will be replaced by zeros.
+
+        block_size : :obj:`int` or None, default=None
+            Number of features cleaned at once.
+            See :func:`clean` for details.
+
+        %(n_jobs)s
+
+        Returns
+        -------
+        cleaned_signals : :class:`numpy.ndarray`
+            Signals cleaned as :func:`clean` would with the confounds and
+            parameters of the plan.
+        """
+        if block_size is not None and (
+            not isinstance(block_size, (int, np.integer)) or block_size < 1
+        ):
+            raise ValueError(
+                "'block_size' must be None or a positive integer. "
+                f"Got {block_size!r}."
+            )
+        signals = _sanitize_signals(signals, ensure_finite)
+        if len(signals) != self.n_samples:
+            raise ValueError(
+                f"The CleaningPlan was created for {self.n_samples} samples, "
+                f"but the signals have {len(signals)} samples."
+            )
+
+        # Each run is cleaned into its slice of the output
+        run_lengths = [
+            np.arange(self.n_samples)[indices].size
+            for indices in self._run_indices
+        ]
+        n_cleaned = [
+            length
+            if sample_mask is None
+            else np.arange(length)[sample_mask].size
+            for length, sample_mask in zip(run_lengths, self._sample_masks)
+        ]
+        offsets = np.cumsum([0, *n_cleaned])
+        cleaned_signals = np.empty(
+            (offsets[-1], signals.shape[1]), dtype=_float_dtype(signals.dtype)
+        )
+        n_runs = len(self._run_indices)
+        parameters = self._parameters
+
+        def clean_run(i):
+            _clean_single_run(
+                signals[self._run_indices[i]],
+                self._confound_bases[i],
+                self._sample_masks[i],
+                parameters["detrend"],
+                standardize,
+                parameters["filter_type"],
+                parameters["low_pass"],
+                parameters["high_pass"],
+                parameters["t_r"],
+                ensure_finite,
+                parameters["extrapolate"],
+                parameters["butterworth_kwargs"],
+                block_size,
+                # the threads go to the runs if there are several
+                n_jobs if n_runs == 1 else 1,
+                out=cleaned_signals[offsets[i] : offsets[i + 1]],
+            )
+
+        if n_runs == 1 or n_jobs == 1:
+            for i in range(n_runs):
+                clean_run(i)
+        else:
+            Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(clean_run)(i) for i in range(n_runs)
+            )
+        return cleaned_signals
 
 
 def _handle_scrubbed_volumes(
@@ -906,17 +1387,43 @@ def _interpolate_volumes(volumes, sample_mask, t_r, extrapolate):
             message=extrapolate_default,
             stacklevel=find_stack_level(),
         )
-    frame_times = np.arange(volumes.shape[0]) * t_r
-    remained_vol = frame_times[sample_mask]
-    remained_x = volumes[sample_mask, :]
-    cubic_spline_fitter = CubicSpline(
-        remained_vol, remained_x, extrapolate=extrapolate
+    kept = np.zeros(volumes.shape[0], dtype=bool)
+    kept[sample_mask] = True
+    weights = _interpolation_weights(kept.tobytes(), t_r, extrapolate)
+    weights = weights.astype(volumes.dtype, copy=False)
+
+    def interpolate_block(columns):
+        volumes[~kept, columns] = weights @ volumes[kept, columns]
+
+    _apply_by_blocks(
+        interpolate_block,
+        volumes.shape[1],
+        max(1, _BLOCK_N_ELEMENTS // max(volumes.shape[0], 1)),
+        1,
     )
-    volumes_interpolated = cubic_spline_fitter(frame_times)
-    volumes[~sample_mask, :] = volumes_interpolated[~sample_mask, :]
     return volumes
 
 
+@functools.lru_cache(maxsize=8)
+def _interpolation_weights(kept, t_r, extrapolate):
+    """Return the weights of the kept volumes in the censored volumes.
+
+    Cubic spline interpolation is linear in the interpolated values, so the
+    splines through the columns of the identity give the contribution of
+    each kept volume to each censored volume. They only depend on the sample
+    mask, given as the bytes of a boolean mask of the kept volumes, and are
+    cached for the blocks and signals of a run.
+    """
+    kept = np.frombuffer(kept, dtype=bool)
+    frame_times = np.arange(kept.size) * t_r
+    cubic_spline_fitter = CubicSpline(
+        frame_times[kept], np.eye(kept.sum()), extrapolate=extrapolate
+    )
+    weights = cubic_spline_fitter(frame_times[~kept])
+    weights.flags.writeable = False
+    return weights
+
+
 def _create_cosine_drift_terms(signals, confounds, high_pass, t_r):
     """Create cosine drift terms, append to confounds regressors."""
     from nilearn.glm.first_level.design_matrix import create_cosine_drift
@@ -962,57 +1469,6 @@ def _check_cosine_by_user(confounds, cosine_drift):
     return np.hstack((confounds, cosine_drift))
 
 
-def _process_runs(
-    signals,
-    runs,
-    detrend,
-    standardize,
-    confounds,
-    sample_mask,
-    filter,
-    low_pass,
-    high_pass,
-    t_r,
-):
-    """Process each run independently."""
-    if len(runs) != len(signals):
-        raise ValueError(
-            f"The length of the run vector ({len(runs)}) "
-            f"does not match the length of the signals ({len(signals)})"
-        )
-    cleaned_signals = []
-    for i, run in enumerate(np.unique(runs)):
-        run_confounds = None
-        run_sample_mask = None
-        if confounds is not None:
-            run_confounds = confounds[runs == run]
-        if sample_mask is not None:
-            run_sample_mask = sample_mask[i]
-        run_signals = clean(
-            signals[runs == run],
-            detrend=detrend,
-            standardize=standardize,
-            confounds=run_confounds,
-            sample_mask=run_sample_mask,
-            filter=filter,
-            low_pass=low_pass,
-            high_pass=high_pass,
-            t_r=t_r,
-        )
-        cleaned_signals.append(run_signals)
-    return np.vstack(cleaned_signals)
-
-
-def _sanitize_inputs(signals, runs, confounds, sample_mask, ensure_finite):
-    """Clean up signals and confounds before processing."""
-    n_time = len(signals)  # original length of the signal
-    n_runs, runs = _sanitize_runs(n_time, runs)
-    confounds = sanitize_confounds(n_time, confounds)
-    sample_mask = _sanitize_sample_mask(n_time, n_runs, runs, sample_mask)
-    signals = _sanitize_signals(signals, ensure_finite)
-    return signals, runs, confounds, sample_mask
-
-
 def sanitize_confounds(n_time, confounds):
     """Check confounds are the correct type.
 
@@ -1175,14 +1631,11 @@ def _sanitize_signals(signals, ensure_finite):
             "'ensure_finite' must be boolean type True or False "
             f"but you provided ensure_finite={ensure_finite}"
         )
-    signals = signals.copy()
+    # signals are not copied here: clean copies them block by block, and
+    # replaces non-finite values in the copies
     if not isinstance(signals, np.ndarray):
         signals = as_ndarray(signals)
-    if ensure_finite:
-        mask = np.logical_not(np.isfinite(signals))
-        if mask.any():
-            signals[mask] = 0
-    return _ensure_float(signals)
+    return signals
 
 
 def _check_signal_parameters(detrend, standardize_confounds):
@@ -530,6 +530,48 @@ def test_unmask_3d_with_files(
     assert_array_equal(t[0], unmasked3D)
 
 
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("n_samples", [None, 1, 5])
+def test_unmask_out(rng, affine_eye, shape_3d_default, order, n_samples):
+    """Test unmask into a buffer given by the caller."""
+    mask = rng.integers(2, size=shape_3d_default, dtype="int32")
+    mask_img = Nifti1Image(mask, affine_eye)
+    mask = mask.astype(bool)
+    shape = shape_3d_default
+    if n_samples is None:
+        X = rng.standard_normal(mask.sum())
+    else:
+        X = rng.standard_normal((n_samples, mask.sum()))
+        shape = (*shape, n_samples)
+
+    out = np.zeros(shape, order=order)
+    img = unmask(X, mask_img, out=out)
+
+    assert get_data(img) is out
+    assert_array_equal(out, get_data(unmask(X, mask_img)))
+
+    # only the voxels of the mask are written
+    out[~mask] = 1.0
+    unmask(X, mask_img, out=out)
+
+    assert_array_equal(out[~mask], 1.0)
+    assert_array_equal(out[mask], X.T)
+
+
+def test_unmask_out_errors(rng, affine_eye, shape_3d_default):
+    """Test unmask errors with a buffer given by the caller."""
+    mask = rng.integers(2, size=shape_3d_default, dtype="int32")
+    mask_img = Nifti1Image(mask, affine_eye)
+    X = rng.standard_normal((2, mask.sum()))
+
+    with pytest.raises(ValueError, match="out must be of shape"):
+        unmask(X, mask_img, out=np.zeros(shape_3d_default))
+    with pytest.raises(ValueError, match="contiguous"):
+        unmask(X, mask_img, out=np.zeros((*shape_3d_default, 4))[..., ::2])
+    with pytest.raises(ValueError, match="not supported for lists"):
+        unmask([X], mask_img, out=np.zeros((*shape_3d_default, 2)))
+
+
 def test_unmask_errors(rng, affine_eye, shape_3d_default):
     """Test unmask errors."""
     # A delta in 3D
@@ -1,9 +1,11 @@
 """Test the signals module."""
 
+import warnings
 from pathlib import Path
 
 import numpy as np
 import pytest
+import scipy.interpolate
 import scipy.signal
 from numpy import array_equal
 from numpy.testing import assert_almost_equal, assert_array_equal, assert_equal
@@ -13,10 +15,14 @@ from nilearn._utils.exceptions import AllVolumesRemovedError
 from nilearn.conftest import _rng
 from nilearn.glm.first_level.design_matrix import create_cosine_drift
 from nilearn.signal import (
+    CleaningPlan,
+    _butterworth_sos,
     _censor_signals,
     _create_cosine_drift_terms,
     _detrend,
     _handle_scrubbed_volumes,
+    _interpolate_volumes,
+    _interpolation_weights,
     _mean_of_squares,
     butterworth,
     clean,
@@ -200,6 +206,44 @@ def test_butterworth_multiple_timeseries(
     assert_almost_equal(out1, data)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_butterworth_blocks(monkeypatch, rng, n_jobs):
+    """Check filtering by blocks of time series in threads."""
+    data = rng.standard_normal((100, 25))
+    expected = scipy.signal.sosfiltfilt(
+        scipy.signal.butter(5, [0.05, 0.2], btype="band", output="sos", fs=1),
+        data,
+        axis=0,
+    )
+    monkeypatch.setattr("nilearn.signal._BLOCK_N_ELEMENTS", 300)
+
+    out = butterworth(
+        data.copy(), 1, low_pass=0.2, high_pass=0.05, n_jobs=n_jobs
+    )
+
+    assert_almost_equal(out, expected)
+
+    # in place filtering keeps the dtype
+    data = data.astype("float32")
+    out = butterworth(data, 1, low_pass=0.2, high_pass=0.05, n_jobs=n_jobs)
+
+    assert out is data
+    assert_almost_equal(out, expected, decimal=5)
+
+
+def test_butterworth_sos_cached():
+    """Check the filter design is computed once per set of parameters."""
+    _butterworth_sos.cache_clear()
+    data = np.ones((30, 2))
+
+    butterworth(data, 1, low_pass=0.2)
+    butterworth(data, 1, low_pass=0.2, copy=True)
+    butterworth(data, 1, low_pass=0.3)
+
+    assert _butterworth_sos.cache_info().misses == 2
+    assert _butterworth_sos.cache_info().hits == 1
+
+
 def test_butterworth_nyquist_frequency_clipping(
     data_butterworth_multiple_timeseries,
 ):
@@ -634,6 +678,118 @@ def test_clean_leaves_input_untouched():
     assert array_equal(sx_orig, sx)
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"detrend": True, "standardize": "zscore_sample"},
+        {"low_pass": 0.1, "high_pass": 0.01, "standardize": "psc"},
+        {"filter": "cosine", "high_pass": 0.01},
+        {"sample_mask": np.arange(3, 40), "low_pass": 0.1},
+        {"sample_mask": np.arange(3, 40), "extrapolate": False},
+    ],
+)
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_clean_block_size(kwargs, n_jobs):
+    """Cleaning by blocks of features gives the same signals."""
+    signals, _, confounds = generate_signals(n_features=23, length=41)
+    signals += generate_trends(n_features=23, length=41) + 10
+    signals_orig = signals.copy()
+
+    expected = clean(signals, confounds=confounds, **kwargs)
+    cleaned = clean(
+        signals, confounds=confounds, block_size=7, n_jobs=n_jobs, **kwargs
+    )
+
+    assert_almost_equal(cleaned, expected)
+    assert_array_equal(signals, signals_orig)
+
+
+def test_clean_block_size_error(signals):
+    """Check block_size is validated."""
+    with pytest.raises(ValueError, match="'block_size' must be None"):
+        clean(signals, block_size=0)
+
+
+@pytest.mark.parametrize("block_size", [None, 5])
+def test_clean_keeps_float32(block_size):
+    """Check floating point signals keep their dtype."""
+    signals, _, confounds = generate_signals(n_features=11, length=41)
+    signals = signals.astype("float32")
+
+    cleaned = clean(
+        signals, confounds=confounds, low_pass=0.1, block_size=block_size
+    )
+
+    assert cleaned.dtype == np.float32
+    assert_almost_equal(
+        cleaned,
+        clean(signals.astype("float64"), confounds=confounds, low_pass=0.1),
+        decimal=4,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"low_pass": 0.1, "high_pass": 0.01, "detrend": False},
+        {"filter": "cosine", "high_pass": 0.01},
+        {"sample_mask": np.arange(3, 40), "low_pass": 0.1},
+        {"standardize_confounds": False},
+    ],
+)
+def test_cleaning_plan(kwargs):
+    """A cleaning plan gives the same signals as clean with confounds."""
+    signals, _, confounds = generate_signals(n_features=23, length=41)
+    expected = clean(signals, confounds=confounds, **kwargs)
+
+    plan = CleaningPlan(len(signals), confounds, **kwargs)
+
+    assert_almost_equal(plan.clean(signals, block_size=5), expected)
+    clean_kwargs = {k: v for k, v in kwargs.items() if k != "sample_mask"}
+    assert_almost_equal(
+        clean(signals, confounds=plan, **clean_kwargs), expected
+    )
+    # maskers pass the confounds in a list
+    assert_almost_equal(
+        clean(signals, confounds=[plan], **clean_kwargs), expected
+    )
+
+
+def test_cleaning_plan_runs():
+    """Check cleaning plans with several runs and sample masks."""
+    signals, _, confounds = generate_signals(n_features=11, length=40)
+    runs = np.repeat([0, 1], 20)
+    sample_mask = [np.arange(1, 20), np.arange(18)]
+
+    plan = CleaningPlan(
+        len(signals), confounds, sample_mask=sample_mask, runs=runs
+    )
+
+    assert_almost_equal(
+        plan.clean(signals),
+        clean(
+            signals, confounds=confounds, sample_mask=sample_mask, runs=runs
+        ),
+    )
+
+
+def test_cleaning_plan_errors():
+    """Check the plan is used with its own cleaning parameters."""
+    signals, _, confounds = generate_signals(n_features=11, length=41)
+    plan = CleaningPlan(len(signals), confounds, low_pass=0.1)
+
+    with pytest.raises(ValueError, match=r"low_pass=0.2 \(plan: 0.1\)"):
+        clean(signals, confounds=plan, low_pass=0.2)
+    with pytest.raises(ValueError, match="'sample_mask' must be given"):
+        clean(signals, confounds=plan, low_pass=0.1, sample_mask=np.arange(3))
+    with pytest.raises(ValueError, match="cannot be combined"):
+        clean(signals, confounds=[plan, confounds], low_pass=0.1)
+    with pytest.raises(ValueError, match="created for 41 samples"):
+        plan.clean(signals[:40])
+
+
 def test_clean_runs():
     """Check cleaning across runs."""
     n_samples = 21
@@ -673,6 +829,44 @@ def test_clean_runs():
     assert array_equal(x_run1, x_detrended[0 : n_samples // 2, :])
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_clean_runs_parallel(n_jobs):
+    """Check runs cleaned in threads match each run cleaned separately."""
+    signals, _, confounds = generate_signals(n_features=13, length=90)
+    signals[3, 2] = np.nan
+    # interleaved runs
+    runs = np.tile(np.repeat([0, 1, 2], 5), 6)
+    sample_mask = [np.arange(1, 30), np.arange(28), np.arange(2, 29)]
+    kwargs = {
+        "low_pass": 0.1,
+        "standardize_confounds": False,
+        "ensure_finite": True,
+        "extrapolate": False,
+    }
+
+    cleaned = clean(
+        signals,
+        confounds=confounds,
+        runs=runs,
+        sample_mask=sample_mask,
+        n_jobs=n_jobs,
+        **kwargs,
+    )
+
+    expected = np.vstack(
+        [
+            clean(
+                signals[runs == run],
+                confounds=confounds[runs == run],
+                sample_mask=sample_mask[run],
+                **kwargs,
+            )
+            for run in range(3)
+        ]
+    )
+    assert_almost_equal(cleaned, expected)
+
+
 @pytest.fixture
 def signals():
     """Return generic signal."""
@@ -1148,6 +1342,53 @@ def test_high_variance_confounds_nan():
     assert_almost_equal(out1, out2, decimal=13)
 
 
+def test_high_variance_confounds_solvers(rng):
+    """Check the solvers find the same confounds on low rank series."""
+    length = 40
+    n_confounds = 3
+    series = rng.standard_normal((length, n_confounds)) @ rng.standard_normal(
+        (n_confounds, 2000)
+    )
+    series += 0.01 * rng.standard_normal(series.shape)
+
+    full = high_variance_confounds(
+        series, n_confounds=n_confounds, percentile=10.0
+    )
+    randomized = high_variance_confounds(
+        series,
+        n_confounds=n_confounds,
+        percentile=10.0,
+        svd_solver="randomized",
+    )
+    single = high_variance_confounds(
+        series, n_confounds=n_confounds, percentile=10.0, dtype="float32"
+    )
+
+    assert single.dtype == np.float32
+    assert full.shape == randomized.shape == (length, n_confounds)
+    # same confounds, up to their sign
+    assert_almost_equal(np.abs(full.T @ randomized), np.eye(n_confounds))
+    assert_almost_equal(
+        np.abs(full.T @ single), np.eye(n_confounds), decimal=5
+    )
+
+    with pytest.raises(ValueError, match="'svd_solver' must be"):
+        high_variance_confounds(series, svd_solver="arpack")
+
+
+@pytest.mark.parametrize(
+    "series_dtype, expected_dtype",
+    [("int16", np.float32), ("int64", np.float64), ("float32", np.float32)],
+)
+def test_high_variance_confounds_dtype(rng, series_dtype, expected_dtype):
+    """Check the type of the confounds computed from series of any type."""
+    series = (100 * rng.standard_normal((40, 50))).astype(series_dtype)
+
+    confounds = high_variance_confounds(series, percentile=10.0)
+
+    assert confounds.dtype == expected_dtype
+
+
 def test_clean_standardize_false():
     """Check output cleaning butterworth filter and no standardization."""
     n_samples = 500
@@ -1510,6 +1751,32 @@ def test_handle_scrubbed_volumes():
     assert_equal(scrubbed_confounds, confounds[sample_mask, :])
 
 
+@pytest.mark.parametrize("extrapolate", [True, False])
+def test_interpolate_volumes(monkeypatch, rng, extrapolate):
+    """Check censored volumes are interpolated with a cubic spline."""
+    monkeypatch.setattr("nilearn.signal._BLOCK_N_ELEMENTS", 100)
+    _interpolation_weights.cache_clear()
+    signals = rng.standard_normal((40, 13))
+    kept = np.ones(40, dtype=bool)
+    kept[[0, 1, 9, 10, 11, 25, 39]] = False
+    frame_times = np.arange(40) * 2.5
+    expected = signals.copy()
+    expected[~kept] = scipy.interpolate.CubicSpline(
+        frame_times[kept], signals[kept], extrapolate=extrapolate
+    )(frame_times[~kept])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        interpolated = _interpolate_volumes(
+            signals.copy(), np.flatnonzero(kept), 2.5, extrapolate
+        )
+        # the weights of the kept volumes are reused for the same mask
+        _interpolate_volumes(signals.copy(), kept, 2.5, extrapolate)
+
+    assert_almost_equal(interpolated, expected)
+    assert _interpolation_weights.cache_info().hits == 1
+
+
 def test_handle_scrubbed_volumes_with_extrapolation():
     """Check interpolation of signals with extrapolation."""
     signals, _, confounds = generate_signals(